@@ -5,13 +5,18 @@ This submodule contains general utility functions and classes that can be used b
 import os
 
 from .utils import ANOMALIES_PATH  # noqa: F401
+from .utils import ARCHIVE_PATH  # noqa: F401
+from .utils import CACHE_PATH  # noqa: F401
 from .utils import CONFIG_PATH  # noqa: F401
 from .utils import CONFIG_SCHEMA_PATH  # noqa: F401
 from .utils import IGNORED_PATH  # noqa: F401
 from .utils import current_time_millis  # noqa: F401
 from .utils import parse_date  # noqa: F401
+from .utils import parse_dates  # noqa: F401
 from .utils import parse_float  # noqa: F401
+from .utils import parse_floats  # noqa: F401
 from .utils import parse_result  # noqa: F401
+from .utils import parse_results  # noqa: F401
 from .utils import read_json_file  # noqa: F401
 from .utils import validate_json  # noqa: F401
 
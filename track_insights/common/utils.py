@@ -6,6 +6,8 @@ import time
 from datetime import date, datetime
 from typing import Optional
 
+import numpy as np
+import pandas as pd
 import yaml
 from jsonschema import validate
 from jsonschema.exceptions import ValidationError
@@ -17,6 +19,8 @@ CONFIG_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "config" /
 IGNORED_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "config" / "ignored_entries.json"
 
 ANOMALIES_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "anomalies"
+CACHE_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "cache"
+ARCHIVE_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "archive"
 
 DATE_FORMAT = "%d.%m.%Y"
 
@@ -25,6 +29,16 @@ MINUTES_TO_HUNDREDTHS = 100 * 60
 SECONDS_TO_HUNDREDTHS = 100
 INVALID_RESULT_SENTINEL = -1
 
+# see: https://pythex.org/ by removing all escape symbols ('\')
+# matches everything of the form HH:mm:ss.hh (ss < 60) or ss.hh (with ss >= 60)
+RESULT_PATTERNS = (
+    "^(?:(?:(\\d+):)?([0-5]?\\d):)?([0-5]?\\d)(?:\\.(\\d{1,2}))?$",
+    "^(\\d+):([0-5]?\\d)(?:\\.(\\d{1,2}))?$",
+    "^(\\d+)(?:\\.(\\d{1,2}))?$",
+)
+# matches the dates that datetime.strptime accepts for DATE_FORMAT
+DATE_PATTERN = "^(3[01]|[12]\\d|0[1-9]|[1-9]| [1-9])\\.(1[0-2]|0[1-9]|[1-9])\\.(\\d\\d\\d\\d)$"
+
 
 def validate_json(content: dict, schema_path: pathlib.Path) -> tuple[bool, Optional[ValidationError]]:
     """
@@ -79,12 +93,10 @@ def parse_result(serialized_result: str) -> int:
     serialized_result = serialized_result.split("\n")[0].split("_")[0]
     # serialized_result = re.sub("[^(0-9.:)]", "", serialized_result)
 
-    # see: https://pythex.org/ by removing all escape symbols ('\')
-    # matches everything of the form HH:mm:ss.hh (ss < 60) or ss.hh (with ss >= 60)
     match = (
-        re.match("^(?:(?:(\\d+):)?([0-5]?\\d):)?([0-5]?\\d)(?:\\.(\\d{1,2}))?$", serialized_result)
-        or re.match("^(\\d+):([0-5]?\\d)(?:\\.(\\d{1,2}))?$", serialized_result)
-        or re.match("^(\\d+)(?:\\.(\\d{1,2}))?$", serialized_result)
+        re.match(RESULT_PATTERNS[0], serialized_result)
+        or re.match(RESULT_PATTERNS[1], serialized_result)
+        or re.match(RESULT_PATTERNS[2], serialized_result)
     )
 
     if not match:
@@ -114,3 +126,79 @@ def parse_float(serialized_value: str) -> Optional[float]:
         return number
     except ValueError:
         return float("nan")
+
+
+def parse_dates(serialized_dates: pd.Series) -> np.ndarray:
+    """
+    Parses a column of serialized dates (see parse_date).
+
+    :param serialized_dates: the serialized dates.
+    :return: the dates as datetime64[D] array. NaT if not parsable (invalid).
+    """
+
+    # the strings are matched as objects, since the regular expressions of a string dtype may not follow the re module
+    parts = serialized_dates.astype(object).str.extract(DATE_PATTERN).to_numpy(dtype=object, copy=True)
+    matched = ~pd.isna(parts[:, 0])
+    parts[~matched] = "1"
+    values: np.ndarray = parts.astype(np.int64)
+    days, months, years = values[:, 0], values[:, 1], values[:, 2]
+
+    # the days that exceed their month (e.g., 31.02.) overflow into the next month
+    first_days = ((years - 1970) * 12 + months - 1).astype("datetime64[M]")
+    dates = first_days.astype("datetime64[D]") + (days - 1)
+    valid = matched & (dates.astype("datetime64[M]") == first_days) & (years >= date.min.year)
+    dates[~valid] = np.datetime64("NaT")
+    return dates
+
+
+def parse_results(serialized_results: pd.Series) -> np.ndarray:
+    """
+    Parses a column of serialized results (see parse_result).
+
+    :param serialized_results: the serialized times/distances/heights.
+    :return: integer array representing the results. -1 if not parsable (invalid).
+    """
+
+    # the strings are matched as objects, since the regular expressions of a string dtype may not follow the re module
+    serialized_results = serialized_results.astype(object).str.extract("^([^\n_]*)", expand=False)
+
+    # (hours, minutes, seconds, hundredths) of the first matching pattern, the shorter patterns lack the leading ones
+    parts: np.ndarray = np.full((len(serialized_results), 4), None, dtype=object)
+    unmatched: np.ndarray = np.ones(len(serialized_results), dtype=bool)
+    for pattern in RESULT_PATTERNS:
+        if not unmatched.any():
+            break
+        groups = serialized_results[unmatched].str.extract(pattern).to_numpy(dtype=object)
+        matched = ~pd.isna(groups[:, -2])
+        rows = np.flatnonzero(unmatched)[matched]
+        parts[rows, 4 - groups.shape[1] :] = groups[matched]
+        unmatched[rows] = False
+
+    def to_integers(values: np.ndarray) -> np.ndarray:
+        return np.where(pd.isna(values), "0", values).astype(np.int64)
+
+    totals = to_integers(pd.Series(parts[:, 3], dtype=object).str.ljust(2, "0").to_numpy(dtype=object))
+    totals += to_integers(parts[:, 2]) * SECONDS_TO_HUNDREDTHS
+    totals += to_integers(parts[:, 1]) * MINUTES_TO_HUNDREDTHS
+    totals += to_integers(parts[:, 0]) * HOURS_TO_HUNDREDTHS
+    totals[unmatched] = INVALID_RESULT_SENTINEL
+    return totals
+
+
+def parse_floats(serialized_values: pd.Series) -> list[Optional[float]]:
+    """
+    Parses a column of serialized numbers (see parse_float).
+
+    :param serialized_values: the serialized numbers.
+    :return: the numbers. None if empty, NaN if not parsable.
+    """
+
+    values = serialized_values.to_numpy(dtype=object)
+    present = values != ""
+    numbers: np.ndarray = np.full(len(values), None, dtype=object)
+    try:
+        # converting the objects calls float on each value
+        numbers[present] = values[present].astype(np.float64)
+    except ValueError:
+        numbers[present] = [parse_float(value) for value in values[present]]
+    return numbers.tolist()
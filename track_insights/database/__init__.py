@@ -8,6 +8,7 @@ import os
 
 from .database_base import DatabaseBase  # noqa: F401
 from .database_connection import DatabaseConnection  # noqa: F401
+from .engine_registry import EngineRegistry, PoolStatistics  # noqa: F401
 
 files = os.listdir(os.path.dirname(__file__))
 files.remove("__init__.py")
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import logging
 
-from sqlalchemy import URL, create_engine
+from sqlalchemy import URL, inspect, text
 from sqlalchemy.orm import Session, sessionmaker
 from track_insights.database import DatabaseBase
+from track_insights.database.engine_registry import EngineRegistry
 
 logger = logging.getLogger(__name__)
 
@@ -27,10 +28,11 @@ class DatabaseConnection:
         self.host: str = self.config["database"]["host"]
         self.port: int = self.config["database"]["port"]
         self.database: str = self.config["database"]["database"]
+        self.pool_config: dict = self.config["database"].get("pool", {})
 
     def __enter__(self) -> DatabaseConnection:
         """
-        Create the engine and session.
+        Create the session on the shared engine.
 
         :return: the database connection.
         """
@@ -39,7 +41,7 @@ class DatabaseConnection:
 
     def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: Exception) -> None:
         """
-        Close the session and dispose the engine.
+        Close the session, which returns its connection to the pool of the shared engine.
 
         :param exc_type: exception type.
         :param exc_val: exception value.
@@ -58,6 +60,29 @@ class DatabaseConnection:
         schema constructs (such as Column objects, ForeignKey objects, and so on).
         """
         DatabaseBase.metadata.create_all(self.engine)
+        self.upgrade_tables()
+
+    def upgrade_tables(self) -> None:
+        """
+        Upgrade the tables of an existing database to the current models.
+
+        Since create_all only creates missing tables, the columns that were added to a model afterwards are added to
+        the existing table. Added columns must be nullable, such that existing rows remain valid. Finally, the missing
+        indices of all tables are created.
+        """
+        inspector = inspect(self.engine)
+        with self.engine.begin() as connection:
+            for table in DatabaseBase.metadata.sorted_tables:
+                existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+                for column in table.columns:
+                    if column.name in existing_columns:
+                        continue
+                    assert column.nullable, f"Cannot add the non-nullable column {table.name}.{column.name}."
+                    column_type = column.type.compile(dialect=self.engine.dialect)
+                    logger.info(f"Adding column {column.name} to table {table.name}.")
+                    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"))
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
 
     def setup_connection(self) -> None:
         self.url = URL.create(
@@ -68,9 +93,8 @@ class DatabaseConnection:
             port=self.port,
             database=self.database,
         )
-        self.engine = create_engine(self.url)
+        self.engine = EngineRegistry.get_engine(self.url, self.pool_config)
         self.session: Session = sessionmaker(bind=self.engine)()
 
     def terminate_connection(self) -> None:
         self.session.close()
-        self.engine.dispose()
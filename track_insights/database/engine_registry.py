@@ -0,0 +1,141 @@
+"""Process-wide registry of database engines."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from sqlalchemy import URL, Engine, create_engine, event
+
+logger = logging.getLogger(__name__)
+
+# maps the keys of the pool configuration to the arguments of create_engine
+POOL_ARGUMENTS = {
+    "size": "pool_size",
+    "max_overflow": "max_overflow",
+    "timeout": "pool_timeout",
+    "recycle": "pool_recycle",
+    "pre_ping": "pool_pre_ping",
+}
+
+
+@dataclass
+class PoolStatistics:
+    """
+    Counters of the connections of an engine's pool.
+    """
+
+    connects: int = 0  # newly opened database connections
+    checkouts: int = 0  # connections handed out by the pool
+    invalidations: int = 0  # connections discarded, e.g., after a failed pre-ping
+
+    def add(self, other: PoolStatistics) -> None:
+        self.connects += other.connects
+        self.checkouts += other.checkouts
+        self.invalidations += other.invalidations
+
+    def __str__(self) -> str:
+        reuse_rate = 100 * (self.checkouts - self.connects) / self.checkouts if self.checkouts > 0 else 0
+        return (
+            f"{self.connects} connects, {self.checkouts} checkouts ({reuse_rate:.1f}% reused), "
+            f"{self.invalidations} invalidations"
+        )
+
+
+class EngineRegistry:
+    """
+    Engines shared by all database connections of a process. There is one engine per URL, such that the pooled
+    connections are reused by subsequent database connections instead of connecting and authenticating every time.
+    A forked process starts with an empty registry, since the connections of the parent must not be shared.
+    """
+
+    _engines: ClassVar[dict[str, Engine]] = {}
+    _statistics: ClassVar[dict[str, PoolStatistics]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_engine(cls, url: URL, pool_config: dict[str, Any]) -> Engine:
+        """
+        Get the engine of a URL, which is created on first use.
+
+        :param url: the URL of the database.
+        :param pool_config: the pool configuration (size, max_overflow, timeout, recycle and pre_ping), omitted keys
+        keep the defaults of SQLAlchemy. Only the configuration of the first use of a URL is applied.
+        :return: the shared engine.
+        """
+
+        key = url.render_as_string(hide_password=False)
+        with cls._lock:
+            engine = cls._engines.get(key)
+            if engine is None:
+                arguments = {POOL_ARGUMENTS[name]: value for name, value in pool_config.items()}
+                engine = create_engine(url, **arguments)
+                cls._register_listeners(engine, cls._statistics.setdefault(key, PoolStatistics()))
+                cls._engines[key] = engine
+            return engine
+
+    @classmethod
+    def get_statistics(cls) -> PoolStatistics:
+        """
+        Get the pool counters of all engines of the process.
+
+        :return: the aggregated counters.
+        """
+
+        with cls._lock:
+            total_statistics = PoolStatistics()
+            for statistics in cls._statistics.values():
+                total_statistics.add(statistics)
+            return total_statistics
+
+    @classmethod
+    def get_status(cls) -> list[str]:
+        """
+        Get the status of the pools of all engines, e.g., the checked out connections and the overflow.
+
+        :return: one status per engine.
+        """
+
+        with cls._lock:
+            return [f"{engine.url}: {engine.pool.status()}" for engine in cls._engines.values()]
+
+    @classmethod
+    def dispose(cls) -> None:
+        """
+        Close the pooled connections of all engines and empty the registry. The counters are kept.
+        """
+
+        with cls._lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines.clear()
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # the connections belong to the parent process, they are dropped without closing them
+        cls._lock = threading.Lock()
+        for engine in cls._engines.values():
+            engine.dispose(close=False)
+        cls._engines.clear()
+        cls._statistics.clear()
+
+    @staticmethod
+    def _register_listeners(engine: Engine, statistics: PoolStatistics) -> None:
+        def on_connect(*_: Any) -> None:
+            statistics.connects += 1
+
+        def on_checkout(*_: Any) -> None:
+            statistics.checkouts += 1
+
+        def on_invalidate(*_: Any) -> None:
+            statistics.invalidations += 1
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "invalidate", on_invalidate)
+
+
+os.register_at_fork(after_in_child=EngineRegistry._reset_after_fork)  # pylint: disable=protected-access
@@ -8,11 +8,14 @@ This allows the system to be used with different databases.
 import os
 
 from .athlete import Athlete  # noqa: F401
+from .bestlist_digest import BestlistDigest  # noqa: F401
 from .club import Club  # noqa: F401
 from .discipline import Discipline, DisciplineConfiguration  # noqa: F401
 from .event import Event  # noqa: F401
 from .log import Log  # noqa: F401
+from .metadata_entry import MetadataEntry  # noqa: F401
 from .result import Result  # noqa: F401
+from .sync_run import SyncRun, SyncUnit  # noqa: F401
 
 files = os.listdir(os.path.dirname(__file__))
 files.remove("__init__.py")
@@ -0,0 +1,31 @@
+# pylint: disable=unsubscriptable-object
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import CHAR, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+from track_insights.database.database_base import DatabaseBase
+from track_insights.database.models.discipline import Discipline
+
+
+class BestlistDigest(DatabaseBase):
+    """Digest of the last successfully synchronized bestlist page."""
+
+    __tablename__ = "bestlist_digests"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    discipline_id: Mapped[int] = mapped_column(ForeignKey(Discipline.id))
+    category: Mapped[str] = mapped_column(String(length=50))
+    year: Mapped[Optional[int]]  # None represents the bestlist of all years
+    homologated: Mapped[bool]
+    digest: Mapped[str] = mapped_column(CHAR(length=64))
+    sync_date: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now()  # pylint: disable=not-callable
+    )
+    __table_args__ = (
+        UniqueConstraint("discipline_id", "category", "year", "homologated"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<BestlistDigest {self.id}>"
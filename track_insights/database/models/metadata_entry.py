@@ -0,0 +1,21 @@
+# pylint: disable=unsubscriptable-object
+from datetime import datetime
+
+from sqlalchemy import String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from track_insights.database.database_base import DatabaseBase
+
+
+class MetadataEntry(DatabaseBase):
+    """Cached metadata of the bestlist (e.g., the available years or disciplines)."""
+
+    __tablename__ = "metadata_entries"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(String(length=100), unique=True)
+    value: Mapped[str] = mapped_column(Text)  # serialized as json
+    fetch_date: Mapped[datetime]
+    __table_args__ = {"extend_existing": True}
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<MetadataEntry {self.key}>"
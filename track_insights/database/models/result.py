@@ -2,7 +2,7 @@
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import ForeignKey, Index, Numeric, SmallInteger, String, func
+from sqlalchemy import BigInteger, ForeignKey, Index, Numeric, SmallInteger, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from track_insights.database.database_base import DatabaseBase
 from track_insights.database.models.athlete import Athlete
@@ -30,6 +30,7 @@ class Result(DatabaseBase):
     manual: Mapped[bool] = mapped_column(default=False)  # result is captured manually
     insert_date: Mapped[datetime] = mapped_column(server_default=func.now())  # pylint: disable=not-callable
     points: Mapped[int] = mapped_column(SmallInteger, default=0)
+    fingerprint: Mapped[Optional[int]] = mapped_column(BigInteger)  # of the bestlist record last matching the result
     athlete: Mapped["Athlete"] = relationship(back_populates="results", lazy="select")
     club: Mapped["Club"] = relationship(back_populates="results", lazy="select")
     event: Mapped["Event"] = relationship(back_populates="results", lazy="select")
@@ -38,6 +39,9 @@ class Result(DatabaseBase):
         Index("ix_date", "date"),
         Index("ix_insert_date", "insert_date"),
         Index("ix_points", "points"),
+        Index("ix_fingerprint", "discipline_id", "fingerprint"),
+        Index("ix_discipline_performance", "discipline_id", "performance"),
+        Index("ix_discipline_date", "discipline_id", "date"),
         {"extend_existing": True},
     )
 
@@ -0,0 +1,53 @@
+# pylint: disable=unsubscriptable-object
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from track_insights.database.database_base import DatabaseBase
+from track_insights.database.models.discipline import Discipline
+
+
+class SyncRun(DatabaseBase):
+    """Journal of a result fetcher run."""
+
+    __tablename__ = "sync_runs"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    arguments: Mapped[str] = mapped_column(String(length=200))  # serialized filters of the run
+    start_date: Mapped[datetime] = mapped_column(server_default=func.now())  # pylint: disable=not-callable
+    end_date: Mapped[Optional[datetime]] = mapped_column(default=None)  # None while the run is incomplete
+    units: Mapped[list["SyncUnit"]] = relationship(back_populates="run", lazy="select")
+    __table_args__ = {"extend_existing": True}
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<SyncRun {self.id}>"
+
+
+class SyncUnit(DatabaseBase):
+    """Bestlist page that was completely synchronized during a run."""
+
+    __tablename__ = "sync_units"
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(ForeignKey(SyncRun.id))
+    discipline_id: Mapped[int] = mapped_column(ForeignKey(Discipline.id))
+    category: Mapped[str] = mapped_column(String(length=50))
+    year: Mapped[Optional[int]]  # None represents the bestlist of all years
+    homologated: Mapped[bool]
+    full: Mapped[bool]  # whether the bestlist reached the maximum amount of records
+    added_records: Mapped[int] = mapped_column(default=0)
+    added_athletes: Mapped[int] = mapped_column(default=0)
+    added_clubs: Mapped[int] = mapped_column(default=0)
+    added_events: Mapped[int] = mapped_column(default=0)
+    updates: Mapped[int] = mapped_column(default=0)
+    deletions: Mapped[int] = mapped_column(default=0)
+    completion_date: Mapped[datetime] = mapped_column(server_default=func.now())  # pylint: disable=not-callable
+    run: Mapped[SyncRun] = relationship(back_populates="units", lazy="select")
+    __table_args__ = (
+        UniqueConstraint("run_id", "discipline_id", "category", "year", "homologated"),
+        {"extend_existing": True},
+    )
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<SyncUnit {self.id}>"
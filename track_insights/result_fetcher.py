@@ -1,15 +1,28 @@
 import argparse
+import functools
 import logging
+import multiprocessing.util
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Generator, Optional
 
 import yaml
+from sqlalchemy.exc import IntegrityError
 from tqdm import tqdm
 from track_insights.common import CONFIG_PATH, CONFIG_SCHEMA_PATH, IGNORED_PATH, validate_json
-from track_insights.database import DatabaseConnection
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Discipline
+from track_insights.scraping import DriverPools, FetchPolicy, HttpClient, PageArchive
 from track_insights.synchronization import (
+    ArchiveReplayer,
     DisciplineSynchronizer,
+    EntityCache,
+    MetadataCatalogue,
     MetadataSynchronizer,
     SynchronizationError,
     SynchronizationStatistics,
+    SyncJournal,
 )
 from track_insights.synchronization.synchronization_error import SynchronizationErrorType
 
@@ -21,9 +34,10 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 MAX_UNKNOWN_ERRORS = 5
+MAX_CONFLICTS = 3
 
 
-# pylint: disable=too-many-locals,too-many-statements
+# pylint: disable=too-many-locals,too-many-statements,too-many-branches
 def main() -> None:
     """
     Main function to start the TrackInsights application with optional filters.
@@ -38,6 +52,10 @@ def main() -> None:
     parser.add_argument("--male", action="store_true", help="Filter results to male athletes.")
     parser.add_argument("--female", action="store_true", help="Filter results to female athletes.")
     parser.add_argument("--log_deletions", action="store_true", help="Log deleted records.")
+    parser.add_argument("--resume", action="store_true", help="Resume the latest incomplete run with equal filters.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes synchronizing disciplines.")
+    parser.add_argument("--refresh_metadata", action="store_true", help="Request the cached metadata again.")
+    parser.add_argument("--replay", action="store_true", help="Synchronize from the page archive without requests.")
 
     args = parser.parse_args()
 
@@ -70,37 +88,85 @@ def main() -> None:
     logger.info(f"Place: {('Indoor' if indoor else 'Outdoor') if indoor is not None else 'Indoor & Outdoor'}")
     logger.info(f"Gender: {('Male' if male else 'Female') if male is not None else 'Any'}")
 
-    metadata_manager = MetadataSynchronizer(config)
-    metadata_manager.check_disciplines()
+    archive = PageArchive.from_config(config)
+    catalogue = MetadataCatalogue.from_config(config, refresh=args.refresh_metadata)
+    if args.replay:
+        if archive is None:
+            logger.error("Replaying requires a page archive (scraping.archive in the configuration).")
+            return
+        replayer = ArchiveReplayer(config, archive, ignored_entries)
+        disciplines = replayer.get_disciplines(discipline, year, indoor, male)
+    else:
+        metadata_manager = MetadataSynchronizer(config, catalogue)
+        metadata_manager.check_disciplines()
 
-    disciplines = metadata_manager.get_all_disciplines(discipline, year, indoor, male)
+        disciplines = metadata_manager.get_all_disciplines(discipline, year, indoor, male)
 
     if len(disciplines) > 0:
         logger.info(f"Found {len(disciplines)} discipline(s) to fetch.")
+        start_time = time.perf_counter()
+        num_workers = args.workers
+        journal: Optional[SyncJournal] = None
+        if args.replay:
+            # the workers only parse the pages, hence the database is written by a single process
+            logger.info(f"Replaying {len(replayer.pages)} archived page(s) with {num_workers} parsing process(es).")
+            outcomes = replayer.replay(disciplines, year, num_workers)
+        else:
+            journal = SyncJournal.start(
+                config, {"discipline": discipline, "year": year, "indoor": indoor, "male": male}, resume=args.resume
+            )
+            # the workers read the available years from the catalogue, hence they are requested once upfront
+            catalogue.get_available_years()
+            if num_workers > 1 and config["database"]["drivername"].startswith("sqlite"):
+                logger.warning("SQLite does not support concurrent writers. Synchronizing disciplines serially.")
+                num_workers = 1
+            if num_workers > 1:
+                logger.info(f"Synchronizing disciplines with {num_workers} worker processes.")
+                outcomes = synchronize_in_processes(config, ignored_entries, disciplines, year, journal, num_workers)
+            else:
+                outcomes = synchronize_serially(config, ignored_entries, disciplines, year, journal, catalogue, archive)
+
         statistics = SynchronizationStatistics()
         num_errors = 0
-        with tqdm(disciplines, desc="Disciplines", unit="discipline") as manager:
-            for discipline in manager:
-                try:
-                    with DisciplineSynchronizer(config, ignored_entries, discipline) as scraper:
-                        statistics.add(scraper.scrape_discipline(start_year=year, end_year=year))
-                except SynchronizationError as err:
-                    logger.warning(err.message)
-                    if err.error_type == SynchronizationErrorType.UNKNOWN:
-                        if num_errors > MAX_UNKNOWN_ERRORS:
-                            logger.error("Too many unknown errors. Stopping the fetcher.")
+        completed = True
+        try:
+            with tqdm(outcomes, total=len(disciplines), desc="Disciplines", unit="discipline") as manager:
+                for outcome in manager:
+                    try:
+                        statistics.add(outcome())
+                    except SynchronizationError as err:
+                        completed = False
+                        logger.warning(err.message)
+                        if err.error_type == SynchronizationErrorType.UNKNOWN:
+                            if num_errors > MAX_UNKNOWN_ERRORS:
+                                logger.error("Too many unknown errors. Stopping the fetcher.")
+                                break
+                            num_errors += 1
+                        else:
+                            logger.error("Connection does not recover. Stopping the fetcher.")
                             break
-                        num_errors += 1
-                    else:
-                        logger.error("Connection error. Stopping the fetcher.")
-                        break
+        finally:
+            # the remaining disciplines are not synchronized anymore
+            outcomes.close()
+        if journal is not None:
+            if completed:
+                journal.finish()
+            else:
+                logger.info(f"Run {journal.run_id} is incomplete. Continue it with --resume.")
+        elapsed_time = time.perf_counter() - start_time
         logger.info("Fetcher Summary:")
+        logger.info(f"Elapsed Time: {elapsed_time:.1f}s ({statistics.added_records / elapsed_time:.1f} records/s)")
         logger.info(f"Inserted Records: {statistics.added_records}")
         logger.info(f"Inserted Athletes: {statistics.added_athletes}")
         logger.info(f"Inserted Clubs: {statistics.added_clubs}")
         logger.info(f"Inserted Events: {statistics.added_events}")
         logger.info(f"Updates: {statistics.updates}")
         logger.info(f"Deletions: {len(statistics.deletions)}")
+        logger.info(f"HTTP Traffic{' (main process)' if num_workers > 1 else ''}: {HttpClient.get_total_statistics()}")
+        entity_cache = EntityCache.from_config(config)
+        if entity_cache is not None:
+            logger.info(f"Entity Cache{' (main process)' if num_workers > 1 else ''}: {entity_cache}")
+        logger.info(f"Database Pool{' (main process)' if num_workers > 1 else ''}: {EngineRegistry.get_statistics()}")
 
         if args.log_deletions and len(statistics.deletions) > 0:
             logger.info("The following records were deleted:")
@@ -110,6 +176,225 @@ def main() -> None:
         logger.info("No disciplines to fetch.")
 
 
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def synchronize_discipline(
+    config: dict,
+    ignored_entries: set[str],
+    discipline: Discipline,
+    year: Optional[int],
+    driver_pools: DriverPools,
+    fetch_policy: FetchPolicy,
+    journal: SyncJournal,
+    catalogue: MetadataCatalogue,
+    archive: Optional[PageArchive] = None,
+) -> SynchronizationStatistics:
+    """
+    Synchronize a discipline. If the connection is lost, the run is paused until the circuit breaker closes and the
+    discipline is resumed afterwards. Only if the breaker is exhausted, the error is propagated.
+
+    :param config: the system configuration.
+    :param ignored_entries: the set of ignored records.
+    :param discipline: the discipline to synchronize.
+    :param year: (Optional) the year to synchronize, otherwise all years are synchronized.
+    :param driver_pools: the driver pools shared between disciplines.
+    :param fetch_policy: the fetch policy shared between disciplines.
+    :param journal: the journal of the run.
+    :param catalogue: the metadata catalogue shared between disciplines.
+    :param archive: (Optional) the page archive shared between disciplines.
+    :return: the synchronization statistics.
+    """
+
+    while True:
+        try:
+            with DisciplineSynchronizer(
+                config,
+                ignored_entries,
+                discipline,
+                driver_pools=driver_pools,
+                fetch_policy=fetch_policy,
+                journal=journal,
+                catalogue=catalogue,
+                archive=archive,
+            ) as scraper:
+                return scraper.scrape_discipline(start_year=year, end_year=year)
+        except SynchronizationError as err:
+            circuit_breaker = fetch_policy.circuit_breaker
+            if err.error_type != SynchronizationErrorType.CONNECTION_LOST or circuit_breaker.exhausted:
+                raise
+            logger.warning(f"{err.message} Pausing the fetcher.")
+            if not circuit_breaker.is_open:
+                circuit_breaker.trip()
+            circuit_breaker.wait()
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def synchronize_serially(
+    config: dict,
+    ignored_entries: set[str],
+    disciplines: list[Discipline],
+    year: Optional[int],
+    journal: SyncJournal,
+    catalogue: MetadataCatalogue,
+    archive: Optional[PageArchive] = None,
+) -> Generator[Callable[[], SynchronizationStatistics], None, None]:
+    """
+    Synchronize the disciplines one after another in this process.
+
+    :param config: the system configuration.
+    :param ignored_entries: the set of ignored records.
+    :param disciplines: the disciplines to synchronize.
+    :param year: (Optional) the year to synchronize, otherwise all years are synchronized.
+    :param journal: the journal of the run.
+    :param catalogue: the metadata catalogue.
+    :param archive: (Optional) the page archive.
+    :return: generator of outcomes, calling an outcome synchronizes the next discipline.
+    """
+
+    fetch_policy = FetchPolicy.from_config(config)
+    with DisciplineSynchronizer.create_driver_pools(config) as driver_pools:
+        driver_pools.default.warm_up()
+        for discipline in disciplines:
+            yield functools.partial(
+                synchronize_discipline,
+                config,
+                ignored_entries,
+                discipline,
+                year,
+                driver_pools,
+                fetch_policy,
+                journal,
+                catalogue,
+                archive,
+            )
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def synchronize_in_processes(
+    config: dict,
+    ignored_entries: set[str],
+    disciplines: list[Discipline],
+    year: Optional[int],
+    journal: SyncJournal,
+    num_workers: int,
+) -> Generator[Callable[[], SynchronizationStatistics], None, None]:
+    """
+    Synchronize the disciplines in a pool of worker processes. Every worker uses its own drivers, database engine
+    and an equal share of the request rate.
+
+    :param config: the system configuration.
+    :param ignored_entries: the set of ignored records.
+    :param disciplines: the disciplines to synchronize.
+    :param year: (Optional) the year to synchronize, otherwise all years are synchronized.
+    :param journal: the journal of the run.
+    :param num_workers: the number of worker processes.
+    :return: generator of outcomes in the order the disciplines complete, calling an outcome returns its statistics.
+    """
+
+    executor = ProcessPoolExecutor(
+        max_workers=num_workers,
+        initializer=init_worker,
+        initargs=(config, ignored_entries, year, journal, num_workers),
+    )
+    try:
+        futures = [executor.submit(synchronize_in_worker, discipline) for discipline in disciplines]
+        for future in as_completed(futures):
+            yield future.result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+@dataclass
+class WorkerContext:
+    """
+    State of a worker process that is shared by all disciplines it synchronizes.
+    """
+
+    config: dict
+    ignored_entries: set[str]
+    year: Optional[int]
+    driver_pools: DriverPools
+    fetch_policy: FetchPolicy
+    journal: SyncJournal
+    catalogue: MetadataCatalogue
+    archive: Optional[PageArchive]
+
+
+worker_context: Optional[WorkerContext] = None  # pylint: disable=invalid-name
+
+
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+def init_worker(
+    config: dict, ignored_entries: set[str], year: Optional[int], journal: SyncJournal, num_workers: int
+) -> None:
+    """
+    Initialize a worker process. The drivers are closed when the worker process exits.
+
+    :param config: the system configuration.
+    :param ignored_entries: the set of ignored records.
+    :param year: (Optional) the year to synchronize.
+    :param journal: the journal of the run.
+    :param num_workers: the number of worker processes.
+    """
+
+    global worker_context  # pylint: disable=global-statement
+
+    driver_pools = DisciplineSynchronizer.create_driver_pools(config)
+    multiprocessing.util.Finalize(driver_pools, driver_pools.close, exitpriority=10)
+    multiprocessing.util.Finalize(
+        None, lambda: logger.info(f"HTTP Traffic (worker): {HttpClient.get_total_statistics()}"), exitpriority=5
+    )
+    multiprocessing.util.Finalize(
+        None, lambda: logger.info(f"Database Pool (worker): {EngineRegistry.get_statistics()}"), exitpriority=5
+    )
+    multiprocessing.util.Finalize(None, EngineRegistry.dispose, exitpriority=1)
+    entity_cache = EntityCache.from_config(config)
+    if entity_cache is not None:
+        multiprocessing.util.Finalize(
+            None, lambda: logger.info(f"Entity Cache (worker): {entity_cache}"), exitpriority=5
+        )
+    worker_context = WorkerContext(
+        config=config,
+        ignored_entries=ignored_entries,
+        year=year,
+        driver_pools=driver_pools,
+        fetch_policy=FetchPolicy.from_config(config, num_workers),
+        journal=journal,
+        catalogue=MetadataCatalogue.from_config(config),
+        archive=PageArchive.from_config(config),
+    )
+
+
+def synchronize_in_worker(discipline: Discipline) -> SynchronizationStatistics:
+    """
+    Synchronize a discipline in a worker process.
+
+    :param discipline: the discipline to synchronize.
+    :return: the synchronization statistics.
+    """
+
+    assert worker_context is not None, "Worker is not initialized."
+    conflicts = 0
+    while True:
+        try:
+            return synchronize_discipline(
+                worker_context.config,
+                worker_context.ignored_entries,
+                discipline,
+                worker_context.year,
+                worker_context.driver_pools,
+                worker_context.fetch_policy,
+                worker_context.journal,
+                worker_context.catalogue,
+                worker_context.archive,
+            )
+        except SynchronizationError as err:
+            # another worker inserted the same athlete, club or event concurrently, the journal skips completed units
+            if not isinstance(err.__cause__, IntegrityError) or conflicts >= MAX_CONFLICTS:
+                raise
+            logger.info(f"Concurrent insertion while synchronizing {discipline.config.name}. Retrying.")
+            conflicts += 1
+
+
 def check_configuration(config: dict) -> bool:
     valid_yaml, exception = validate_json(config, CONFIG_SCHEMA_PATH)
 
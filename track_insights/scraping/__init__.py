@@ -6,9 +6,16 @@ import os
 
 from .bestlist_category import BestlistCategory  # noqa: F401
 from .bestlist_column import BestlistColumn  # noqa: F401
+from .bestlist_fetcher import BestlistFetcher  # noqa: F401
+from .fetch_policy import CircuitBreaker, FetchPolicy, RateLimiter  # noqa: F401
+from .http_client import HttpClient, HttpStatistics  # noqa: F401
+from .jsf_session import JsfSession  # noqa: F401
+from .page_archive import ArchivedPage, PageArchive  # noqa: F401
+from .response_cache import ResponseCache  # noqa: F401
 from .scrape_config import ScrapeConfig  # noqa: F401
 from .scraper import BASE_URL  # noqa: F401
 from .scraper import Scraper  # noqa: F401
+from .webdriver_pool import DriverPools, WebDriverPool  # noqa: F401
 
 files = os.listdir(os.path.dirname(__file__))
 files.remove("__init__.py")
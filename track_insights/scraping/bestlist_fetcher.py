@@ -0,0 +1,143 @@
+import asyncio
+import queue
+import threading
+from typing import AsyncIterator, Callable, Iterator, Optional, Union
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from seleniumrequests import Chrome
+from track_insights.scraping.fetch_policy import FetchPolicy
+from track_insights.scraping.http_client import HttpClient
+from track_insights.scraping.page_archive import PageArchive
+from track_insights.scraping.response_cache import ResponseCache
+from track_insights.scraping.scrape_config import ScrapeConfig
+from track_insights.scraping.scraper import BASE_URL, Scraper
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+FetchResult = tuple[ScrapeConfig, Optional[pd.DataFrame]]
+
+
+class BestlistFetcher:
+    """
+    Fetches a batch of bestlist pages concurrently. The blocking requests are executed in worker threads, while an
+    asyncio event loop bounds the number of requests that are in flight per host.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        cache: Optional[ResponseCache] = None,
+        fetch_policy: Optional[FetchPolicy] = None,
+        archive: Optional[PageArchive] = None,
+    ) -> None:
+        """
+        Initialize the fetcher.
+
+        :param session: the HTTP session used to send the requests (must be safe to share between threads).
+        :param max_in_flight: the maximum number of concurrent requests per host.
+        :param cache: (Optional) the cache consulted before a page is requested.
+        :param fetch_policy: (Optional) the policy applied to every request.
+        :param archive: (Optional) the archive every requested page is appended to.
+        """
+
+        assert max_in_flight > 0, "At least one request must be allowed in flight."
+
+        self.session = session
+        self.max_in_flight = max_in_flight
+        self.cache = cache
+        self.fetch_policy = fetch_policy
+        self.archive = archive
+
+    @classmethod
+    def from_driver(
+        cls,
+        driver: Chrome,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        cache: Optional[ResponseCache] = None,
+        fetch_policy: Optional[FetchPolicy] = None,
+        archive: Optional[PageArchive] = None,
+    ) -> "BestlistFetcher":
+        """
+        Create a fetcher whose session shares the cookies (and hence the server-side state) of the driver.
+
+        :param driver: the driver from which the cookies are copied.
+        :param max_in_flight: the maximum number of concurrent requests per host.
+        :param cache: (Optional) the cache consulted before a page is requested.
+        :param fetch_policy: (Optional) the policy applied to every request.
+        :param archive: (Optional) the archive every requested page is appended to.
+        :return: the fetcher.
+        """
+
+        return cls(HttpClient.from_driver(driver, max_in_flight), max_in_flight, cache, fetch_policy, archive)
+
+    async def fetch_as_completed(self, scrape_configs: list[ScrapeConfig]) -> AsyncIterator[FetchResult]:
+        """
+        Fetch and parse the bestlists of all configurations and yield them in the order they complete.
+
+        :param scrape_configs: the scrape configurations to fetch.
+        :return: asynchronous iterator over (scrape config, bestlist)-pairs.
+        """
+
+        semaphores: dict[str, asyncio.Semaphore] = {}
+
+        async def fetch(scrape_config: ScrapeConfig) -> FetchResult:
+            semaphore = semaphores.setdefault(urlparse(BASE_URL).netloc, asyncio.Semaphore(self.max_in_flight))
+            async with semaphore:
+                bestlist = await asyncio.to_thread(
+                    Scraper(scrape_config, self.session, self.cache, self.fetch_policy, self.archive).extract_data
+                )
+            return scrape_config, bestlist
+
+        tasks = [asyncio.ensure_future(fetch(scrape_config)) for scrape_config in scrape_configs]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def iter_completed(self, scrape_configs: list[ScrapeConfig]) -> Iterator[FetchResult]:
+        """
+        Synchronous counterpart of fetch_as_completed. The event loop runs in a background thread such that the caller
+        can process a bestlist while the remaining ones are still being fetched.
+
+        :param scrape_configs: the scrape configurations to fetch.
+        :return: iterator over (scrape config, bestlist)-pairs in the order they complete.
+        """
+
+        completed: queue.Queue[Union[FetchResult, BaseException]] = queue.Queue()
+        stopped = threading.Event()
+
+        async def drain(put: Callable[[Union[FetchResult, BaseException]], None]) -> None:
+            try:
+                async for fetch_result in self.fetch_as_completed(scrape_configs):
+                    if stopped.is_set():
+                        return
+                    put(fetch_result)
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                put(err)
+
+        thread = threading.Thread(target=lambda: asyncio.run(drain(completed.put)), daemon=True)
+        thread.start()
+        try:
+            for _ in scrape_configs:
+                item = completed.get()
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stopped.set()
+
+    def fetch_all(self, scrape_configs: list[ScrapeConfig]) -> list[FetchResult]:
+        """
+        Fetch and parse the bestlists of all configurations.
+
+        :param scrape_configs: the scrape configurations to fetch.
+        :return: (scrape config, bestlist)-pairs in the order of the provided configurations.
+        """
+
+        bestlists = {id(scrape_config): bestlist for scrape_config, bestlist in self.iter_completed(scrape_configs)}
+        return [(scrape_config, bestlists[id(scrape_config)]) for scrape_config in scrape_configs]
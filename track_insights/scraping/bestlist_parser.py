@@ -0,0 +1,111 @@
+from html.parser import HTMLParser
+from typing import Optional
+
+TOOLTIP_CLASS = "ui-tooltip ui-widget ui-tooltip-right"
+CHUNK_SIZE = 1 << 16
+
+
+class BestlistParser(HTMLParser):
+    """
+    Streaming parser for the bestlist table. Instead of building a DOM of the whole page, the parser consumes the html
+    token by token and only keeps the cell texts of the first table together with the onclick handler of the first
+    element in each cell (which holds the link to the athlete, club or event). Tooltips are skipped.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+
+        self.header: list[str] = []
+        self.rows: list[list[str]] = []
+        self.links: list[list[Optional[str]]] = []
+
+        self._table_depth = 0
+        self._table_done = False
+        self._tooltip_depth = 0
+        self._row_cells: Optional[list[str]] = None
+        self._row_links: list[Optional[str]] = []
+        self._cell_text: Optional[list[str]] = None
+        self._cell_link: Optional[str] = None
+        self._cell_has_child = False
+
+    @classmethod
+    def parse(cls, html: str) -> "BestlistParser":
+        """
+        Parse the html of a bestlist page. Parsing stops as soon as the bestlist table is closed.
+
+        :param html: the html of the bestlist page.
+        :return: the parser holding the header and rows of the table.
+        """
+
+        parser = cls()
+        for start in range(0, len(html), CHUNK_SIZE):
+            parser.feed(html[start : start + CHUNK_SIZE])
+            if parser.done:
+                break
+        parser.close()
+        return parser
+
+    @property
+    def done(self) -> bool:
+        """
+        Whether the bestlist table is completely parsed.
+        """
+
+        return self._table_done
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if self._table_done:
+            return
+        if tag == "table":
+            self._table_depth += 1
+            return
+        if self._table_depth == 0:
+            return
+
+        if self._tooltip_depth > 0:
+            if tag == "div":
+                self._tooltip_depth += 1
+            return
+        if tag == "div" and dict(attrs).get("class") == TOOLTIP_CLASS:
+            self._tooltip_depth = 1
+            return
+
+        if tag == "tr":
+            self._row_cells = []
+            self._row_links = []
+        elif tag in {"th", "td"}:
+            self._cell_text = []
+            self._cell_link = None
+            self._cell_has_child = False
+        elif self._cell_text is not None and not self._cell_has_child:
+            self._cell_has_child = True
+            self._cell_link = dict(attrs).get("onclick")
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._table_done or self._table_depth == 0:
+            return
+        if tag == "table":
+            self._table_depth -= 1
+            self._table_done = self._table_depth == 0
+            return
+
+        if self._tooltip_depth > 0:
+            if tag == "div":
+                self._tooltip_depth -= 1
+            return
+
+        if tag in {"th", "td"} and self._cell_text is not None and self._row_cells is not None:
+            self._row_cells.append("".join(self._cell_text).strip())
+            self._row_links.append(self._cell_link)
+            self._cell_text = None
+        elif tag == "tr" and self._row_cells is not None:
+            if len(self.header) == 0:
+                self.header = self._row_cells
+            else:
+                self.rows.append(self._row_cells)
+                self.links.append(self._row_links)
+            self._row_cells = None
+
+    def handle_data(self, data: str) -> None:
+        if self._cell_text is not None and self._tooltip_depth == 0 and not self._table_done:
+            self._cell_text.append(data)
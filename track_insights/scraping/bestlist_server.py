@@ -0,0 +1,169 @@
+import gzip
+import logging
+import threading
+import uuid
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+
+logger = logging.getLogger(__name__)
+
+BESTLIST_PATH = "/satweb/faces/bestlist.xhtml"
+SESSION_COOKIE = "JSESSIONID"
+
+PARTIAL_RESPONSE = (
+    "<?xml version='1.0' encoding='UTF-8'?>\n"
+    '<partial-response id="j_id1"><changes>'
+    '<update id="form_anonym:bestlistSearches"><![CDATA[<div></div>]]></update>'
+    '<update id="j_id1:javax.faces.ViewState:0"><![CDATA[{view_state}]]></update>'
+    "</changes></partial-response>"
+)
+
+
+class BestlistRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the requests to the stand-in bestlist. GET-requests return the generated bestlist page, while POST-requests
+    emulate the partial ajax requests of the form. Only the "exclusive categories" checkbox changes the session state.
+    """
+
+    server: "BestlistServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        url = urlparse(self.path)
+        if url.path != BESTLIST_PATH:
+            self._send(404, "text/plain", "Not Found")
+            return
+
+        session_id, new_session = self._get_session()
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            page = self.server.generator.render_page(params, self.server.is_exclusive(session_id))
+        except ValueError as err:
+            self._send(400, "text/plain", str(err))
+            return
+        self._send(200, "text/html;charset=UTF-8", page, session_id if new_session else None)
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        if urlparse(self.path).path != BESTLIST_PATH:
+            self._send(404, "text/plain", "Not Found")
+            return
+
+        session_id, new_session = self._get_session()
+        content_length = int(self.headers.get("Content-Length", 0))
+        data = {key: values[-1] for key, values in parse_qs(self.rfile.read(content_length).decode("utf-8")).items()}
+
+        source = data.get("javax.faces.source", "")
+        if source.endswith(":categoryExclusive"):
+            self.server.set_exclusive(session_id, data.get(f"{source}_input") == "on")
+
+        partial_response = PARTIAL_RESPONSE.format(view_state=uuid.uuid4())
+        self._send(200, "text/xml;charset=UTF-8", partial_response, session_id if new_session else None)
+
+    def log_message(self, format: str, *args: object) -> None:  # pylint: disable=redefined-builtin
+        logger.debug(format, *args)
+
+    def _get_session(self) -> tuple[str, bool]:
+        """
+        Read the session identifier from the cookies of the request.
+
+        :return: the session identifier and whether the session is new.
+        """
+
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        if SESSION_COOKIE in cookie:
+            return cookie[SESSION_COOKIE].value, False
+        return uuid.uuid4().hex, True
+
+    def _send(self, status: int, content_type: str, body: str, session_id: Optional[str] = None) -> None:
+        encoded_body = body.encode("utf-8")
+        # like the federation's server, responses are compressed if the client accepts it
+        accepted_encodings = {encoding.strip() for encoding in self.headers.get("Accept-Encoding", "").split(",")}
+        compressed = "gzip" in accepted_encodings
+        if compressed:
+            encoded_body = gzip.compress(encoded_body, compresslevel=6)
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(encoded_body)))
+        if session_id is not None:
+            self.send_header("Set-Cookie", f"{SESSION_COOKIE}={session_id}; Path=/")
+        self.end_headers()
+        self.wfile.write(encoded_body)
+
+
+class BestlistServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the bestlist of the federation. It serves generated pages for the query arguments used by the
+    scraper, such that the scraping pipeline can be run (and benchmarked) offline. Point the scraper to the server by
+    setting the environment variable TRACK_INSIGHTS_BASE_URL to its url.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, generator: BestlistPageGenerator, host: str = "localhost", port: int = 0) -> None:
+        """
+        Initialize the server.
+
+        :param generator: the generator of the bestlist pages.
+        :param host: the host to bind to.
+        :param port: the port to bind to (0 selects a free port).
+        """
+
+        super().__init__((host, port), BestlistRequestHandler)
+        self.generator = generator
+
+        self._lock = threading.Lock()
+        self._exclusive_sessions: set[str] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "BestlistServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        The url of the bestlist page served by this server.
+        """
+
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}{BESTLIST_PATH}"
+
+    def start(self) -> None:
+        """
+        Serve the requests in a background thread.
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop serving requests and close the socket.
+        """
+
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def is_exclusive(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._exclusive_sessions
+
+    def set_exclusive(self, session_id: str, exclusive: bool) -> None:
+        with self._lock:
+            if exclusive:
+                self._exclusive_sessions.add(session_id)
+            else:
+                self._exclusive_sessions.discard(session_id)
@@ -0,0 +1,321 @@
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+DEFAULT_TIMEOUT = 10.0  # seconds
+DEFAULT_MAX_TIMEOUT = 120.0  # seconds
+DEFAULT_SECONDS_PER_RECORD = 0.0025
+MIN_OBSERVED_AMOUNT = 500
+TIMEOUT_FACTOR = 4
+SMOOTHING_FACTOR = 0.2
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_BASE = 1.0  # seconds
+DEFAULT_BACKOFF_MAX = 60.0  # seconds
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_COOLDOWN = 30.0  # seconds
+DEFAULT_MAX_COOLDOWN = 600.0  # seconds
+DEFAULT_MAX_TRIPS = 10
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all fetches. Tokens are refilled continuously at the configured rate, while the bucket size
+    allows for short bursts.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize the rate limiter with a full bucket.
+
+        :param rate: the number of requests per second.
+        :param burst: the maximum number of requests that can be sent at once.
+        """
+
+        assert rate > 0 and burst > 0, "Rate and burst must be positive."
+
+        self.rate = rate
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, blocks until a token is available.
+
+        :return: the time (in seconds) spent waiting.
+        """
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
+
+
+class CircuitBreaker:
+    """
+    Pauses all fetches after too many consecutive failures. While the breaker is open, requests wait until the cooldown
+    elapsed. The first request afterwards probes the server: a success closes the breaker, a failure opens it again
+    with a doubled cooldown. Only after too many consecutive trips, the breaker is exhausted and the run should stop.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown: float = DEFAULT_COOLDOWN,
+        max_cooldown: float = DEFAULT_MAX_COOLDOWN,
+        max_trips: int = DEFAULT_MAX_TRIPS,
+    ) -> None:
+        """
+        Initialize the closed circuit breaker.
+
+        :param failure_threshold: the number of consecutive failures that open the breaker.
+        :param cooldown: the time (in seconds) the breaker stays open after the first trip.
+        :param max_cooldown: the maximum time (in seconds) the breaker stays open.
+        :param max_trips: the number of consecutive trips after which the breaker is exhausted.
+        """
+
+        assert failure_threshold > 0, "At least one failure must be tolerated."
+
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.trips = 0
+        self._open_until: Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._open_until is not None and time.monotonic() < self._open_until
+
+    @property
+    def exhausted(self) -> bool:
+        """
+        Whether the breaker tripped too often in a row, i.e., the server does not recover.
+        """
+
+        with self._lock:
+            return self.trips >= self.max_trips
+
+    def wait(self) -> float:
+        """
+        Block while the breaker is open.
+
+        :return: the time (in seconds) spent waiting.
+        """
+
+        with self._lock:
+            wait_time = 0.0 if self._open_until is None else max(0.0, self._open_until - time.monotonic())
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.trips = 0
+            self._open_until = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._open_until is not None and time.monotonic() < self._open_until:
+                return  # requests that were in flight when the breaker opened
+            self.failures += 1
+            # a failure of the probe after the cooldown immediately opens the breaker again
+            probing = self._open_until is not None
+            if probing or self.failures >= self.failure_threshold:
+                self._trip()
+
+    def trip(self) -> None:
+        """
+        Open the breaker (e.g., after a failure that was not recorded by a request).
+        """
+
+        with self._lock:
+            self._trip()
+
+    def _trip(self) -> None:
+        self.trips += 1
+        self.failures = 0
+        cooldown = min(self.max_cooldown, self.cooldown * 2 ** (self.trips - 1))
+        self._open_until = time.monotonic() + cooldown
+        logger.warning(f"Circuit breaker opened ({self.trips}/{self.max_trips}), pausing requests for {cooldown:.0f}s.")
+
+
+class AdaptiveTimeout:
+    """
+    Computes the timeout of a request from the expected page size. The time per record is learned from the responses
+    of large pages, since the response time of small pages is dominated by the latency.
+    """
+
+    def __init__(
+        self,
+        min_timeout: float = DEFAULT_TIMEOUT,
+        max_timeout: float = DEFAULT_MAX_TIMEOUT,
+        seconds_per_record: float = DEFAULT_SECONDS_PER_RECORD,
+    ) -> None:
+        """
+        Initialize the timeout.
+
+        :param min_timeout: the timeout (in seconds) of small pages.
+        :param max_timeout: the upper bound of the timeout (in seconds).
+        :param seconds_per_record: the initial estimate of the response time per record.
+        """
+
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.seconds_per_record = seconds_per_record
+        self._lock = threading.Lock()
+
+    def get(self, amount: int) -> float:
+        """
+        Get the timeout of a request.
+
+        :param amount: the number of records requested.
+        :return: the timeout in seconds.
+        """
+
+        with self._lock:
+            expected_time = self.seconds_per_record * amount
+        return min(self.max_timeout, max(self.min_timeout, TIMEOUT_FACTOR * expected_time))
+
+    def observe(self, amount: int, elapsed: float) -> None:
+        """
+        Update the estimate of the response time per record.
+
+        :param amount: the number of records requested.
+        :param elapsed: the response time in seconds.
+        """
+
+        if amount < MIN_OBSERVED_AMOUNT:
+            return
+        with self._lock:
+            self.seconds_per_record += SMOOTHING_FACTOR * (elapsed / amount - self.seconds_per_record)
+
+
+@dataclass
+class FetchPolicy:
+    """
+    Policy applied to every bestlist request: requests are rate limited, sized with an adaptive timeout and retried
+    with jittered exponential backoff. A circuit breaker pauses all requests if the server keeps failing.
+    The policy is shared by all fetches of a run.
+    """
+
+    rate_limiter: Optional[RateLimiter] = None
+    circuit_breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    timeout: AdaptiveTimeout = field(default_factory=AdaptiveTimeout)
+    max_retries: int = DEFAULT_MAX_RETRIES
+    backoff_base: float = DEFAULT_BACKOFF_BASE
+    backoff_max: float = DEFAULT_BACKOFF_MAX
+
+    @classmethod
+    def from_config(cls, config: dict, num_processes: int = 1) -> "FetchPolicy":
+        """
+        Create the fetch policy according to the system configuration.
+
+        :param config: the system configuration.
+        :param num_processes: the number of processes that fetch concurrently, each one gets an equal share of the rate.
+        :return: the fetch policy.
+        """
+
+        policy_config = config.get("scraping", {}).get("fetch_policy", {})
+        requests_per_second: Optional[float] = policy_config.get("requests_per_second")
+        return cls(
+            rate_limiter=(
+                RateLimiter(requests_per_second / num_processes, max(1, policy_config.get("burst", 1) // num_processes))
+                if requests_per_second is not None
+                else None
+            ),
+            circuit_breaker=CircuitBreaker(
+                failure_threshold=policy_config.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+                cooldown=policy_config.get("cooldown", DEFAULT_COOLDOWN),
+                max_cooldown=policy_config.get("max_cooldown", DEFAULT_MAX_COOLDOWN),
+                max_trips=policy_config.get("max_trips", DEFAULT_MAX_TRIPS),
+            ),
+            timeout=AdaptiveTimeout(
+                min_timeout=policy_config.get("min_timeout", DEFAULT_TIMEOUT),
+                max_timeout=policy_config.get("max_timeout", DEFAULT_MAX_TIMEOUT),
+            ),
+            max_retries=policy_config.get("max_retries", DEFAULT_MAX_RETRIES),
+            backoff_base=policy_config.get("backoff_base", DEFAULT_BACKOFF_BASE),
+            backoff_max=policy_config.get("backoff_max", DEFAULT_BACKOFF_MAX),
+        )
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Get the delay before the next attempt ("full jitter"), which spreads the retries of concurrent requests.
+
+        :param attempt: the number of failed attempts so far (starting at 0).
+        :return: the delay in seconds.
+        """
+
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def request(self, send: Callable[[float], requests.Response], amount: int) -> requests.Response:
+        """
+        Send a request according to the policy.
+
+        :param send: sends the request given the timeout.
+        :param amount: the number of records requested.
+        :raise requests.exceptions.RequestException: if the request still fails after all retries.
+        :return: the response.
+        """
+
+        attempt = 0
+        while True:
+            self.circuit_breaker.wait()
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            delay = 0.0
+            start_time = time.monotonic()
+            try:
+                response = send(self.timeout.get(amount))
+                if response.status_code not in RETRY_STATUS_CODES:
+                    self.circuit_breaker.record_success()
+                    self.timeout.observe(amount, time.monotonic() - start_time)
+                    return response
+
+                error: requests.exceptions.RequestException = requests.exceptions.RetryError(
+                    f"Server responded with status {response.status_code}.", response=response
+                )
+                delay = FetchPolicy._get_retry_after(response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as err:
+                error = err
+
+            self.circuit_breaker.record_failure()
+            if attempt >= self.max_retries:
+                raise error
+            time.sleep(max(delay, self.get_backoff(attempt)))
+            attempt += 1
+
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> float:
+        try:
+            return float(response.headers.get("Retry-After", 0))
+        except (TypeError, ValueError):
+            return 0.0
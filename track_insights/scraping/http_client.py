@@ -0,0 +1,131 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from seleniumrequests import Chrome
+from urllib3.util import make_headers
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MAXSIZE = 10
+# gzip and deflate are always supported, brotli (and zstd) only if the optional decoders are installed
+ACCEPT_ENCODING: str = make_headers(accept_encoding=True)["accept-encoding"]
+
+
+@dataclass
+class HttpStatistics:
+    """
+    Counters of the requests sent by HTTP clients.
+    """
+
+    requests: int = 0
+    received_bytes: int = 0  # as transferred, i.e., compressed
+    content_bytes: int = 0  # after decompression
+    elapsed_time: float = 0.0  # seconds
+
+    def add(self, other: "HttpStatistics") -> None:
+        self.requests += other.requests
+        self.received_bytes += other.received_bytes
+        self.content_bytes += other.content_bytes
+        self.elapsed_time += other.elapsed_time
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests, {self.received_bytes / 1e6:.1f} MB received "
+            f"({self.content_bytes / 1e6:.1f} MB decompressed) in {self.elapsed_time:.1f}s"
+        )
+
+
+class HttpClient(requests.Session):
+    """
+    HTTP session through which all requests to the bestlist are sent. Connections are pooled and kept alive, responses
+    are requested compressed and every request is counted. The counters of all clients of the process are aggregated.
+    """
+
+    _shared: Optional["HttpClient"] = None
+    _shared_lock = threading.Lock()
+    _total_statistics = HttpStatistics()
+    _total_lock = threading.Lock()
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+        """
+        Initialize the client.
+
+        :param pool_maxsize: the maximum number of pooled connections per host.
+        """
+
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+        self.statistics = HttpStatistics()
+        self._statistics_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> "HttpClient":
+        """
+        Get the client shared by all stateless requests (e.g., reading the metadata of the bestlist) of the process.
+
+        :return: the shared client.
+        """
+
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @classmethod
+    def from_driver(cls, driver: Chrome, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> "HttpClient":
+        """
+        Create a client that shares the cookies (and hence the server-side state) of the driver.
+
+        :param driver: the driver from which the cookies are copied.
+        :param pool_maxsize: the maximum number of pooled connections per host.
+        :return: the client.
+        """
+
+        client = cls(pool_maxsize)
+        client.headers["User-Agent"] = driver.execute_script("return navigator.userAgent;")
+        for cookie in driver.get_cookies():
+            client.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path"))
+        return client
+
+    @classmethod
+    def get_total_statistics(cls) -> HttpStatistics:
+        """
+        Get the counters of all clients of the process.
+
+        :return: a copy of the aggregated counters.
+        """
+
+        with cls._total_lock:
+            total_statistics = HttpStatistics()
+            total_statistics.add(cls._total_statistics)
+            return total_statistics
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        start_time = time.perf_counter()
+        response = super().request(method, url, *args, **kwargs)
+        elapsed_time = time.perf_counter() - start_time
+
+        statistics = HttpStatistics(requests=1, elapsed_time=elapsed_time)
+        if not kwargs.get("stream", False):
+            statistics.content_bytes = len(response.content)
+            # the raw response counts the bytes read from the socket
+            statistics.received_bytes = response.raw.tell() if response.raw is not None else statistics.content_bytes
+        logger.debug(
+            f"{method!s} {response.url} ({response.status_code}): {statistics.received_bytes} bytes in "
+            f"{elapsed_time:.2f}s."
+        )
+
+        with self._statistics_lock:
+            self.statistics.add(statistics)
+        with HttpClient._total_lock:
+            HttpClient._total_statistics.add(statistics)
+        return response
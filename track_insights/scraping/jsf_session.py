@@ -0,0 +1,127 @@
+import logging
+import re
+import xml.etree.ElementTree as ET
+from typing import Optional
+
+from bs4 import BeautifulSoup
+from track_insights.scraping.bestlist_category import BestlistCategory
+from track_insights.scraping.http_client import DEFAULT_POOL_MAXSIZE, HttpClient
+from track_insights.scraping.scraper import BASE_URL
+
+logger = logging.getLogger(__name__)
+
+FORM_ID = "form_anonym"
+VIEW_STATE_KEY = "javax.faces.ViewState"
+WINDOW_GUID_KEY = "aeswindowguid"
+
+ALL_RESULTS_TYPE = "0"
+EXCLUSIVE_YEAR = "2023"
+
+
+class JsfSession(HttpClient):
+    """
+    HTTP session that reaches the server-side state of the bestlist form without a browser. Instead of clicking through
+    the form, it replays the (partial) ajax requests that PrimeFaces sends on every value change. The session can be
+    used wherever a driver is expected to send requests.
+    """
+
+    def __init__(self, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+        """
+        Initialize the session. The form state is only set up by calling open().
+
+        :param pool_maxsize: the maximum number of pooled connections.
+        """
+
+        super().__init__(pool_maxsize)
+        self.view_state: Optional[str] = None
+        self.window_guid: Optional[str] = None
+
+    def open(self) -> None:
+        """
+        Load the bestlist form and switch to the "Alle Resultate" mode.
+        """
+
+        response = self.get(BASE_URL, timeout=10)
+        response.raise_for_status()
+        self._read_form_state(response.text)
+
+        self._change_value("bestlistType", ALL_RESULTS_TYPE)
+
+    def enable_exclusive_categories(self) -> None:
+        """
+        Switch the session to exclusive categories (results are only listed in the category of the athlete).
+        The checkbox is only enabled for junior categories, hence we select one beforehand.
+        """
+
+        assert self.view_state is not None, "Session is not opened."
+
+        self._change_value("bestlistYear", EXCLUSIVE_YEAR)
+        self._change_value("bestlistCategory", BestlistCategory.U_10_M.value)
+        self._change_value("categoryExclusive", "on")
+
+    def quit(self) -> None:
+        """
+        Close the session. This allows the session to be used in place of a driver.
+        """
+
+        self.close()
+
+    def _read_form_state(self, html: str) -> None:
+        """
+        Read the view state and the window identifier from the bestlist page.
+
+        :param html: the html of the bestlist page.
+        """
+
+        parsed_html = BeautifulSoup(html, "html.parser")
+        view_state = parsed_html.find("input", attrs={"name": VIEW_STATE_KEY})
+        if view_state is None:
+            raise ValueError("Could not find the view state of the bestlist form.")
+        self.view_state = view_state.get("value")
+
+        match = re.search(WINDOW_GUID_KEY + r"\",value:\"([0-9a-f-]+)\"", html.replace("&quot;", '"'))
+        self.window_guid = match.group(1) if match else None
+
+    def _change_value(self, component: str, value: str) -> None:
+        """
+        Send the partial request that is triggered by changing the value of a form component.
+
+        :param component: the name of the component (without form prefix).
+        :param value: the new value of the component.
+        """
+
+        source = f"{FORM_ID}:{component}"
+        data = {
+            "javax.faces.partial.ajax": "true",
+            "javax.faces.source": source,
+            "javax.faces.partial.execute": source,
+            "javax.faces.partial.render": f"{FORM_ID}:bestlistSearches globalMsgs",
+            "javax.faces.behavior.event": "valueChange",
+            "javax.faces.partial.event": "change",
+            FORM_ID: FORM_ID,
+            f"{source}_input": value,
+            VIEW_STATE_KEY: self.view_state,
+        }
+        if self.window_guid is not None:
+            data[WINDOW_GUID_KEY] = self.window_guid
+
+        headers = {"Faces-Request": "partial/ajax", "X-Requested-With": "XMLHttpRequest"}
+        response = self.post(BASE_URL, data=data, headers=headers, timeout=10)
+        response.raise_for_status()
+        self._read_partial_response(response.text)
+
+    def _read_partial_response(self, xml: str) -> None:
+        """
+        Check the partial response for errors and read the updated view state.
+
+        :param xml: the partial response.
+        """
+
+        root = ET.fromstring(xml)
+        error = root.find("error")
+        if error is not None:
+            raise ValueError(f"Partial request failed: {error.findtext('error-message')}")
+
+        for update in root.iter("update"):
+            if VIEW_STATE_KEY in update.get("id", ""):
+                self.view_state = update.text
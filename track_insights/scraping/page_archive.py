@@ -0,0 +1,233 @@
+import dataclasses
+import gzip
+import json
+import logging
+import os
+import pathlib
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+from track_insights.common import ARCHIVE_PATH, current_time_millis
+from track_insights.database.models import Discipline
+from track_insights.scraping.bestlist_category import BestlistCategory
+from track_insights.scraping.scrape_config import BASE_URL, ScrapeConfig
+
+logger = logging.getLogger(__name__)
+
+MEGABYTES_TO_BYTES = 1024 * 1024
+DEFAULT_SEGMENT_SIZE = 64  # megabytes
+PAGES_SUFFIX = ".pages.gz"
+INDEX_SUFFIX = ".index.jsonl"
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """
+    Index entry of an archived bestlist page. It holds the scrape configuration of the page and its location within
+    a segment of the archive.
+    """
+
+    source: str
+    discipline_code: str
+    discipline_name: str
+    male: bool
+    indoor: bool
+    category: BestlistCategory
+    year: Optional[int]
+    amount: int
+    allow_wind: bool
+    only_homologated: bool
+    fetched_at: float  # seconds since the epoch
+    segment_path: pathlib.Path
+    offset: int
+    length: int
+
+    @classmethod
+    def from_index_line(cls, line: str, path: pathlib.Path) -> "ArchivedPage":
+        """
+        Parse a line of a segment index.
+
+        :param line: the json encoded entry.
+        :param path: the directory of the archive.
+        :return: the entry.
+        """
+
+        entry = json.loads(line)
+        entry["category"] = BestlistCategory(entry["category"])
+        entry["segment_path"] = path / entry.pop("segment")
+        return cls(**entry)
+
+    def to_index_line(self) -> str:
+        entry = dataclasses.asdict(self)
+        entry["category"] = self.category.value
+        entry["segment"] = entry.pop("segment_path").name
+        return json.dumps(entry)
+
+    def get_unit_key(self) -> tuple:
+        """
+        Get the key of the bestlist the page belongs to. Pages of a bestlist requested with different amounts share
+        the key.
+
+        :return: the key.
+        """
+
+        return (
+            self.source,
+            self.discipline_code,
+            self.male,
+            self.indoor,
+            self.category,
+            self.year,
+            self.allow_wind,
+            self.only_homologated,
+        )
+
+    def get_scrape_config(self, discipline: Discipline) -> ScrapeConfig:
+        """
+        Reconstruct the scrape configuration of the page.
+
+        :param discipline: the discipline of the page.
+        :return: the scrape configuration.
+        """
+
+        return ScrapeConfig(
+            category=self.category,
+            discipline=discipline,
+            year=self.year,
+            allow_wind=self.allow_wind,
+            amount=self.amount,
+            only_homologated=self.only_homologated,
+        )
+
+    def read(self) -> str:
+        """
+        Read the page from its segment.
+
+        :return: the html of the page.
+        """
+
+        with open(self.segment_path, "rb") as file:
+            file.seek(self.offset)
+            return gzip.decompress(file.read(self.length)).decode("utf-8")
+
+
+class PageArchive:
+    """
+    Append-only archive of the raw bestlist pages, such that the database can be rebuilt without requesting the
+    bestlist again. Pages are appended as separate gzip members to a segment, the offset and the scrape configuration
+    of each page are appended to the index of the segment. Every writer (process) owns its segments, hence concurrent
+    writers never share a file. A segment is rolled over once it exceeds the segment size.
+    """
+
+    def __init__(self, path: pathlib.Path = ARCHIVE_PATH, segment_size: float = DEFAULT_SEGMENT_SIZE) -> None:
+        """
+        Initialize the archive.
+
+        :param path: the directory holding the segments.
+        :param segment_size: the size (in megabytes) after which a new segment is started.
+        """
+
+        self.path = path
+        self.segment_size = int(segment_size * MEGABYTES_TO_BYTES)
+
+        self._lock = threading.Lock()
+        self._segment_path: Optional[pathlib.Path] = None
+        self._segment_pid: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["PageArchive"]:
+        """
+        Create the archive according to the system configuration.
+
+        :param config: the system configuration.
+        :return: the archive or None, if archiving is not configured.
+        """
+
+        archive_config = config.get("scraping", {}).get("archive")
+        if archive_config is None:
+            return None
+        return cls(
+            path=pathlib.Path(archive_config.get("path", ARCHIVE_PATH)),
+            segment_size=archive_config.get("segment_size", DEFAULT_SEGMENT_SIZE),
+        )
+
+    def put(self, scrape_config: ScrapeConfig, page: str) -> None:
+        """
+        Append a page to the archive. The page is written before its index entry, hence an interrupted write never
+        leaves an entry pointing to a partial page.
+
+        :param scrape_config: the scrape configuration of the page.
+        :param page: the page content.
+        """
+
+        compressed_page = gzip.compress(page.encode("utf-8"), compresslevel=6)
+        discipline = scrape_config.discipline
+        with self._lock:
+            try:
+                segment_path = self._get_segment_path()
+                with open(segment_path, "ab") as file:
+                    offset = file.tell()
+                    file.write(compressed_page)
+
+                entry = ArchivedPage(
+                    source=urlparse(BASE_URL).netloc,
+                    discipline_code=discipline.discipline_code,
+                    discipline_name=discipline.config.name if discipline.config is not None else "",
+                    male=discipline.male,
+                    indoor=discipline.indoor,
+                    category=scrape_config.category,
+                    year=scrape_config.year,
+                    amount=scrape_config.amount,
+                    allow_wind=scrape_config.allow_wind,
+                    only_homologated=scrape_config.only_homologated,
+                    fetched_at=current_time_millis() / 1000,
+                    segment_path=segment_path,
+                    offset=offset,
+                    length=len(compressed_page),
+                )
+                with open(PageArchive._get_index_path(segment_path), "a", encoding="utf-8") as index_file:
+                    index_file.write(entry.to_index_line() + "\n")
+            except OSError as err:
+                logger.warning(f"Could not archive page of {scrape_config}: {err}")
+
+    def iter_pages(self) -> Iterator[ArchivedPage]:
+        """
+        Iterate over the index entries of all segments. Incomplete entries (e.g., of an interrupted write) are skipped.
+
+        :return: iterator over the archived pages.
+        """
+
+        for index_path in sorted(self.path.glob(f"*{INDEX_SUFFIX}")):
+            with open(index_path, "r", encoding="utf-8") as index_file:
+                for line in index_file:
+                    try:
+                        yield ArchivedPage.from_index_line(line, self.path)
+                    except (ValueError, KeyError, TypeError):
+                        logger.warning(f"Skipping incomplete entry of archive index {index_path.name}.")
+
+    def _get_segment_path(self) -> pathlib.Path:
+        """
+        Get the segment that is appended to, a new segment is started if the current one is full or belongs to the
+        parent of a forked process.
+
+        :return: the path of the segment.
+        """
+
+        if (
+            self._segment_path is None
+            or self._segment_pid != os.getpid()
+            or self._segment_path.stat().st_size >= self.segment_size
+        ):
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._segment_pid = os.getpid()
+            name = f"{current_time_millis()}-{self._segment_pid}-{uuid.uuid4().hex[:8]}"
+            self._segment_path = self.path / f"{name}{PAGES_SUFFIX}"
+            self._segment_path.touch()
+        return self._segment_path
+
+    @staticmethod
+    def _get_index_path(segment_path: pathlib.Path) -> pathlib.Path:
+        return segment_path.with_name(segment_path.name.removesuffix(PAGES_SUFFIX) + INDEX_SUFFIX)
@@ -0,0 +1,130 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from datetime import date
+from typing import Optional
+
+from track_insights.common import CACHE_PATH
+from track_insights.scraping.scrape_config import BASE_URL, ScrapeConfig
+
+logger = logging.getLogger(__name__)
+
+HOURS_TO_SECONDS = 60 * 60
+DEFAULT_TTL_PAST_SEASONS = 30 * 24  # hours
+DEFAULT_TTL_CURRENT_SEASON = 6  # hours
+
+
+class ResponseCache:
+    """
+    Persistent cache of bestlist pages. Each page is stored as a gzip-compressed file, keyed by the canonicalized query
+    arguments of its scrape configuration. The first line of a file holds the fetch timestamp. Pages of past seasons
+    are kept much longer than pages of the current season (or of all years), since their results rarely change.
+    """
+
+    def __init__(
+        self,
+        path: pathlib.Path = CACHE_PATH,
+        ttl_past_seasons: float = DEFAULT_TTL_PAST_SEASONS,
+        ttl_current_season: float = DEFAULT_TTL_CURRENT_SEASON,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param path: the directory holding the cached pages.
+        :param ttl_past_seasons: time to live (in hours) of pages belonging to past seasons.
+        :param ttl_current_season: time to live (in hours) of pages belonging to the current season or to all years.
+        """
+
+        self.path = path
+        self.ttl_past_seasons = ttl_past_seasons * HOURS_TO_SECONDS
+        self.ttl_current_season = ttl_current_season * HOURS_TO_SECONDS
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["ResponseCache"]:
+        """
+        Create the cache according to the system configuration.
+
+        :param config: the system configuration.
+        :return: the cache or None, if caching is not configured.
+        """
+
+        cache_config = config.get("scraping", {}).get("cache")
+        if cache_config is None:
+            return None
+        return cls(
+            path=pathlib.Path(cache_config.get("path", CACHE_PATH)),
+            ttl_past_seasons=cache_config.get("ttl_past_seasons", DEFAULT_TTL_PAST_SEASONS),
+            ttl_current_season=cache_config.get("ttl_current_season", DEFAULT_TTL_CURRENT_SEASON),
+        )
+
+    @staticmethod
+    def get_key(scrape_config: ScrapeConfig) -> str:
+        """
+        Compute the cache key of a scrape configuration. The key includes the bestlist url, such that pages of a local
+        stand-in never mix with the pages of the federation.
+
+        :param scrape_config: the scrape configuration.
+        :return: the hex digest of the url and the canonicalized query arguments.
+        """
+
+        query_arguments = json.dumps(scrape_config.get_query_arguments(), sort_keys=True, default=str)
+        return hashlib.sha256(f"{BASE_URL}?{query_arguments}".encode("utf-8")).hexdigest()
+
+    def get(self, scrape_config: ScrapeConfig) -> Optional[str]:
+        """
+        Read a page from the cache.
+
+        :param scrape_config: the scrape configuration of the page.
+        :return: the cached page or None, if the page is not cached or expired.
+        """
+
+        file_path = self._get_file_path(scrape_config)
+        try:
+            with gzip.open(file_path, "rt", encoding="utf-8") as file:
+                fetched_at = float(file.readline())
+                if time.time() - fetched_at > self._get_ttl(scrape_config.year):
+                    self.misses += 1
+                    return None
+                self.hits += 1
+                return file.read()
+        except (OSError, EOFError, ValueError):
+            self.misses += 1
+            return None
+
+    def put(self, scrape_config: ScrapeConfig, page: str) -> None:
+        """
+        Store a page in the cache. The file is replaced atomically, such that concurrent runs never read partial files.
+
+        :param scrape_config: the scrape configuration of the page.
+        :param page: the page content.
+        """
+
+        file_path = self._get_file_path(scrape_config)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as raw_file:
+                with gzip.open(raw_file, "wt", encoding="utf-8") as file:
+                    file.write(f"{time.time()}\n")
+                    file.write(page)
+            os.replace(temporary_path, file_path)
+        except OSError as err:
+            logger.warning(f"Could not cache page of {scrape_config}: {err}")
+            pathlib.Path(temporary_path).unlink(missing_ok=True)
+
+    def _get_ttl(self, year: Optional[int]) -> float:
+        if year is not None and year < date.today().year:
+            return self.ttl_past_seasons
+        return self.ttl_current_season
+
+    def _get_file_path(self, scrape_config: ScrapeConfig) -> pathlib.Path:
+        key = ResponseCache.get_key(scrape_config)
+        return self.path / key[:2] / f"{key}.html.gz"
@@ -1,9 +1,13 @@
+import os
 from dataclasses import dataclass
 from typing import Optional
 
 from track_insights.database.models import Discipline
 from track_insights.scraping.bestlist_category import BestlistCategory
 
+# the url can be overridden to scrape a local stand-in of the bestlist (see standin_server.py)
+BASE_URL = os.environ.get("TRACK_INSIGHTS_BASE_URL", "https://alabus.swiss-athletics.ch/satweb/faces/bestlist.xhtml")
+
 
 @dataclass
 class ScrapeConfig:
@@ -1,14 +1,19 @@
 import logging
 import re
-from typing import Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Optional, Union
+from urllib.parse import parse_qs, unquote_plus, urlparse
 
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup, Tag
 from seleniumrequests import Chrome
 from track_insights.scraping.bestlist_column import BestlistColumn
-from track_insights.scraping.scrape_config import ScrapeConfig
+from track_insights.scraping.bestlist_parser import BestlistParser
+from track_insights.scraping.fetch_policy import DEFAULT_TIMEOUT, FetchPolicy
+from track_insights.scraping.http_client import HttpClient
+from track_insights.scraping.page_archive import PageArchive
+from track_insights.scraping.response_cache import ResponseCache
+from track_insights.scraping.scrape_config import BASE_URL, ScrapeConfig
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +21,18 @@ ATHLETE_KEY = "con"
 CLUB_KEY = "acc"
 EVENT_KEY = "evt"
 
-
-BASE_URL = "https://alabus.swiss-athletics.ch/satweb/faces/bestlist.xhtml"
+LINK_SEPARATOR = "\x00"
+# matches the first link of each onclick handler (separated by LINK_SEPARATOR), skips the query parameters preceding
+# the key and captures its value (if present), the remainder of the handler is consumed. Each match is anchored to the
+# start of its handler, such that a later link of the handler is never matched in place of the first one.
+CODE_PATTERNS = {
+    key: re.compile(
+        rf"(?:^|{LINK_SEPARATOR})(?:(?!openURLForBestlist\(')[^{LINK_SEPARATOR}])*"
+        rf"openURLForBestlist\('[^?'{LINK_SEPARATOR}]*\?(?:(?!{key}=)[^&#'{LINK_SEPARATOR}]*&)*"
+        rf"(?:{key}=([^&#'{LINK_SEPARATOR}]*))?[^'{LINK_SEPARATOR}]*'\)[^{LINK_SEPARATOR}]*"
+    )
+    for key in (ATHLETE_KEY, CLUB_KEY, EVENT_KEY)
+}
 
 
 class Scraper:
@@ -25,15 +40,29 @@ class Scraper:
     Scraper class that enables the reading of the bestlist page.
     """
 
-    def __init__(self, scrape_config: ScrapeConfig, driver: Chrome):
+    def __init__(
+        self,
+        scrape_config: ScrapeConfig,
+        driver: Union[Chrome, requests.Session],
+        cache: Optional[ResponseCache] = None,
+        fetch_policy: Optional[FetchPolicy] = None,
+        archive: Optional[PageArchive] = None,
+    ):
         """
         Create a scraper that enables the reading of a particular bestlist page.
 
         :param scrape_config: the scrape configuration.
+        :param driver: the driver (or a plain HTTP session sharing its cookies) used to send the request.
+        :param cache: (Optional) the cache consulted before the page is requested.
+        :param fetch_policy: (Optional) the policy (rate limit, timeout and retries) applied to the request.
+        :param archive: (Optional) the archive the requested page is appended to.
         """
 
         self.scrape_config = scrape_config
         self.driver = driver
+        self.cache = cache
+        self.fetch_policy = fetch_policy
+        self.archive = archive
 
         self._silence_loggers()
 
@@ -46,7 +75,7 @@ class Scraper:
         """
 
         Scraper._silence_loggers()
-        response = requests.get(BASE_URL, timeout=10)
+        response = HttpClient.shared().get(BASE_URL, timeout=10)
         parsed_page = BeautifulSoup(response.text, "html.parser")
         items = parsed_page.find(attrs={"id": "form_anonym:bestlistYear_input"})
 
@@ -78,7 +107,7 @@ class Scraper:
             "blcat": "M" if male else "W",
             "indoor": indoor,
         }
-        response = requests.get(BASE_URL, params=params, timeout=10)  # type: ignore
+        response = HttpClient.shared().get(BASE_URL, params=params, timeout=10)  # type: ignore
         parsed_page = BeautifulSoup(response.text, "html.parser")
         items = parsed_page.find(attrs={"name": "form_anonym:bestlistDiscipline_input"})
 
@@ -90,7 +119,6 @@ class Scraper:
                 disciplines.append((elem.text.strip(), code))
         return disciplines
 
-    # pylint: disable=too-many-locals
     def extract_data(self) -> Optional[pd.DataFrame]:
         """
         Scrape the bestlist according to the scrape config and return the extracted data as a dataframe.
@@ -99,53 +127,60 @@ class Scraper:
         :return: the dataframe of the scraped bestlist or None, if no results are found.
         """
 
-        response = self.driver.request("GET", BASE_URL, params=self.scrape_config.get_query_arguments(), timeout=10)
+        page = self.cache.get(self.scrape_config) if self.cache is not None else None
+        if page is None:
+            params = self.scrape_config.get_query_arguments()
+            if self.fetch_policy is not None:
+                response = self.fetch_policy.request(
+                    lambda timeout: self.driver.request("GET", BASE_URL, params=params, timeout=timeout),
+                    self.scrape_config.amount,
+                )
+            else:
+                response = self.driver.request("GET", BASE_URL, params=params, timeout=DEFAULT_TIMEOUT)
+            page = response.text
+            if self.cache is not None and response.ok:
+                self.cache.put(self.scrape_config, page)
+            if self.archive is not None and response.ok:
+                self.archive.put(self.scrape_config, page)
+        return Scraper.parse_bestlist(page)
+
+    @staticmethod
+    def parse_bestlist(html: str) -> Optional[pd.DataFrame]:
+        """
+        Parse the html of a bestlist page and return the extracted data as a dataframe.
 
-        parsed_html = BeautifulSoup(response.text, "html.parser")
+        :param html: the html of the bestlist page.
+        :return: the dataframe of the bestlist or None, if no results are found.
+        """
 
-        # remove all tooltips
-        for div in parsed_html.find_all("div", class_="ui-tooltip ui-widget ui-tooltip-right"):
-            div.decompose()  # Remove the element from the DOM
+        parser = BestlistParser.parse(html)
 
-        table = parsed_html.find("table")
         headers: list[BestlistColumn] = []
+        for header_name in parser.header:
+            field = BestlistColumn.get_column(header_name)
+            if field is None:
+                raise ValueError(f"Could not find corresponding field of {header_name}.")
+            headers.append(field)
+        athlete_index, club_index, event_index = (
+            headers.index(column) if column in headers else -1
+            for column in (BestlistColumn.ATHLETE, BestlistColumn.CLUB, BestlistColumn.EVENT)
+        )
+
+        # check if there is data available
+        if any(len(headers) != len(values) for values in parser.rows):
+            return None
+
+        # extract athlete, club and event code of all rows at once
+        codes = (
+            Scraper._parse_codes([links[index] for links in parser.links], key)
+            for index, key in ((athlete_index, ATHLETE_KEY), (club_index, CLUB_KEY), (event_index, EVENT_KEY))
+        )
         data: list[list[str]] = []
-        athlete_index, club_index, event_index = -1, -1, -1
-        rows = table.find_all("tr")
-        for i, row in enumerate(rows):
-            if i == 0:
-                header = row.find_all("th")
-                for idx, ele in enumerate(header):
-                    header_name = ele.text.strip()
-                    field = BestlistColumn.get_column(header_name)
-                    if field is None:
-                        raise ValueError(f"Could not find corresponding field of {header_name}.")
-                    headers.append(field)
-
-                    if field == BestlistColumn.ATHLETE:
-                        athlete_index = idx
-                    elif field == BestlistColumn.CLUB:
-                        club_index = idx
-                    elif field == BestlistColumn.EVENT:
-                        event_index = idx
-                headers.append(BestlistColumn.ATHLETE_CODE)
-                headers.append(BestlistColumn.CLUB_CODE)
-                headers.append(BestlistColumn.EVENT_CODE)
-            else:
-                cols = row.find_all("td")
-
-                # check if there is data available
-                if len(headers) - 3 != len(cols):
-                    return None
-
-                values = [ele.text.strip() for ele in cols]
-
-                # extract athlete, club and event code
-                values.append(self._extract_code(cols, athlete_index, ATHLETE_KEY))
-                values.append(self._extract_code(cols, club_index, CLUB_KEY))
-                values.append(self._extract_code(cols, event_index, EVENT_KEY))
-                data.append(values)
+        for values, athlete_code, club_code, event_code in zip(parser.rows, *codes):
+            values += [athlete_code, club_code, event_code]
+            data.append(values)
 
+        headers += [BestlistColumn.ATHLETE_CODE, BestlistColumn.CLUB_CODE, BestlistColumn.EVENT_CODE]
         return pd.DataFrame(data, columns=[header.value for header in headers], dtype=str)
 
     @staticmethod
@@ -159,12 +194,46 @@ class Scraper:
         """
 
         first_tag = next(iter(columns[index].children))
-        link = re.findall(r"openURLForBestlist\('(.*?)'\)", first_tag["onclick"])[0]
+        return Scraper._parse_code(first_tag["onclick"], key)
+
+    @staticmethod
+    def _parse_code(onclick: Optional[str], key: str) -> str:
+        """
+        Parses the unique identifier (code) from the onclick handler of a hyperlink given the key.
+
+        :param onclick: the onclick handler, which opens the link.
+        :param key: the query parameter holding the code.
+        :return: the extracted code.
+        """
+
+        if onclick is None:
+            raise ValueError("Could not find the link of the cell.")
+        link = re.findall(r"openURLForBestlist\('(.*?)'\)", onclick)[0]
 
         # parse the url and extract the parameter associated with the key
         parsed_url = urlparse(link)
         return parse_qs(parsed_url.query).get(key, [""])[0]
 
+    @staticmethod
+    def _parse_codes(onclicks: list[Optional[str]], key: str) -> list[str]:
+        """
+        Batched counterpart of _parse_code, which parses the codes of a whole column in a single pass of a compiled
+        regular expression.
+
+        :param onclicks: the onclick handlers of the column.
+        :param key: the query parameter holding the code.
+        :return: the extracted codes.
+        """
+
+        if None in onclicks or any(LINK_SEPARATOR in onclick for onclick in onclicks):  # type: ignore[operator]
+            return [Scraper._parse_code(onclick, key) for onclick in onclicks]
+
+        matches = CODE_PATTERNS[key].findall(LINK_SEPARATOR.join(onclicks))  # type: ignore[arg-type]
+        if len(matches) != len(onclicks):
+            # some handler does not hold a link, the per-cell path reports it
+            return [Scraper._parse_code(onclick, key) for onclick in onclicks]
+        return [unquote_plus(code) if "%" in code or "+" in code else code for code in matches]
+
     @staticmethod
     def _silence_loggers() -> None:
         logging.getLogger("selenium").setLevel(logging.WARNING)
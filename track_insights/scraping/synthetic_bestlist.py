@@ -0,0 +1,287 @@
+import functools
+import html
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+from track_insights.scraping.bestlist_category import BestlistCategory
+
+DISTANCES = [60, 100, 200, 400, 800, 1000, 1500, 3000, 5000, 10000]
+NATIONALITIES = ["SUI", "SUI", "SUI", "GER", "FRA", "ITA", "AUT"]
+LOCATIONS = ["Bern", "Zürich", "Basel", "Luzern", "Genève", "Lausanne", "St. Gallen", "Winterthur"]
+MIN_AGE = 8
+MAX_AGE = 40
+MAX_WIND = 2.0
+ATHLETES_PER_BIRTH_YEAR = 50
+NUM_CLUBS = 100
+EVENTS_PER_YEAR = 50
+
+EMPTY_MESSAGE = "Keine Resultate gefunden."
+
+
+@dataclass(frozen=True)
+class SyntheticResult:
+    """
+    A single generated result. Athletes, clubs and events are referenced by their index.
+    """
+
+    performance: int
+    wind: Optional[float]
+    homologated: bool
+    rank: str
+    athlete: int
+    event: int
+
+
+class BestlistPageGenerator:
+    """
+    Generates bestlist pages that are modeled on the bestlist of the federation. For every discipline and gender, a
+    fixed pool of results is derived from the seed, hence every page is reproducible and pages with different query
+    arguments are consistent with each other (e.g., the bestlist of a year is a subset of the bestlist of all years).
+    All disciplines are running disciplines, i.e., lower performances are better.
+    """
+
+    def __init__(
+        self, num_disciplines: int = 10, num_years: int = 5, results_per_discipline: int = 2000, seed: int = 0
+    ) -> None:
+        """
+        Initialize the generator.
+
+        :param num_disciplines: the number of disciplines per gender and place (indoor/outdoor).
+        :param num_years: the number of seasons for which results are available (ending with the current one).
+        :param results_per_discipline: the number of results per discipline and gender.
+        :param seed: the seed of the generated results.
+        """
+
+        assert num_disciplines > 0 and num_years > 0, "At least one discipline and year is required."
+
+        self.num_disciplines = num_disciplines
+        self.results_per_discipline = results_per_discipline
+        self.seed = seed
+
+        current_year = date.today().year
+        self.years = [current_year - offset for offset in range(num_years)]
+        self.window_guid = str(uuid.UUID(int=random.Random(seed).getrandbits(128)))
+        self._min_birth_year = self.years[-1] - MAX_AGE
+
+    def get_disciplines(self, indoor: bool) -> list[tuple[str, str]]:
+        """
+        Get the generated disciplines. Both genders share the same discipline codes.
+
+        :param indoor: whether to get the indoor disciplines.
+        :return: (name, code)-pairs of all disciplines.
+        """
+
+        disciplines: list[tuple[str, str]] = []
+        for index in range(self.num_disciplines):
+            distance = DISTANCES[index % len(DISTANCES)] * (index // len(DISTANCES) + 1)
+            name = f"{distance} m" + (" Halle" if indoor else "")
+            disciplines.append((name, f"synthetic-{'i' if indoor else 'o'}-{index}"))
+        return disciplines
+
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def get_results(
+        self,
+        discipline_code: str,
+        category: BestlistCategory,
+        year: Optional[int] = None,
+        exclusive: bool = False,
+        allow_wind: bool = True,
+        only_homologated: bool = False,
+        amount: int = 5000,
+    ) -> list[SyntheticResult]:
+        """
+        Get the best results matching the query arguments.
+
+        :param discipline_code: the code of the discipline.
+        :param category: the category of the bestlist.
+        :param year: (Optional) the year of the bestlist, otherwise all years are considered.
+        :param exclusive: whether junior results are only listed in the category of the athlete.
+        :param allow_wind: whether to list results with too much tailwind.
+        :param only_homologated: whether to only list homologated results.
+        :param amount: the maximum number of results.
+        :return: the results sorted by performance.
+        """
+
+        male = category in {BestlistCategory.ALL_MEN, BestlistCategory.MEN} or category.name.endswith("_M")
+        lower_bound, upper_bound = BestlistCategory.get_age_bounds(category)
+        if not exclusive and category not in {BestlistCategory.MEN, BestlistCategory.WOMEN}:
+            lower_bound = 0
+
+        results: list[SyntheticResult] = []
+        for result in self._get_all_results(discipline_code, male):
+            event_year = self.get_event_date(result.event).year
+            age = event_year - self.get_birthdate(result.athlete).year
+            if (year is not None and event_year != year) or not lower_bound <= age < upper_bound:
+                continue
+            if (not allow_wind and result.wind is not None and result.wind > MAX_WIND) or (
+                only_homologated and not result.homologated
+            ):
+                continue
+            results.append(result)
+            if len(results) >= amount:
+                break
+        return results
+
+    def get_birthdate(self, athlete: int) -> date:
+        birth_year = self._min_birth_year + athlete // ATHLETES_PER_BIRTH_YEAR
+        return date(birth_year, 1, 1) + timedelta(days=random.Random(f"{self.seed}-athlete-{athlete}").randrange(365))
+
+    def get_event_date(self, event: int) -> date:
+        year = self.years[event // EVENTS_PER_YEAR]
+        return date(year, 3, 1) + timedelta(days=random.Random(f"{self.seed}-event-{event}").randrange(240))
+
+    def render_page(self, params: dict[str, str], exclusive: bool = False) -> str:
+        """
+        Render the bestlist page for the provided query arguments. Without a discipline, only the form is rendered.
+
+        :param params: the query arguments of the request.
+        :param exclusive: whether the session of the request enabled exclusive categories.
+        :return: the html of the page.
+        """
+
+        indoor = params.get("indoor", "false").lower() == "true"
+        category = BestlistCategory(params.get("blcat", BestlistCategory.ALL_MEN.value))
+        year_param = params.get("blyear", "all")
+        year = None if year_param.lower() == "all" else int(year_param)
+
+        table = ""
+        discipline_code = params.get("disci")
+        if discipline_code is not None:
+            results = self.get_results(
+                discipline_code,
+                category,
+                year,
+                exclusive=exclusive,
+                allow_wind=params.get("sw", "1") == "1",
+                only_homologated=params.get("hom", "0") == "1",
+                amount=int(params.get("top", "5000")),
+            )
+            table = self._render_table(results, indoor, params.get("hom", "0") == "1")
+
+        year_options = "".join(f'<option value="{option}">{option}</option>' for option in self.years)
+        discipline_options = "".join(
+            f'<option value="{code}">{html.escape(name)}</option>' for name, code in self.get_disciplines(indoor)
+        )
+        on_change = (
+            "PrimeFaces.ab({s:&quot;form_anonym:bestlistYear&quot;,e:&quot;valueChange&quot;,"
+            f"pa:[{{name:&quot;aeswindowguid&quot;,value:&quot;{self.window_guid}&quot;}}]}});"
+        )
+        return (
+            "<!DOCTYPE html>\n<html><head><title>Resultate Datenbank</title></head><body>"
+            '<form id="form_anonym" name="form_anonym" method="post" action="/satweb/faces/bestlist.xhtml">'
+            '<div id="form_anonym:bestlistSearches" class="ui-outputpanel ui-widget">'
+            '<select id="form_anonym:bestlistYear_input" name="form_anonym:bestlistYear_input" '
+            f'onchange="{on_change}"><option value="ALL">Alle</option>{year_options}</select>'
+            '<select id="form_anonym:bestlistDiscipline_input" name="form_anonym:bestlistDiscipline_input">'
+            f'<option value="">Disziplin wählen</option>{discipline_options}</select>'
+            f"{table}</div>"
+            '<input type="hidden" name="javax.faces.ViewState" id="j_id1:javax.faces.ViewState:0" '
+            f'value="{uuid.uuid4()}" autocomplete="off"/>'
+            "</form></body></html>"
+        )
+
+    def _render_table(self, results: list[SyntheticResult], indoor: bool, only_homologated: bool) -> str:
+        headers = ["Nr", "Resultat"]
+        if not indoor:
+            headers.append("Wind")
+        if not only_homologated:
+            headers.append("NH*")
+        headers += ["Rang", "Name", "Verein", "Nat.", "Geb. Dat.", "Wettkampf", "Ort", "Datum"]
+
+        parts = ['<table role="grid"><thead><tr role="row">']
+        parts += [f'<th class="ui-state-default" role="columnheader" scope="col">{header}</th>' for header in headers]
+        parts.append('</tr></thead><tbody class="ui-datatable-data ui-widget-content">')
+
+        if len(results) == 0:
+            parts.append(
+                f'<tr class="ui-datatable-empty-message"><td colspan="{len(headers)}">{EMPTY_MESSAGE}</td></tr>'
+            )
+        for number, result in enumerate(results, start=1):
+            parts.append(f'<tr data-ri="{number - 1}" class="ui-widget-content" role="row">')
+            parts += [
+                f'<td role="gridcell">{cell}</td>' for cell in self._get_cells(number, result, indoor, only_homologated)
+            ]
+            parts.append("</tr>")
+        parts.append("</tbody></table>")
+        return "".join(parts)
+
+    def _get_cells(self, number: int, result: SyntheticResult, indoor: bool, only_homologated: bool) -> list[str]:
+        club = result.athlete % NUM_CLUBS
+        athlete_link = self._render_link("einzelner-athlet-bestenliste-neu", "con", f"CONTACT.SYN.{result.athlete}")
+        club_link = self._render_link("verein-bestenliste-neu", "acc", f"ACC.SYN.{club}")
+        event_link = self._render_link("wettkampf-bestenliste-neu", "evt", f"evt-syn-{result.event}")
+
+        cells = [str(number), f"<span>{self._format_performance(result.performance)}</span>"]
+        if not indoor:
+            cells.append(f"{result.wind:.1f}" if result.wind is not None else "")
+        if not only_homologated:
+            cells.append("" if result.homologated else "X")
+        cells += [
+            result.rank,
+            f"{athlete_link}Athlete {result.athlete}</a>",
+            f"{club_link}Club {club}</a>",
+            random.Random(f"{self.seed}-nationality-{result.athlete}").choice(NATIONALITIES),
+            self.get_birthdate(result.athlete).strftime("%d.%m.%Y"),
+            f"{event_link}Meeting {result.event}</a>",
+            LOCATIONS[result.event % len(LOCATIONS)],
+            self.get_event_date(result.event).strftime("%d.%m.%Y"),
+        ]
+        return cells
+
+    # pylint: disable=too-many-locals
+    @functools.lru_cache(maxsize=64)
+    def _get_all_results(self, discipline_code: str, male: bool) -> list[SyntheticResult]:
+        """
+        Generate the pool of results of a discipline and gender.
+
+        :param discipline_code: the code of the discipline.
+        :param male: whether to generate results of male athletes.
+        :return: all results sorted by performance.
+        """
+
+        rng = random.Random(f"{self.seed}-{discipline_code}-{male}")
+        index = int(discipline_code.rsplit("-", 1)[-1]) if discipline_code[-1].isdigit() else 0
+        distance = DISTANCES[index % len(DISTANCES)] * (index // len(DISTANCES) + 1)
+        base_performance = int(distance * (12 if male else 13.5))  # in hundredths
+        outdoor = "-i-" not in discipline_code
+
+        results: list[SyntheticResult] = []
+        for _ in range(self.results_per_discipline):
+            event = rng.randrange(len(self.years) * EVENTS_PER_YEAR)
+            age = rng.randint(MIN_AGE, MAX_AGE)
+            birth_year = self.get_event_date(event).year - age
+
+            # athletes are grouped by birth year, even indices belong to male athletes
+            athlete_offset = 2 * rng.randrange(ATHLETES_PER_BIRTH_YEAR // 2) + (0 if male else 1)
+            athlete = (birth_year - self._min_birth_year) * ATHLETES_PER_BIRTH_YEAR + athlete_offset
+
+            youth_penalty = 0.3 * max(0, 20 - age) / 12
+            performance = int(base_performance * (1 + youth_penalty + abs(rng.gauss(0, 0.08))))
+            results.append(
+                SyntheticResult(
+                    performance=performance,
+                    wind=round(rng.uniform(-2.5, 3.5), 1) if outdoor else None,
+                    homologated=rng.random() > 0.05,
+                    rank=f"{rng.randint(1, 8)}f{rng.randint(1, 4)}",
+                    athlete=athlete,
+                    event=event,
+                )
+            )
+        results.sort(key=lambda result: (result.performance, result.event, result.athlete))
+        return results
+
+    @staticmethod
+    def _render_link(page: str, key: str, code: str) -> str:
+        url = f"https://www.swiss-athletics.ch/de/{page}?&amp;mobile=false&amp;{key}={code}"
+        return f'<a href="#" class="ui-commandlink ui-widget" onclick="openURLForBestlist(\'{url}\'); return false;">'
+
+    @staticmethod
+    def _format_performance(performance: int) -> str:
+        minutes, hundredths = divmod(performance, 6000)
+        seconds, hundredths = divmod(hundredths, 100)
+        if minutes > 0:
+            return f"{minutes}:{seconds:02d}.{hundredths:02d}"
+        return f"{seconds}.{hundredths:02d}"
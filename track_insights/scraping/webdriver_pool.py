@@ -0,0 +1,174 @@
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Union
+
+from selenium.common.exceptions import WebDriverException
+from seleniumrequests import Chrome
+from track_insights.scraping.jsf_session import JsfSession
+
+logger = logging.getLogger(__name__)
+
+Driver = Union[Chrome, JsfSession]
+
+DEFAULT_MAX_USES = 50
+DEFAULT_MAX_IDLE = 2
+
+
+def is_healthy(driver: Driver) -> bool:
+    """
+    Check whether the driver is still usable.
+
+    :param driver: the driver to check.
+    :return: True if the driver responds, False otherwise.
+    """
+
+    if isinstance(driver, JsfSession):
+        return driver.view_state is not None
+    try:
+        _ = driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+
+class WebDriverPool:
+    """
+    Pool of pre-warmed drivers. All drivers in the pool are created by the same factory, hence they are in the same
+    (form) state. Drivers are health-checked before being handed out and recycled after a maximum number of uses.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Driver],
+        max_uses: int = DEFAULT_MAX_USES,
+        max_idle: int = DEFAULT_MAX_IDLE,
+        health_check: Callable[[Driver], bool] = is_healthy,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        :param factory: creates a new driver in the desired state.
+        :param max_uses: the number of times a driver is handed out before it is recycled.
+        :param max_idle: the maximum number of idle drivers that are kept.
+        :param health_check: checks whether a driver can be reused.
+        """
+
+        assert max_uses > 0, "Drivers must be usable at least once."
+
+        self.factory = factory
+        self.max_uses = max_uses
+        self.max_idle = max_idle
+        self.health_check = health_check
+
+        self._lock = threading.Lock()
+        self._idle: list[Driver] = []
+        self._uses: dict[int, int] = {}
+        self.created = 0
+        self.recycled = 0
+
+    def __enter__(self) -> "WebDriverPool":
+        return self
+
+    def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: Exception) -> None:
+        self.close()
+
+    def warm_up(self, amount: int = 1) -> None:
+        """
+        Create drivers ahead of time such that the first acquisitions do not pay for the startup.
+
+        :param amount: the number of idle drivers to have available.
+        """
+
+        while True:
+            with self._lock:
+                if len(self._idle) >= min(amount, self.max_idle):
+                    return
+            driver = self._create()
+            with self._lock:
+                self._idle.append(driver)
+
+    def acquire(self) -> Driver:
+        """
+        Hand out a healthy driver. Idle drivers are reused, otherwise a new driver is created.
+
+        :return: the driver.
+        """
+
+        while True:
+            with self._lock:
+                driver: Optional[Driver] = self._idle.pop() if len(self._idle) > 0 else None
+            if driver is None:
+                driver = self._create()
+                break
+            if self.health_check(driver):
+                break
+            logger.info("Discarding unhealthy driver.")
+            self._quit(driver)
+
+        with self._lock:
+            self._uses[id(driver)] += 1
+        return driver
+
+    def release(self, driver: Driver, healthy: bool = True) -> None:
+        """
+        Return a driver to the pool. Drivers that reached their maximum number of uses are recycled.
+
+        :param driver: the driver to return.
+        :param healthy: whether the driver can be reused (e.g., False after a connection error).
+        """
+
+        with self._lock:
+            reuse = healthy and self._uses.get(id(driver), self.max_uses) < self.max_uses
+            reuse &= len(self._idle) < self.max_idle
+            if reuse:
+                self._idle.append(driver)
+                return
+            self.recycled += 1
+        self._quit(driver)
+
+    def close(self) -> None:
+        """
+        Quit all idle drivers.
+        """
+
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._quit(driver)
+
+    def _create(self) -> Driver:
+        driver = self.factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.created += 1
+        return driver
+
+    def _quit(self, driver: Driver) -> None:
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as err:
+            logger.warning(f"Could not quit driver: {err}")
+
+
+@dataclass
+class DriverPools:
+    """
+    The pools of drivers used for scraping: the default pool holds drivers in "Alle Resultate" mode, while the drivers
+    of the exclusive pool additionally list results exclusively in the category of the athlete.
+    """
+
+    default: WebDriverPool
+    exclusive: WebDriverPool
+
+    def __enter__(self) -> "DriverPools":
+        return self
+
+    def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: Exception) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.default.close()
+        self.exclusive.close()
@@ -0,0 +1,44 @@
+import argparse
+import logging
+
+from track_insights.scraping.bestlist_server import BestlistServer
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="[%(asctime)s]  [%(filename)15s:%(lineno)4d] %(levelname)-8s %(message)s",
+    datefmt="%Y-%m-%d:%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """
+    Main function to serve a local stand-in of the bestlist with generated pages.
+    """
+
+    parser = argparse.ArgumentParser(description="TrackInsights - Local Bestlist Stand-In")
+
+    parser.add_argument("--host", type=str, default="localhost", help="The host to bind to.")
+    parser.add_argument("--port", type=int, default=8080, help="The port to bind to.")
+    parser.add_argument("--disciplines", type=int, default=10, help="Number of disciplines per gender and place.")
+    parser.add_argument("--years", type=int, default=5, help="Number of seasons with results.")
+    parser.add_argument("--results", type=int, default=2000, help="Number of results per discipline and gender.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated results.")
+
+    args = parser.parse_args()
+
+    generator = BestlistPageGenerator(args.disciplines, args.years, args.results, args.seed)
+    server = BestlistServer(generator, args.host, args.port)
+    logger.info(f"Serving the bestlist at {server.url}")
+    logger.info(f"Run the fetcher with TRACK_INSIGHTS_BASE_URL={server.url} to scrape this server.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping the server.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,16 @@
 import os
 
+from .archive_replayer import ArchiveReplayer  # noqa: F401
 from .bestlist_synchronizer import BestlistSynchronizer  # noqa: F401
+from .digest_store import DigestStore  # noqa: F401
 from .discipline_synchronizer import DisciplineSynchronizer  # noqa: F401
+from .entity_cache import CachedEntity, EntityCache  # noqa: F401
+from .metadata_catalogue import MetadataCatalogue  # noqa: F401
 from .metadata_synchronizer import MetadataSynchronizer  # noqa: F401
 from .record import Record  # noqa: F401
 from .record_collection import RecordCollection  # noqa: F401
+from .request_planner import PlannedRequest, RequestPlan, RequestPlanner  # noqa: F401
+from .sync_journal import SyncJournal  # noqa: F401
 from .synchronization_error import SynchronizationError  # noqa: F401
 from .synchronization_statistics import SynchronizationStatistics  # noqa: F401
 
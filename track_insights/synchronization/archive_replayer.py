@@ -0,0 +1,199 @@
+import functools
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Generator, Optional
+from urllib.parse import urlparse
+
+import pandas as pd
+from track_insights.common import ANOMALIES_PATH, current_time_millis
+from track_insights.database import DatabaseConnection
+from track_insights.database.models import Discipline
+from track_insights.scraping import BASE_URL, ArchivedPage, PageArchive, Scraper
+from track_insights.synchronization.bestlist_synchronizer import BestlistSynchronizer
+from track_insights.synchronization.metadata_synchronizer import MetadataSynchronizer
+from track_insights.synchronization.request_planner import MAX_AMOUNT
+from track_insights.synchronization.synchronization_error import SynchronizationError, SynchronizationErrorType
+from track_insights.synchronization.synchronization_statistics import SynchronizationStatistics
+
+logger = logging.getLogger(__name__)
+
+
+def parse_archived_page(page: ArchivedPage) -> Optional[pd.DataFrame]:
+    """
+    Read and parse an archived page (executed in the worker processes).
+
+    :param page: the archived page.
+    :return: the dataframe of the bestlist or None, if no results are found.
+    """
+
+    return Scraper.parse_bestlist(page.read())
+
+
+class ArchiveReplayer:
+    """
+    Synchronizes the database from the page archive instead of the bestlist, e.g., after the parser or the validation
+    of records changed. For every bestlist, the most recently archived page is replayed. The pages of a discipline are
+    replayed in the order they were fetched. Pages are parsed in worker processes, while the database is only written
+    by the calling process. Unchanged pages are replayed as well, hence the digest store is not consulted.
+    """
+
+    def __init__(self, config: dict, archive: PageArchive, ignored_entries: set[str]) -> None:
+        """
+        Initialize the replayer.
+
+        :param config: the system configuration.
+        :param archive: the archive to replay.
+        :param ignored_entries: the set of ignored records.
+        """
+
+        self.config = config
+        self.ignored_entries = ignored_entries
+
+        # pages of a different bestlist (e.g., the stand-in server) are not replayed
+        source = urlparse(BASE_URL).netloc
+        latest_pages: dict[tuple, ArchivedPage] = {}
+        for page in archive.iter_pages():
+            if page.source != source:
+                continue
+            unit_key = page.get_unit_key()
+            if unit_key not in latest_pages or latest_pages[unit_key].fetched_at <= page.fetched_at:
+                latest_pages[unit_key] = page
+        self.pages = sorted(latest_pages.values(), key=lambda archived_page: archived_page.fetched_at)
+
+    def get_disciplines(
+        self,
+        discipline_name: Optional[str] = None,
+        year: Optional[int] = None,
+        indoor: Optional[bool] = None,
+        male: Optional[bool] = None,
+    ) -> list[Discipline]:
+        """
+        Get the disciplines with archived pages that match the provided filters. Disciplines that are not registered
+        (e.g., when rebuilding an empty database) are registered, ignored disciplines are skipped.
+
+        :param discipline_name: discipline name to filter or ALL if not provided.
+        :param year: year to filter disciplines (ALL if not provided).
+        :param indoor: filter by indoor or outdoor results (Both if not provided).
+        :param male: whether to only consider male athletes (Both genders if not provided).
+        :return: list of all disciplines that match the provided filters.
+        """
+
+        archived_disciplines: dict[tuple[str, bool, bool], str] = {}
+        for page in self._filter_pages(year=year, indoor=indoor, male=male):
+            if discipline_name is None or page.discipline_name == discipline_name:
+                archived_disciplines[(page.discipline_code, page.indoor, page.male)] = page.discipline_name
+
+        disciplines: list[Discipline] = []
+        with DatabaseConnection(self.config) as database:
+            for (code, indoor_val, male_val), name in archived_disciplines.items():
+                discipline: Optional[Discipline] = (
+                    database.session.query(Discipline)
+                    .filter(
+                        Discipline.discipline_code == code,
+                        Discipline.indoor.is_(indoor_val),
+                        Discipline.male.is_(male_val),
+                    )
+                    .first()
+                )
+                if discipline is None:
+                    discipline = MetadataSynchronizer.register_discipline(
+                        database.session, name, code, indoor_val, male_val
+                    )
+                if not discipline.ignore:
+                    disciplines.append(discipline)
+            database.session.commit()
+            for discipline in disciplines:
+                database.session.refresh(discipline)
+        return disciplines
+
+    def replay(
+        self, disciplines: list[Discipline], year: Optional[int] = None, num_workers: int = 1
+    ) -> Generator[Callable[[], SynchronizationStatistics], None, None]:
+        """
+        Replay the archived pages of the disciplines. All pages are submitted for parsing upfront, such that the
+        workers parse ahead while the disciplines are synchronized.
+
+        :param disciplines: the disciplines to replay.
+        :param year: (Optional) the year to replay, otherwise all years are replayed.
+        :param num_workers: the number of processes parsing the pages.
+        :return: generator of outcomes, calling an outcome synchronizes the next discipline.
+        """
+
+        discipline_pages = [self._filter_pages(discipline, year) for discipline in disciplines]
+        if num_workers <= 1:
+            for discipline, pages in zip(disciplines, discipline_pages):
+                bestlists: list[Callable[[], Optional[pd.DataFrame]]] = [
+                    functools.partial(parse_archived_page, page) for page in pages
+                ]
+                yield functools.partial(self.replay_discipline, discipline, pages, bestlists)
+            return
+
+        executor = ProcessPoolExecutor(max_workers=num_workers)
+        try:
+            futures: list[list[Future[Optional[pd.DataFrame]]]] = [
+                [executor.submit(parse_archived_page, page) for page in pages] for pages in discipline_pages
+            ]
+            for discipline, pages, page_futures in zip(disciplines, discipline_pages, futures):
+                bestlists = [page_future.result for page_future in page_futures]
+                yield functools.partial(self.replay_discipline, discipline, pages, bestlists)
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    def replay_discipline(
+        self,
+        discipline: Discipline,
+        pages: list[ArchivedPage],
+        bestlists: list[Callable[[], Optional[pd.DataFrame]]],
+    ) -> SynchronizationStatistics:
+        """
+        Synchronize the archived pages of a discipline with the database.
+
+        :param discipline: the discipline.
+        :param pages: the archived pages of the discipline in the order they are replayed.
+        :param bestlists: the (deferred) parsed bestlists of the pages.
+        :return: the synchronization statistics.
+        """
+
+        stripped_name = discipline.config.name.replace(" ", "")
+        error_file_path = ANOMALIES_PATH / f"{stripped_name}_{current_time_millis()}_errors.json"
+
+        agg_statistics = SynchronizationStatistics()
+        for page, get_bestlist in zip(pages, bestlists):
+            scrape_config = page.get_scrape_config(discipline)
+            try:
+                bestlist = get_bestlist()
+                if bestlist is None:
+                    continue
+                if len(bestlist.index) >= page.amount and page.amount < MAX_AMOUNT:
+                    # the run was interrupted before the truncated page was requested completely
+                    logger.warning(f"Skipping truncated archived page of {scrape_config}.")
+                    continue
+                processor = BestlistSynchronizer(self.config, scrape_config, bestlist)
+                agg_statistics.add(processor.synchronize(error_file_path, self.ignored_entries))
+            except Exception as err:
+                raise SynchronizationError(
+                    f"Replaying discipline {discipline.config.name} stopped due to an exception. "
+                    f"Current scrape config: {scrape_config}. {err}",
+                    SynchronizationErrorType.UNKNOWN,
+                ) from err
+        return agg_statistics
+
+    def _filter_pages(
+        self,
+        discipline: Optional[Discipline] = None,
+        year: Optional[int] = None,
+        indoor: Optional[bool] = None,
+        male: Optional[bool] = None,
+    ) -> list[ArchivedPage]:
+        return [
+            page
+            for page in self.pages
+            if (
+                discipline is None
+                or (page.discipline_code, page.indoor, page.male)
+                == (discipline.discipline_code, discipline.indoor, discipline.male)
+            )
+            and (year is None or page.year == year)
+            and (indoor is None or page.indoor == indoor)
+            and (male is None or page.male == male)
+        ]
@@ -1,21 +1,29 @@
 import logging
 import pathlib
-from typing import Optional
+from datetime import date
+from typing import Any, Callable, Iterable, Optional
 
+import numpy as np
 import pandas as pd
 import sqlalchemy
 from sqlalchemy import and_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm.interfaces import ORMOption
 from track_insights.database import DatabaseConnection
 from track_insights.database.models import Athlete, Club, Discipline, Event, Result
 from track_insights.scores import ScoreList
 from track_insights.scraping import BestlistCategory, BestlistColumn, ScrapeConfig
-from track_insights.synchronization.record import Record
+from track_insights.synchronization.digest_store import DigestStore
+from track_insights.synchronization.entity_cache import CachedEntity, EntityCache
+from track_insights.synchronization.record import DATABASE_COLUMNS, Record
 from track_insights.synchronization.record_collection import RecordCollection
 from track_insights.synchronization.synchronization_statistics import SynchronizationStatistics
 
 logger = logging.getLogger(__name__)
 
+IN_CHUNK_SIZE = 500  # maximum number of keys per IN-clause
+INSERT_CHUNK_SIZE = 1000  # maximum number of rows per INSERT-statement
+
 
 class BestlistSynchronizer:
     """
@@ -40,6 +48,7 @@ class BestlistSynchronizer:
         self.original_bestlist = bestlist.drop(columns=[BestlistColumn.NUMBER])  # We do not need the bestlist rank
         self.bl_limit_reached = len(self.original_bestlist.index) == self.scrape_config.amount
         self.verbose = verbose
+        self.entity_cache = EntityCache.from_config(config)
 
     # pylint: disable=too-many-branches,too-many-locals,too-many-statements
     def synchronize(self, anomaly_path: pathlib.Path, ignored_entries: set[str]) -> SynchronizationStatistics:
@@ -64,31 +73,78 @@ class BestlistSynchronizer:
         if not bestlist_records.sanity_check_results(ascending):
             raise ValueError("Results are not monotonically increasing/decreasing")
 
-        # read the corresponding records from the database
-        database_records = self._fetch_records_from_database(
-            self.scrape_config.discipline, bestlist_records[-1].performance if len(bestlist_records) > 0 else None
+        # results matching the fingerprint of a bestlist record are unchanged, hence only their fingerprints are read
+        last_performance = int(bestlist_records.performances[-1]) if len(bestlist_records) > 0 else None
+        stored_fingerprints = self._fetch_fingerprints_from_database(self.scrape_config.discipline, last_performance)
+        bestlist_records.sort_records(ascending)
+        bestlist_records, unmatched_ids = BestlistSynchronizer._match_fingerprints(
+            bestlist_records, stored_fingerprints
         )
 
-        bestlist_records.sort_records(ascending)
+        # the remaining results are read completely and compared to the remaining bestlist records
+        database_records = self._fetch_records_from_database(
+            self.scrape_config.discipline, last_performance, unmatched_ids
+        )
         database_records.sort_records(ascending)
         with DatabaseConnection(self.config) as database:
             insertion_mask, deletion_mask, similarities = self._compare_records(
-                bestlist_records, database_records, ascending
+                bestlist_records, database_records, ascending, last_performance
             )
 
             # if we did not find exact match of the bestlist record, we greedily search for a similar database record.
-            total_updates = 0
+            updates: list[tuple[int, int]] = []
             for bl_idx, db_idx in similarities:
                 if insertion_mask[bl_idx] and deletion_mask[db_idx]:
                     # we found a corresponding mapping and apply the update, which saves us a delete and insert.
                     insertion_mask[bl_idx] = False
                     deletion_mask[db_idx] = False
+                    updates.append((bl_idx, db_idx))
 
-                    result: Result = database.session.get(Result, database_records[db_idx].id)
-                    total_updates += self._update_entries(
-                        result.athlete, result.club, result.event, bestlist_records[bl_idx]
-                    )
-                    database.session.flush()
+            # the updated results are loaded together with their entries, the changes are flushed in batches
+            updated_results: dict[int, Result] = BestlistSynchronizer._fetch_by_keys(
+                database.session,
+                Result,
+                Result.id,
+                [database_records[db_idx].id for _, db_idx in updates],
+                joinedload(Result.athlete),
+                joinedload(Result.club),
+                joinedload(Result.event),
+            )
+            total_updates = 0
+            updated_fingerprints: list[dict[str, Any]] = []
+            for bl_idx, db_idx in updates:
+                result = updated_results[database_records[db_idx].id]
+                total_updates += self._update_entries(
+                    result.athlete, result.club, result.event, bestlist_records[bl_idx]
+                )
+                updated_fingerprints.append(
+                    {"id": result.id, "fingerprint": bestlist_records[bl_idx].get_fingerprint()}
+                )
+
+            # results that equal a bestlist record, but whose stored fingerprint is outdated (e.g., since an entry was
+            # renamed by another result), receive the fingerprint of the bestlist record as well
+            kept_records = [
+                record
+                for record, delete in zip(database_records.records, deletion_mask)
+                if not delete and record.id not in updated_results
+            ]
+            if len(kept_records) > 0:
+                bestlist_fingerprints = set(bestlist_records.get_fingerprints().tolist())
+                for record in kept_records:
+                    fingerprint = record.get_fingerprint()
+                    if fingerprint in bestlist_fingerprints and fingerprint != stored_fingerprints[record.id]:
+                        updated_fingerprints.append({"id": record.id, "fingerprint": fingerprint})
+            database.session.flush()
+            self._cache_entities(
+                database.session,
+                [result.athlete for result in updated_results.values()],
+                [result.club for result in updated_results.values()],
+                [result.event for result in updated_results.values()],
+            )
+            for start in range(0, len(updated_fingerprints), INSERT_CHUNK_SIZE):
+                database.session.execute(
+                    sqlalchemy.update(Result), updated_fingerprints[start : start + INSERT_CHUNK_SIZE]
+                )
 
             # delete records
             deleted_records: list[Record] = []
@@ -101,7 +157,10 @@ class BestlistSynchronizer:
                 deleted_records.append(delete_record)
                 deletion_keys.append(delete_record.id)
 
-            database.session.query(Result).filter(Result.id.in_(deletion_keys)).delete(False)
+            if len(deletion_keys) > 0:
+                database.session.query(Result).filter(Result.id.in_(deletion_keys)).delete(False)
+                # the digests of the other pages of the discipline no longer reflect the database
+                DigestStore.clear(database.session, self.scrape_config.discipline)
 
             # insert records
             insertion_records = [record for record, insert in zip(bestlist_records.records, insertion_mask) if insert]
@@ -130,61 +189,34 @@ class BestlistSynchronizer:
         :return: synchronization statistics.
         """
 
-        added_results, added_athletes, added_clubs, added_events = 0, 0, 0, 0
         total_modifications = 0
 
         score_list: Optional[ScoreList] = None
         if discipline.score_identifier is not None and len(records) > 0:
             score_list = ScoreList(discipline)
 
-        # check whether we need to insert new athletes, clubs or event then we apply the value updates from the bestlist
+        # resolve the athletes, clubs and events of all records at once, the missing ones are inserted beforehand.
+        # Cached entries that the records do not update are not loaded from the database.
+        athlete_ids, athletes, added_athletes = self._resolve_athletes(session, records)
+        club_ids, clubs, added_clubs = self._resolve_clubs(session, records)
+        event_ids, events, added_events = self._resolve_events(session, records)
+
+        # we apply the value updates from the bestlist and collect the new results
+        new_results: list[dict[str, Any]] = []
+        manual_keys: set[tuple] = set()
         for record in records:
-            athlete: Athlete = session.query(Athlete).filter(Athlete.athlete_code == record.athlete_code).first()
             result_date = record.event_date
-            if not athlete:
-                # insert new athlete
-                added_athletes += 1
-                athlete = Athlete(
-                    name=record.athlete,
-                    birthdate=record.birthdate,
-                    nationality=record.nationality,
-                    athlete_code=record.athlete_code,
-                    latest_date=result_date,
-                )
-                session.add(athlete)
-
-            club_code = record.club_code
-
-            club: Club
-            existing_club: Optional[Club]
-            if club_code != "":
-                existing_club = session.query(Club).filter(Club.club_code == club_code).first()
-            else:
-                existing_club = session.query(Club).filter(Club.name == record.club).first()
-            if existing_club is not None:
-                club = existing_club
-            else:
-                # insert new club
-                added_clubs += 1
-                club = Club(
-                    name=record.club,
-                    club_code=club_code or None,
-                    latest_date=result_date,
-                )
-                session.add(club)
-
-            event: Event = session.query(Event).filter(Event.event_code == record.event_code).first()
-            if not event:
-                # insert new event
-                added_events += 1
-                event = Event(
-                    name=record.event,
-                    event_code=record.event_code,
-                    latest_date=result_date,
-                )
-                session.add(event)
-
-            total_modifications += self._update_entries(athlete, club, event, record)
+            club_key = BestlistSynchronizer._get_club_key(record)
+            athlete_id = athlete_ids[record.athlete_code]
+            club_id = club_ids[club_key]
+            event_id = event_ids[record.event_code]
+
+            if record.athlete_code in athletes:
+                total_modifications += BestlistSynchronizer._update_athlete(athletes[record.athlete_code], record)
+            if club_key in clubs:
+                total_modifications += BestlistSynchronizer._update_club(clubs[club_key], record)
+            if record.event_code in events:
+                total_modifications += BestlistSynchronizer._update_event(events[record.event_code], record)
 
             # Some results are present in the wrong category. We account for this case by searching the corresponding
             # result in our database. If it is not found, we tag the result as being inserted manually.
@@ -192,13 +224,28 @@ class BestlistSynchronizer:
             manual = False
             if diff < age_bounds[0] or diff >= age_bounds[1]:
                 manual = True
+                # the key consists of the same fields as the query below
+                manual_key = (
+                    athlete_id,
+                    club_id,
+                    event_id,
+                    record.performance,
+                    record.wind,
+                    record.rank,
+                    record.location,
+                    result_date,
+                    not record.not_homologated,
+                )
+                if manual_key in manual_keys:
+                    # the result is already inserted by this page
+                    continue
                 found_result = (
                     session.query(Result)
                     .filter(
                         Result.discipline_id == discipline.id,
-                        Result.athlete_id == athlete.id,
-                        Result.club_id == club.id,
-                        Result.event_id == event.id,
+                        Result.athlete_id == athlete_id,
+                        Result.club_id == club_id,
+                        Result.event_id == event_id,
                         Result.performance == record.performance,
                         Result.wind == record.wind,
                         Result.rank == record.rank,
@@ -210,28 +257,34 @@ class BestlistSynchronizer:
                 )
                 if found_result:
                     found_result.manual = True
-                    session.flush()
                     continue
+                manual_keys.add(manual_key)
 
             # otherwise, we insert a new result
-            result = Result(
-                athlete=athlete,
-                club=club,
-                event=event,
-                discipline_id=discipline.id,
-                performance=record.performance,
-                wind=record.wind,
-                rank=record.rank,
-                location=record.location,
-                date=result_date,
-                homologated=not record.not_homologated,
-                manual=manual,
-                points=score_list.find_score(record.performance) if score_list is not None else 0,
+            new_results.append(
+                {
+                    "athlete_id": athlete_id,
+                    "club_id": club_id,
+                    "event_id": event_id,
+                    "discipline_id": discipline.id,
+                    "performance": record.performance,
+                    "wind": record.wind,
+                    "rank": record.rank,
+                    "location": record.location,
+                    "date": result_date,
+                    "homologated": not record.not_homologated,
+                    "manual": manual,
+                    "points": score_list.find_score(record.performance) if score_list is not None else 0,
+                    "fingerprint": record.get_fingerprint(),
+                }
             )
 
-            added_results += 1
-            session.add(result)
-            session.flush()
+        # the new results are inserted in chunks of a single statement each
+        for start in range(0, len(new_results), INSERT_CHUNK_SIZE):
+            session.execute(sqlalchemy.insert(Result), new_results[start : start + INSERT_CHUNK_SIZE])
+        added_results = len(new_results)
+
+        self._cache_entities(session, athletes.values(), clubs.values(), events.values())
 
         return SynchronizationStatistics(
             added_records=added_results,
@@ -241,94 +294,336 @@ class BestlistSynchronizer:
             updates=total_modifications,
         )
 
-    # pylint: disable=too-many-locals
+    def _resolve_athletes(
+        self, session: Session, records: list[Record]
+    ) -> tuple[dict[str, int], dict[str, Athlete], int]:
+        """
+        Resolve the athletes of the records and insert the missing ones. A new athlete is initialized from its first
+        record. Cached athletes that are not updated by the records are not loaded.
+
+        :param session: the database session.
+        :param records: the records.
+        :return: the ids by code, the loaded athletes by code and the number of inserted athletes.
+        """
+
+        records_by_code: dict[str, list[Record]] = {}
+        for record in records:
+            records_by_code.setdefault(record.athlete_code, []).append(record)
+
+        athlete_ids = self._get_cached_ids(
+            Athlete.__tablename__, records_by_code, BestlistSynchronizer._get_athlete_values
+        )
+        codes = [code for code in records_by_code if code not in athlete_ids]
+        athletes = BestlistSynchronizer._fetch_by_keys(session, Athlete, Athlete.athlete_code, codes)
+        missing_codes = [code for code in codes if code not in athletes]
+        if len(missing_codes) > 0:
+            session.execute(
+                sqlalchemy.insert(Athlete),
+                [
+                    {
+                        "name": records_by_code[code][0].athlete,
+                        "birthdate": records_by_code[code][0].birthdate,
+                        "nationality": records_by_code[code][0].nationality,
+                        "athlete_code": code,
+                        "latest_date": records_by_code[code][0].event_date,
+                    }
+                    for code in missing_codes
+                ],
+            )
+            athletes.update(BestlistSynchronizer._fetch_by_keys(session, Athlete, Athlete.athlete_code, missing_codes))
+        athlete_ids.update((code, athlete.id) for code, athlete in athletes.items())
+        return athlete_ids, athletes, len(missing_codes)
+
+    def _resolve_clubs(self, session: Session, records: list[Record]) -> tuple[dict[str, int], dict[str, Club], int]:
+        """
+        Resolve the clubs of the records and insert the missing ones. Clubs are identified by their code or, if the
+        bestlist does not provide a code, by their name. A new club is initialized from its first record. Cached clubs
+        that are not updated by the records are not loaded, clubs without a code are never cached.
+
+        :param session: the database session.
+        :param records: the records.
+        :return: the ids by key (see _get_club_key), the loaded clubs by key and the number of inserted clubs.
+        """
+
+        records_by_key: dict[str, list[Record]] = {}
+        for record in records:
+            records_by_key.setdefault(BestlistSynchronizer._get_club_key(record), []).append(record)
+
+        club_ids = self._get_cached_ids(
+            Club.__tablename__,
+            {key: key_records for key, key_records in records_by_key.items() if key_records[0].club_code != ""},
+            BestlistSynchronizer._get_club_values,
+        )
+        first_records = {key: key_records[0] for key, key_records in records_by_key.items() if key not in club_ids}
+
+        def fetch_clubs(club_codes: list[str], club_names: list[str]) -> dict[str, Club]:
+            clubs = BestlistSynchronizer._fetch_by_keys(session, Club, Club.club_code, club_codes)
+            clubs_by_name = BestlistSynchronizer._fetch_by_keys(session, Club, Club.name, club_names)
+            clubs.update((f"name:{name}", club) for name, club in clubs_by_name.items())
+            return clubs
+
+        clubs = fetch_clubs(
+            [record.club_code for record in first_records.values() if record.club_code != ""],
+            [record.club for record in first_records.values() if record.club_code == ""],
+        )
+
+        # since club names are unique, a club without a code that is not found by its name is the club of the same
+        # name that has a code on this page (whether it is resolved or about to be inserted)
+        coded_keys = {record.club: key for key, record in first_records.items() if record.club_code != ""}
+        shared_keys = {
+            key: coded_keys[record.club]
+            for key, record in first_records.items()
+            if record.club_code == "" and key not in clubs and record.club in coded_keys
+        }
+        missing_keys = [key for key in first_records if key not in clubs and key not in shared_keys]
+        if len(missing_keys) > 0:
+            session.execute(
+                sqlalchemy.insert(Club),
+                [
+                    {
+                        "name": first_records[key].club,
+                        "club_code": first_records[key].club_code or None,
+                        "latest_date": first_records[key].event_date,
+                    }
+                    for key in missing_keys
+                ],
+            )
+            clubs.update(
+                fetch_clubs(
+                    [first_records[key].club_code for key in missing_keys if first_records[key].club_code != ""],
+                    [first_records[key].club for key in missing_keys if first_records[key].club_code == ""],
+                )
+            )
+        clubs.update((key, clubs[coded_key]) for key, coded_key in shared_keys.items())
+        club_ids.update((key, club.id) for key, club in clubs.items())
+        return club_ids, clubs, len(missing_keys)
+
+    def _resolve_events(self, session: Session, records: list[Record]) -> tuple[dict[str, int], dict[str, Event], int]:
+        """
+        Resolve the events of the records and insert the missing ones. A new event is initialized from its first
+        record. Cached events that are not updated by the records are not loaded.
+
+        :param session: the database session.
+        :param records: the records.
+        :return: the ids by code, the loaded events by code and the number of inserted events.
+        """
+
+        records_by_code: dict[str, list[Record]] = {}
+        for record in records:
+            records_by_code.setdefault(record.event_code, []).append(record)
+
+        event_ids = self._get_cached_ids(Event.__tablename__, records_by_code, BestlistSynchronizer._get_event_values)
+        codes = [code for code in records_by_code if code not in event_ids]
+        events = BestlistSynchronizer._fetch_by_keys(session, Event, Event.event_code, codes)
+        missing_codes = [code for code in codes if code not in events]
+        if len(missing_codes) > 0:
+            session.execute(
+                sqlalchemy.insert(Event),
+                [
+                    {
+                        "name": records_by_code[code][0].event,
+                        "event_code": code,
+                        "latest_date": records_by_code[code][0].event_date,
+                    }
+                    for code in missing_codes
+                ],
+            )
+            events.update(BestlistSynchronizer._fetch_by_keys(session, Event, Event.event_code, missing_codes))
+        event_ids.update((code, event.id) for code, event in events.items())
+        return event_ids, events, len(missing_codes)
+
+    def _get_cached_ids(
+        self, kind: str, records_by_code: dict[str, list[Record]], get_values: Callable[[Record], tuple]
+    ) -> dict[str, int]:
+        """
+        Get the ids of the cached entities which none of their records updates, i.e., all records are older than the
+        latest date of the entity or they are of the same date and do not change the values of the entity.
+
+        :param kind: the kind of the entities.
+        :param records_by_code: the records grouped by the code of their entity.
+        :param get_values: function extracting the values of the entity from a record.
+        :return: the ids by code.
+        """
+
+        if self.entity_cache is None:
+            return {}
+
+        entity_ids: dict[str, int] = {}
+        for code, code_records in records_by_code.items():
+            cached = self.entity_cache.get(kind, code)
+            if cached is not None and all(
+                record.event_date < cached.latest_date
+                or (record.event_date == cached.latest_date and get_values(record) == cached.values)
+                for record in code_records
+            ):
+                entity_ids[code] = cached.id
+        return entity_ids
+
+    def _cache_entities(
+        self, session: Session, athletes: Iterable[Athlete], clubs: Iterable[Club], events: Iterable[Event]
+    ) -> None:
+        """
+        Stage the current state of the entities in the cache, which becomes visible once the session is committed.
+
+        :param session: the database session.
+        :param athletes: the athletes.
+        :param clubs: the clubs.
+        :param events: the events.
+        """
+
+        if self.entity_cache is None:
+            return
+
+        for athlete in athletes:
+            values = (athlete.name, athlete.birthdate, athlete.nationality)
+            snapshot = CachedEntity(athlete.id, athlete.latest_date, values)
+            self.entity_cache.stage(session, Athlete.__tablename__, athlete.athlete_code, snapshot)
+        for club in clubs:
+            if club.club_code:
+                snapshot = CachedEntity(club.id, club.latest_date, (club.name,))
+                self.entity_cache.stage(session, Club.__tablename__, club.club_code, snapshot)
+        for event in events:
+            snapshot = CachedEntity(event.id, event.latest_date, (event.name,))
+            self.entity_cache.stage(session, Event.__tablename__, event.event_code, snapshot)
+
+    @staticmethod
+    def _get_athlete_values(record: Record) -> tuple:
+        return record.athlete, record.birthdate, record.nationality
+
+    @staticmethod
+    def _get_club_values(record: Record) -> tuple:
+        return (record.club,)
+
+    @staticmethod
+    def _get_event_values(record: Record) -> tuple:
+        return (record.event,)
+
+    @staticmethod
+    def _get_club_key(record: Record) -> str:
+        return record.club_code if record.club_code != "" else f"name:{record.club}"
+
+    @staticmethod
+    def _fetch_by_keys(
+        session: Session, model: Any, column: Any, keys: Iterable[Any], *options: ORMOption
+    ) -> dict[Any, Any]:
+        """
+        Fetch the entries whose column matches one of the keys. The keys are queried in chunks, such that the number
+        of bound parameters stays within the limits of the database. If multiple entries match a key, the first
+        inserted entry is returned.
+
+        :param session: the database session.
+        :param model: the model of the entries.
+        :param column: the column holding the keys.
+        :param keys: the keys.
+        :param options: the loader options of the query (e.g., to eagerly load relationships).
+        :return: the entries by key.
+        """
+
+        keys = list(keys)
+        entries: dict[Any, Any] = {}
+        for start in range(0, len(keys), IN_CHUNK_SIZE):
+            chunk = keys[start : start + IN_CHUNK_SIZE]
+            query = session.query(model).options(*options).filter(column.in_(chunk))
+            for entry in query.order_by(model.id.desc()):
+                entries[getattr(entry, column.key)] = entry
+        return entries
+
+    @staticmethod
+    def _match_fingerprints(
+        bl_records: RecordCollection, stored_fingerprints: dict[int, Optional[int]]
+    ) -> tuple[RecordCollection, list[int]]:
+        """
+        Matches the bestlist records to the stored results by their fingerprint. A matched result is unchanged, hence
+        neither the result nor the bestlist record need to be synchronized. Duplicates of a matched bestlist record are
+        dropped.
+
+        :param bl_records: the records from the bestlist.
+        :param stored_fingerprints: the fingerprints of the stored results by id (None, if not yet computed).
+        :return: the unmatched bestlist records and the ids of the unmatched results (both in their original order).
+        """
+
+        results_by_fingerprint: dict[Optional[int], list[int]] = {}
+        for result_id, fingerprint in stored_fingerprints.items():
+            results_by_fingerprint.setdefault(fingerprint, []).append(result_id)
+
+        matched_fingerprints: set[int] = set()
+        unmatched_indices: list[int] = []
+        for bl_idx, fingerprint in enumerate(bl_records.get_fingerprints().tolist()):
+            if fingerprint in matched_fingerprints:
+                continue
+            if len(results_by_fingerprint.get(fingerprint, [])) > 0:
+                results_by_fingerprint[fingerprint].pop(0)
+                matched_fingerprints.add(fingerprint)
+            else:
+                unmatched_indices.append(bl_idx)
+
+        unmatched_ids = sorted(result_id for result_ids in results_by_fingerprint.values() for result_id in result_ids)
+        return bl_records.take(unmatched_indices), unmatched_ids
+
     def _compare_records(
-        self, bl_records: RecordCollection, db_records: RecordCollection, ascending: bool
+        self,
+        bl_records: RecordCollection,
+        db_records: RecordCollection,
+        ascending: bool,
+        last_performance: Optional[int] = None,
     ) -> tuple[list[bool], list[bool], list[tuple[int, int]]]:
         """
         Compares the bestlist records to the database records.
         This method returns the insertion mask (for the bestlist records), the deletion mask (for the database records),
         and a list of (bl_record, db_record)-pairs consisting of bestlist and database records, which capture the same
-        underlying result. Note that both record arrays must be sorted in descending performance order.
+        underlying result. Records are matched by their (similarity) fingerprint, equal database records are matched in
+        their order. The pairs are ordered by the bestlist records and then by the database records.
 
         :param bl_records: the records from the bestlist.
         :param db_records: the records from the database.
         :param ascending: whether higher results are considered better.
+        :param last_performance: the last performance of the bestlist (defaults to the one of the last record).
         :return: list of pairs of indices from the bestlist and database.
         """
 
-        amount_bestlist_records = len(bl_records)
-        amount_database_records = len(db_records)
-
-        insertion_mask = [True for _ in range(amount_bestlist_records)]
-        deletion_mask = [True for _ in range(amount_database_records)]
+        insertion_mask = [True for _ in range(len(bl_records))]
+        deletion_mask = [True for _ in range(len(db_records))]
 
-        curr_bl_idx = 0
-        curr_db_idx = 0
+        equal_records: dict[int, list[int]] = {}
+        similar_records: dict[int, list[int]] = {}
+        for db_idx, (fingerprint, similarity_fingerprint) in enumerate(
+            zip(db_records.get_fingerprints().tolist(), db_records.get_similarity_fingerprints().tolist())
+        ):
+            equal_records.setdefault(fingerprint, []).append(db_idx)
+            similar_records.setdefault(similarity_fingerprint, []).append(db_idx)
 
-        # list of 'similar' records from the bestlist and database.
-        similar_records: list[tuple[int, int]] = []
-        while curr_bl_idx < amount_bestlist_records:
-            curr_bl_record = bl_records[curr_bl_idx]
+        bl_fingerprints: set[int] = set()
+        similarities: list[tuple[int, int]] = []
+        for bl_idx, fingerprint in enumerate(bl_records.get_fingerprints().tolist()):
+            bl_record = bl_records[bl_idx]
 
             # check whether the bestlist contains duplicates
-            prev_bl_idx = curr_bl_idx - 1
-            if prev_bl_idx >= 0 and bl_records[prev_bl_idx] == curr_bl_record:
-                insertion_mask[curr_bl_idx] = False
-                curr_bl_idx += 1
-                continue
-            if curr_db_idx >= amount_database_records:
-                curr_bl_idx += 1
-                continue
-
-            curr_db_record = db_records[curr_db_idx]
-
-            # check if a match is even possible (same performance for bestlist and database record).
-            curr_bl_result = curr_bl_record.performance
-            curr_db_result = curr_db_record.performance
-            if ((curr_db_result > curr_bl_result) and ascending) or (
-                (curr_db_result < curr_bl_result) and not ascending
-            ):
-                curr_bl_idx += 1
+            if fingerprint in bl_fingerprints:
+                insertion_mask[bl_idx] = False
                 continue
+            bl_fingerprints.add(fingerprint)
 
-            if ((curr_bl_result > curr_db_result) and ascending) or (
-                (curr_bl_result < curr_db_result) and not ascending
-            ):
-                curr_db_idx += 1
+            if len(equal_records.get(fingerprint, [])) > 0:
+                # an exact match is found, no need to insert or delete.
+                insertion_mask[bl_idx] = False
+                deletion_mask[equal_records[fingerprint].pop(0)] = False
                 continue
 
-            # here: curr_bl_result == curr_db_result
-            # find the database record that matches the bestlist record.
-            next_db_idx = curr_db_idx
-            while next_db_idx < amount_database_records and db_records[next_db_idx].performance == curr_bl_result:
-                next_db_record = db_records[next_db_idx]
-                if curr_bl_record == next_db_record:
-                    # an exact match is found, no need to insert or delete.
-                    insertion_mask[curr_bl_idx] = False
-                    deletion_mask[next_db_idx] = False
-
-                    if next_db_idx == curr_db_idx:
-                        # in this case, we can safely proceed to the next database index.
-                        curr_db_idx += 1
-                    break
-                if curr_bl_record.is_similar(next_db_record):
-                    # all attributes regarding the result are equal, add to the similarity list.
-                    similar_records.append((curr_bl_idx, next_db_idx))
-                next_db_idx += 1
-
-            # in any case, we proceed with the next bestlist record.
-            curr_bl_idx += 1
+            # all attributes regarding the result are equal, add to the similarity list.
+            for db_idx in similar_records.get(bl_record.get_similarity_fingerprint(), []):
+                if bl_record.is_similar(db_records[db_idx]):
+                    similarities.append((bl_idx, db_idx))
 
         # cannot safely delete records that are out of bestlist range
-        if self.bl_limit_reached:
-            last_bl_result = bl_records[-1].performance
-            for i in range(amount_database_records):
-                db_result = db_records[amount_database_records - 1 - i].performance
-                if (db_result >= last_bl_result and ascending) or (db_result <= last_bl_result and not ascending):
-                    deletion_mask[amount_database_records - 1 - i] = False
+        if last_performance is None and len(bl_records) > 0:
+            last_performance = int(bl_records.performances[-1])
+        if self.bl_limit_reached and last_performance is not None:
+            db_results = db_records.performances
+            out_of_range = db_results >= last_performance if ascending else db_results <= last_performance
+            for db_idx in np.flatnonzero(out_of_range).tolist():
+                deletion_mask[db_idx] = False
 
-        return insertion_mask, deletion_mask, similar_records
+        return insertion_mask, deletion_mask, similarities
 
     @staticmethod
     def _update_entries(athlete: Athlete, club: Club, event: Event, record: Record) -> int:
@@ -344,9 +639,24 @@ class BestlistSynchronizer:
         :return: the total number of performed updates.
         """
 
-        result_date = record.event_date
+        return (
+            BestlistSynchronizer._update_athlete(athlete, record)
+            + BestlistSynchronizer._update_club(club, record)
+            + BestlistSynchronizer._update_event(event, record)
+        )
+
+    @staticmethod
+    def _update_athlete(athlete: Athlete, record: Record) -> int:
+        """
+        Update an athlete according to a record from the bestlist (see _update_entries).
+
+        :param athlete: the athlete.
+        :param record: the record.
+        :return: the number of performed updates.
+        """
+
         amount_updates = 0
-        if result_date >= athlete.latest_date:
+        if record.event_date >= athlete.latest_date:
             if athlete.name != record.athlete:
                 athlete.name = record.athlete
                 amount_updates += 1
@@ -356,59 +666,145 @@ class BestlistSynchronizer:
             if athlete.nationality != record.nationality:
                 athlete.nationality = record.nationality
                 amount_updates += 1
-            athlete.latest_date = result_date
+            athlete.latest_date = record.event_date
+        return amount_updates
 
-        if result_date >= club.latest_date:
+    @staticmethod
+    def _update_club(club: Club, record: Record) -> int:
+        """
+        Update a club according to a record from the bestlist (see _update_entries).
+
+        :param club: the club.
+        :param record: the record.
+        :return: the number of performed updates.
+        """
+
+        amount_updates = 0
+        if record.event_date >= club.latest_date:
             if club.name != record.club:
                 club.name = record.club
                 amount_updates += 1
-            club.latest_date = result_date
+            club.latest_date = record.event_date
+        return amount_updates
 
-        if result_date >= event.latest_date:
+    @staticmethod
+    def _update_event(event: Event, record: Record) -> int:
+        """
+        Update an event according to a record from the bestlist (see _update_entries).
+
+        :param event: the event.
+        :param record: the record.
+        :return: the number of performed updates.
+        """
+
+        amount_updates = 0
+        if record.event_date >= event.latest_date:
             if event.name != record.event:
                 event.name = record.event
                 amount_updates += 1
-            event.latest_date = result_date
-
+            event.latest_date = record.event_date
         return amount_updates
 
-    def _fetch_records_from_database(self, discipline: Discipline, last_result: Optional[int]) -> RecordCollection:
+    def _fetch_fingerprints_from_database(
+        self, discipline: Discipline, last_result: Optional[int]
+    ) -> dict[int, Optional[int]]:
+        """
+        Reads the fingerprints of the results that correspond to the bestlist from the database.
+
+        :param discipline: the discipline from which the results are fetched.
+        :param last_result: the last performance of the bestlist (all results are read if not provided).
+        :return: the fingerprints by result id.
         """
-        Reads the results from the database.
+
+        statement = (
+            sqlalchemy.select(Result.id, Result.fingerprint)
+            .join_from(Result, Athlete, Result.athlete_id == Athlete.id)
+            .where(*self._get_result_filters(discipline, last_result))
+        )
+        with DatabaseConnection(self.config) as database:
+            return {row.id: row.fingerprint for row in database.session.connection().execute(statement)}
+
+    def _fetch_records_from_database(
+        self, discipline: Discipline, last_result: Optional[int], result_ids: Optional[list[int]] = None
+    ) -> RecordCollection:
+        """
+        Reads the results from the database. Only the columns of the records are selected (in a single statement per
+        chunk of ids), the rows are converted to records without loading the entities.
 
         :param discipline: the discipline from which the results are fetched.
+        :param last_result: the last performance of the bestlist (all results are read if not provided).
+        :param result_ids: (Optional) the ids of the results to read, otherwise all corresponding results are read.
         :return: the database record collection.
         """
 
+        if result_ids is not None and len(result_ids) == 0:
+            return RecordCollection(records=[])
+
+        id_chunks: list[Optional[list[int]]] = (
+            [result_ids[start : start + IN_CHUNK_SIZE] for start in range(0, len(result_ids), IN_CHUNK_SIZE)]
+            if result_ids is not None
+            else [None]
+        )
+        collections: list[RecordCollection] = []
         with DatabaseConnection(self.config) as database:
-            year = self.scrape_config.year
-            lower_bound, upper_bound = BestlistCategory.get_age_bounds(self.scrape_config.category)
-            results: list[Result] = (
-                database.session.query(Result)
-                .join(Athlete, Result.athlete)
-                .join(Event, Result.event)
-                .filter(
-                    Result.discipline_id == discipline.id,
-                    (
-                        (
-                            Result.performance <= last_result
-                            if discipline.config.ascending
-                            else Result.performance >= last_result
-                        )
-                        if last_result is not None
-                        else True
-                    ),
-                    sqlalchemy.extract("year", Result.date) == year if year is not None else True,
-                    Result.homologated if self.scrape_config.only_homologated else True,
-                    Result.wind <= 2.0 if Result.wind and not self.scrape_config.allow_wind else True,
-                    and_(
-                        sqlalchemy.extract("year", Result.date) - sqlalchemy.extract("year", Athlete.birthdate)
-                        >= lower_bound,
-                        sqlalchemy.extract("year", Result.date) - sqlalchemy.extract("year", Athlete.birthdate)
-                        < upper_bound,
-                    ),
+            connection = database.session.connection()
+            for id_chunk in id_chunks:
+                statement = (
+                    sqlalchemy.select(*DATABASE_COLUMNS)
+                    .join_from(Result, Athlete, Result.athlete_id == Athlete.id)
+                    .join(Club, Result.club_id == Club.id)
+                    .join(Event, Result.event_id == Event.id)
+                    .where(
+                        *self._get_result_filters(discipline, last_result),
+                        Result.id.in_(id_chunk) if id_chunk is not None else True,
+                    )
+                    .order_by(Result.performance.asc() if discipline.config.ascending else Result.performance.desc())
                 )
-                .order_by(Result.performance.asc() if discipline.config.ascending else Result.performance.desc())
-                .all()
-            )
-            return RecordCollection.from_database(results)
+                collections.append(RecordCollection.from_database(connection.execute(statement)))
+        return RecordCollection.concatenate(collections)
+
+    def _get_result_filters(self, discipline: Discipline, last_result: Optional[int]) -> list[Any]:
+        """
+        Get the filters selecting the results that correspond to the bestlist. The filters require the athletes to be
+        joined.
+
+        :param discipline: the discipline of the results.
+        :param last_result: the last performance of the bestlist (all results are selected if not provided).
+        :return: the filters.
+        """
+
+        year = self.scrape_config.year
+        lower_bound, upper_bound = BestlistCategory.get_age_bounds(self.scrape_config.category)
+        if year is not None:
+            # the year and the age are expressed as date ranges, such that the indices on the dates can be used
+            period_filters = [
+                Result.date >= date(year, 1, 1),
+                Result.date < date(year + 1, 1, 1),
+                Athlete.birthdate >= date(year - upper_bound + 1, 1, 1),
+                Athlete.birthdate < date(year - lower_bound + 1, 1, 1),
+            ]
+        else:
+            # the age depends on the year of each result
+            period_filters = [
+                and_(
+                    sqlalchemy.extract("year", Result.date) - sqlalchemy.extract("year", Athlete.birthdate)
+                    >= lower_bound,
+                    sqlalchemy.extract("year", Result.date) - sqlalchemy.extract("year", Athlete.birthdate)
+                    < upper_bound,
+                )
+            ]
+        return [
+            Result.discipline_id == discipline.id,
+            (
+                (
+                    Result.performance <= last_result
+                    if discipline.config.ascending
+                    else Result.performance >= last_result
+                )
+                if last_result is not None
+                else True
+            ),
+            *period_filters,
+            Result.homologated if self.scrape_config.only_homologated else True,
+            Result.wind <= 2.0 if Result.wind and not self.scrape_config.allow_wind else True,
+        ]
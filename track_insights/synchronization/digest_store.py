@@ -0,0 +1,128 @@
+import hashlib
+import json
+from typing import Optional
+
+import pandas as pd
+from sqlalchemy.orm import Session
+from track_insights.database import DatabaseConnection
+from track_insights.database.models import BestlistDigest, Discipline
+from track_insights.scraping import ScrapeConfig
+
+# part of every digest, it has to be increased whenever the parsing or the synchronization of the pages changes, such
+# that all pages are synchronized again
+DIGEST_VERSION = 1
+
+
+class DigestStore:
+    """
+    Keeps track of the digest of every bestlist page that was successfully synchronized. A page whose digest matches
+    the stored one cannot change the database, hence its synchronization can be skipped. The digests of a discipline
+    are cleared whenever results of the discipline are deleted, since the other pages may cover them as well.
+    """
+
+    def __init__(self, config: dict) -> None:
+        """
+        Initialize the digest store.
+
+        :param config: the system configuration.
+        """
+
+        self.config = config
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["DigestStore"]:
+        """
+        Create the digest store if skipping unchanged pages is enabled.
+
+        :param config: the system configuration.
+        :return: the digest store or None, if disabled.
+        """
+
+        if config.get("synchronization", {}).get("skip_unchanged", False):
+            return cls(config)
+        return None
+
+    @staticmethod
+    def compute_digest(scrape_config: ScrapeConfig, bestlist: pd.DataFrame, ignored_entries: set[str]) -> str:
+        """
+        Compute the digest of a parsed bestlist page.
+
+        :param scrape_config: the scrape configuration of the page.
+        :param bestlist: the parsed bestlist.
+        :param ignored_entries: the ignored entries, which decide on the records that are synchronized.
+        :return: the hex digest.
+        """
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{DIGEST_VERSION}\n".encode("utf-8"))
+        hasher.update(json.dumps(sorted(ignored_entries)).encode("utf-8"))
+        hasher.update(json.dumps(scrape_config.get_query_arguments(), sort_keys=True, default=str).encode("utf-8"))
+        hasher.update(json.dumps([str(column) for column in bestlist.columns]).encode("utf-8"))
+        hasher.update(pd.util.hash_pandas_object(bestlist, index=False).to_numpy().tobytes())
+        return hasher.hexdigest()
+
+    def is_unchanged(self, scrape_config: ScrapeConfig, digest: str) -> bool:
+        """
+        Check whether the page was already synchronized with the same content.
+
+        :param scrape_config: the scrape configuration of the page.
+        :param digest: the digest of the page.
+        :return: True if the digest matches the one of the last successful synchronization.
+        """
+
+        with DatabaseConnection(self.config) as database:
+            stored_digest = self._find(database, scrape_config)
+            return stored_digest is not None and stored_digest.digest == digest
+
+    def store(self, scrape_config: ScrapeConfig, digest: str) -> None:
+        """
+        Store the digest of a successfully synchronized page.
+
+        :param scrape_config: the scrape configuration of the page.
+        :param digest: the digest of the page.
+        """
+
+        with DatabaseConnection(self.config) as database:
+            stored_digest = self._find(database, scrape_config)
+            if stored_digest is None:
+                database.session.add(
+                    BestlistDigest(
+                        discipline_id=scrape_config.discipline.id,
+                        category=scrape_config.category.value,
+                        year=scrape_config.year,
+                        homologated=scrape_config.only_homologated,
+                        digest=digest,
+                    )
+                )
+            else:
+                stored_digest.digest = digest
+            database.session.commit()
+
+    @staticmethod
+    def clear(session: Session, discipline: Discipline) -> None:
+        """
+        Clear the digests of a discipline, such that all of its pages are synchronized again. The digests are deleted
+        within the transaction of the session.
+
+        :param session: the database session.
+        :param discipline: the discipline.
+        """
+
+        session.query(BestlistDigest).filter(BestlistDigest.discipline_id == discipline.id).delete(False)
+
+    @staticmethod
+    def _find(database: DatabaseConnection, scrape_config: ScrapeConfig) -> Optional[BestlistDigest]:
+        return (
+            database.session.query(BestlistDigest)
+            .filter(
+                BestlistDigest.discipline_id == scrape_config.discipline.id,
+                BestlistDigest.category == scrape_config.category.value,
+                (
+                    BestlistDigest.year.is_(None)
+                    if scrape_config.year is None
+                    else BestlistDigest.year == scrape_config.year
+                ),
+                BestlistDigest.homologated.is_(scrape_config.only_homologated),
+            )
+            .first()
+        )
@@ -1,15 +1,35 @@
+import dataclasses
 import logging
 import time
-from typing import Optional
+from typing import Iterator, Optional
 
+import pandas as pd
 import requests
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from seleniumrequests import Chrome
 from track_insights.common import ANOMALIES_PATH, current_time_millis
 from track_insights.database.models import Discipline
-from track_insights.scraping import BASE_URL, BestlistCategory, ScrapeConfig, Scraper
+from track_insights.scraping import (
+    BASE_URL,
+    BestlistCategory,
+    BestlistFetcher,
+    DriverPools,
+    FetchPolicy,
+    JsfSession,
+    PageArchive,
+    ResponseCache,
+    ScrapeConfig,
+    Scraper,
+    WebDriverPool,
+)
+from track_insights.scraping.bestlist_fetcher import DEFAULT_MAX_IN_FLIGHT
+from track_insights.scraping.webdriver_pool import DEFAULT_MAX_USES, Driver
 from track_insights.synchronization.bestlist_synchronizer import BestlistSynchronizer
+from track_insights.synchronization.digest_store import DigestStore
+from track_insights.synchronization.metadata_catalogue import MetadataCatalogue
+from track_insights.synchronization.request_planner import MAX_AMOUNT, PlannedRequest, RequestPlanner
+from track_insights.synchronization.sync_journal import SyncJournal
 from track_insights.synchronization.synchronization_error import SynchronizationError, SynchronizationErrorType
 from track_insights.synchronization.synchronization_statistics import SynchronizationStatistics
 
@@ -23,38 +43,67 @@ class DisciplineSynchronizer:
     This class is responsible for scraping all results for a given discipline.
     """
 
-    def __init__(self, config: dict, ignored_entries: set[str], discipline: Discipline, verbose: bool = False) -> None:
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    def __init__(
+        self,
+        config: dict,
+        ignored_entries: set[str],
+        discipline: Discipline,
+        verbose: bool = False,
+        driver_pools: Optional[DriverPools] = None,
+        fetch_policy: Optional[FetchPolicy] = None,
+        journal: Optional[SyncJournal] = None,
+        catalogue: Optional[MetadataCatalogue] = None,
+        archive: Optional[PageArchive] = None,
+    ) -> None:
         """
         Initialize the scraper.
 
         :param config: the system configuration.
         :param ignored_entries: the set of ignored records.
         :param discipline: the discipline to scrape.
+        :param verbose: whether to print additional information.
+        :param driver_pools: (Optional) pools shared between disciplines, otherwise the scraper uses its own pools.
+        :param fetch_policy: (Optional) policy shared between disciplines, otherwise the scraper uses its own policy.
+        :param journal: (Optional) the journal of the run, completed units are skipped and new ones are recorded.
+        :param catalogue: (Optional) the catalogue serving the available years, otherwise they are requested.
+        :param archive: (Optional) archive shared between disciplines, otherwise the scraper uses its own archive.
         """
 
         self.config = config
         self.ignored_entries = ignored_entries
-        self.driver: Optional[Chrome] = None
-        self.available_years = Scraper.extract_available_years()
+        self.driver: Optional[Driver] = None
+        self.available_years = (
+            catalogue.get_available_years() if catalogue is not None else Scraper.extract_available_years()
+        )
 
         stripped_name = discipline.config.name.replace(" ", "")
         self.error_file_path = ANOMALIES_PATH / f"{stripped_name}_{current_time_millis()}_errors.json"
         self.discipline = discipline
         self.verbose = verbose
+        self.max_in_flight: int = config.get("scraping", {}).get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)
+        self.response_cache = ResponseCache.from_config(config)
+        self.digest_store = DigestStore.from_config(config)
+        self.archive = archive or PageArchive.from_config(config)
+        self.fetch_policy = fetch_policy or FetchPolicy.from_config(config)
+        self.journal = journal
+
+        self.owns_driver_pools = driver_pools is None
+        self.driver_pools = driver_pools or DisciplineSynchronizer.create_driver_pools(config)
 
     def __enter__(self) -> "DisciplineSynchronizer":
         """
-        Create the driver.
+        Acquire the driver.
 
         :return: the opened observer.
         """
 
-        self.driver = self._get_webdriver()
+        self.driver = self.driver_pools.default.acquire()
         return self
 
     def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: Exception) -> None:
         """
-        Quit from the driver.
+        Return the driver to the pool.
 
         :param exc_type: exception type.
         :param exc_val: exception value.
@@ -63,49 +112,60 @@ class DisciplineSynchronizer:
 
         assert self.driver, "No driver available."
 
-        self.driver.quit()
+        self.driver_pools.default.release(self.driver, healthy=exc_type is None)
+        self.driver = None
+        if self.owns_driver_pools:
+            self.driver_pools.close()
 
     def scrape_discipline(
-        self, start_year: Optional[int] = None, end_year: Optional[int] = None, retry_count: int = 0
+        self, start_year: Optional[int] = None, end_year: Optional[int] = None
     ) -> SynchronizationStatistics:
         """
-        Entrypoint for scraping the discipline.
+        Entrypoint for scraping the discipline. Single requests are already retried by the fetch policy, after a
+        connection error we resume from the year that was being scraped after a jittered backoff.
 
         :param start_year: the start year for scraping.
         :param end_year: the end year for scraping (inclusive).
-        :param retry_count: the current retry count.
         """
 
         if start_year is not None and end_year is not None:
             assert start_year >= end_year, "Start year should be greater or equal to the end year."
-        scrape_config = DisciplineSynchronizer.get_basic_config(self.discipline)
 
-        try:
-            statistics = self._scrape_all_years(scrape_config, start_year, end_year)
-            if self.verbose:
-                logger.info(f"Successfully finished processing discipline {self.discipline.config.name}!")
-            return statistics
-        except (requests.exceptions.ConnectionError, requests.exceptions.ReadTimeout) as err:
-            if retry_count >= MAX_RETRIES:
+        retry_count = 0
+        while True:
+            scrape_config = DisciplineSynchronizer.get_basic_config(self.discipline)
+            try:
+                statistics = self._scrape_all_years(scrape_config, start_year, end_year)
+                if self.verbose:
+                    logger.info(f"Successfully finished processing discipline {self.discipline.config.name}!")
+                return statistics
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+                requests.exceptions.RetryError,
+            ) as err:
+                if retry_count >= MAX_RETRIES or self.fetch_policy.circuit_breaker.exhausted:
+                    raise SynchronizationError(
+                        f"Scraping discipline {self.discipline.config.name} stopped due to a connection error. {err}",
+                        SynchronizationErrorType.CONNECTION_LOST,
+                    ) from err
+                if self.verbose:
+                    logger.info(f"Connection Error! Retry {retry_count + 1}/{MAX_RETRIES}.")
+                time.sleep(self.fetch_policy.get_backoff(retry_count))
+                start_year = scrape_config.year
+                retry_count += 1
+            except Exception as err:
                 raise SynchronizationError(
-                    f"Scraping discipline {self.discipline.config.name} stopped due to a connection error. {err}",
-                    SynchronizationErrorType.CONNECTION_LOST,
+                    f"Scraping discipline {self.discipline.config.name} stopped due to an exception. "
+                    f"Current scrape config: {scrape_config}. {err}",
+                    SynchronizationErrorType.UNKNOWN,
                 ) from err
-            if self.verbose:
-                logger.info(f"Connection Error! Retry {retry_count + 1}/{MAX_RETRIES}.")
-            return self.scrape_discipline(scrape_config.year, end_year, retry_count + 1)
-        except Exception as err:
-            raise SynchronizationError(
-                f"Scraping discipline {self.discipline.config.name} stopped due to an exception. "
-                f"Current scrape config: {scrape_config}. {err}",
-                SynchronizationErrorType.UNKNOWN,
-            ) from err
 
     def _scrape_all_years(
         self, scrape_config: ScrapeConfig, start_year: Optional[int], end_year: Optional[int]
     ) -> SynchronizationStatistics:
         """
-        Scrape all results for all years.
+        Scrape all results for all years according to the request plan of the discipline.
 
         :param scrape_config: the scrape configuration.
         :return: the synchronization statistics.
@@ -114,11 +174,14 @@ class DisciplineSynchronizer:
         assert self.driver, "No driver available."
         agg_statistics = SynchronizationStatistics()
 
+        planner = RequestPlanner.from_config(self.config, self.discipline)
+        plan = planner.plan(self._get_scrape_years(start_year, end_year), include_all_years=start_year is None)
+        if self.verbose:
+            logger.info(f"Planned {len(plan)} request(s) for discipline {self.discipline.config.name}.")
+
         # if no year is specified, we first fetch the results of all years
-        if start_year is None:
-            scrape_config.year = None
-            scrape_config.category = BestlistCategory.ALL_MEN if self.discipline.male else BestlistCategory.ALL_WOMEN
-            scrape_config.only_homologated = False
+        if plan.all_years is not None:
+            DisciplineSynchronizer._apply_request(scrape_config, plan.all_years)
 
             # if we don't reach the maximum amount of records, we can return
             full_bl, statistics = self._scrape_bestlist(scrape_config)
@@ -126,35 +189,51 @@ class DisciplineSynchronizer:
             if not full_bl:
                 return agg_statistics
 
-        scrape_years = self._get_scrape_years(start_year, end_year)
-        for year in scrape_years:
+        # fetch all results of each year concurrently. The year of the scrape configuration is kept at the most recent
+        # year with pending work (its bestlist or its categories), since a retry resumes from it.
+        category_requests = dict(plan.categories)
+        if len(plan.years) > 0:
+            DisciplineSynchronizer._apply_request(scrape_config, plan.years[0])
+            year_configs: list[ScrapeConfig] = []
+            for request in plan.years:
+                year_config = dataclasses.replace(scrape_config)
+                DisciplineSynchronizer._apply_request(year_config, request)
+                year_configs.append(year_config)
+            pending_years = {request.year for request in plan.years}
+            for year_config, (full_bl, statistics) in self._scrape_bestlists(year_configs):
+                agg_statistics.add(statistics)
+                year = year_config.year
+                assert year is not None, "Year bestlists must have a year."
+                if full_bl:
+                    category_requests[year] = planner.plan_categories(year)
+                pending_years.discard(year)
+                scrape_config.year = max(pending_years | category_requests.keys(), default=scrape_config.year)
+
+        # the categories change the state of the session, hence they are scraped after all years are fetched
+        for year in sorted(category_requests, reverse=True):
             scrape_config.year = year
-            scrape_config.category = BestlistCategory.ALL_MEN if self.discipline.male else BestlistCategory.ALL_WOMEN
-            scrape_config.only_homologated = False
-
-            # fetch all results for the given year
-            full_bl, statistics = self._scrape_bestlist(scrape_config)
+            statistics = self._scrape_all_categories(scrape_config, category_requests[year])
             agg_statistics.add(statistics)
-            if full_bl:
-                statistics = self._scrape_all_categories(scrape_config)
-                agg_statistics.add(statistics)
         return agg_statistics
 
-    def _scrape_all_categories(self, scrape_config: ScrapeConfig) -> SynchronizationStatistics:
+    def _scrape_all_categories(
+        self, scrape_config: ScrapeConfig, category_requests: list[PlannedRequest]
+    ) -> SynchronizationStatistics:
         """
         Scrape all categories for a given configuration.
 
         :param scrape_config: the scrape configuration.
+        :param category_requests: the planned requests of the adult category followed by the junior categories.
         :return: the synchronization statistics.
         """
 
         assert self.driver, "No driver available."
 
         agg_statistics = SynchronizationStatistics()
-        scrape_config.category = BestlistCategory.MEN if self.discipline.male else BestlistCategory.WOMEN
+        adult_request, *junior_requests = category_requests
 
         # first we scrape for all results (also not homologated)
-        scrape_config.only_homologated = False
+        DisciplineSynchronizer._apply_request(scrape_config, adult_request)
         full_bl, statistics = self._scrape_bestlist(scrape_config)
         agg_statistics.add(statistics)
         if full_bl:
@@ -162,23 +241,34 @@ class DisciplineSynchronizer:
             statistics = self._scrape_homologated(scrape_config)
             agg_statistics.add(statistics)
 
-        # go through each category one-by-one and load the results
-        junior_categories = BestlistCategory.get_junior_categories(self.discipline.male)
-        self._setup_exclusive_driver()
-        for category in junior_categories:
-            scrape_config.category = category
-            scrape_config.only_homologated = False
-            full_bl, statistics = self._scrape_bestlist(scrape_config)
-            agg_statistics.add(statistics)
-            if full_bl:
-                statistics = self._scrape_homologated(scrape_config)
+        # junior categories are scraped with a driver in exclusive mode, we fetch all of them concurrently
+        junior_configs: list[ScrapeConfig] = []
+        for request in junior_requests:
+            junior_config = dataclasses.replace(scrape_config)
+            DisciplineSynchronizer._apply_request(junior_config, request)
+            junior_configs.append(junior_config)
+        default_driver = self.driver
+        self.driver = self.driver_pools.exclusive.acquire()
+        healthy = False
+        try:
+            for category_config, (full_bl, statistics) in self._scrape_bestlists(junior_configs):
                 agg_statistics.add(statistics)
-
-        # reset the driver in any case
-        self.driver.quit()
-        self.driver = DisciplineSynchronizer._get_webdriver()
+                if full_bl:
+                    statistics = self._scrape_homologated(category_config)
+                    agg_statistics.add(statistics)
+            healthy = True
+        finally:
+            self.driver_pools.exclusive.release(self.driver, healthy)
+            self.driver = default_driver
         return agg_statistics
 
+    @staticmethod
+    def _apply_request(scrape_config: ScrapeConfig, request: PlannedRequest) -> None:
+        scrape_config.year = request.year
+        scrape_config.category = request.category
+        scrape_config.amount = request.amount
+        scrape_config.only_homologated = False
+
     def _scrape_homologated(self, scrape_config: ScrapeConfig) -> SynchronizationStatistics:
         """
         Only scrape the homologated results.
@@ -200,19 +290,112 @@ class DisciplineSynchronizer:
         :return: whether the maximum amount of records was reached.
         """
 
-        scraper = Scraper(scrape_config, self.driver)
-        bestlist = scraper.extract_data()
+        completed_full_bl = self.journal.get_completed(scrape_config) if self.journal is not None else None
+        if completed_full_bl is not None:
+            return completed_full_bl, SynchronizationStatistics()
+
+        scraper = Scraper(scrape_config, self.driver, self.response_cache, self.fetch_policy, self.archive)
+        bestlist = self._escalate(scrape_config, scraper.extract_data())
+        return self._synchronize_bestlist(scrape_config, bestlist)
+
+    def _scrape_bestlists(
+        self, scrape_configs: list[ScrapeConfig]
+    ) -> Iterator[tuple[ScrapeConfig, tuple[bool, SynchronizationStatistics]]]:
+        """
+        Scrape the bestlists of multiple configurations concurrently and synchronize them as they arrive.
+
+        :param scrape_configs: the scrape configurations.
+        :return: iterator over the scrape configurations and whether the maximum amount of records was reached.
+        """
+
+        assert self.driver, "No driver available."
+
+        # units completed during a previous attempt of this run are not fetched again
+        pending_configs: list[ScrapeConfig] = []
+        for scrape_config in scrape_configs:
+            completed_full_bl = self.journal.get_completed(scrape_config) if self.journal is not None else None
+            if completed_full_bl is None:
+                pending_configs.append(scrape_config)
+            else:
+                yield scrape_config, (completed_full_bl, SynchronizationStatistics())
+        if len(pending_configs) == 0:
+            return
+
+        if isinstance(self.driver, JsfSession):
+            fetcher = BestlistFetcher(
+                self.driver, self.max_in_flight, self.response_cache, self.fetch_policy, self.archive
+            )
+        else:
+            fetcher = BestlistFetcher.from_driver(
+                self.driver, self.max_in_flight, self.response_cache, self.fetch_policy, self.archive
+            )
+        for scrape_config, bestlist in fetcher.iter_completed(pending_configs):
+            yield scrape_config, self._synchronize_bestlist(scrape_config, self._escalate(scrape_config, bestlist))
+
+    def _escalate(self, scrape_config: ScrapeConfig, bestlist: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Request the bestlist again with the maximum amount of records if the planned amount turned out to be too small.
+        The truncated bestlist is not synchronized, hence a full bestlist always has the maximum amount of records.
+
+        :param scrape_config: the scrape configuration, its amount is updated.
+        :param bestlist: the scraped bestlist or None, if no results were found.
+        :return: the complete bestlist.
+        """
+
+        if bestlist is None or len(bestlist.index) < scrape_config.amount or scrape_config.amount >= MAX_AMOUNT:
+            return bestlist
+
+        logger.debug(f"Bestlist with {scrape_config.amount} records is full, requesting it completely.")
+        scrape_config.amount = MAX_AMOUNT
+        return Scraper(scrape_config, self.driver, self.response_cache, self.fetch_policy, self.archive).extract_data()
+
+    def _synchronize_bestlist(
+        self, scrape_config: ScrapeConfig, bestlist: Optional[pd.DataFrame]
+    ) -> tuple[bool, SynchronizationStatistics]:
+        """
+        Synchronize a scraped bestlist with the database and record the completed unit in the journal.
+
+        :param scrape_config: the scrape configuration.
+        :param bestlist: the scraped bestlist or None, if no results were found.
+        :return: whether the maximum amount of records was reached.
+        """
+
+        full_bl, statistics = self._apply_bestlist(scrape_config, bestlist)
+        if self.journal is not None:
+            self.journal.record(scrape_config, full_bl, statistics)
+        return full_bl, statistics
+
+    def _apply_bestlist(
+        self, scrape_config: ScrapeConfig, bestlist: Optional[pd.DataFrame]
+    ) -> tuple[bool, SynchronizationStatistics]:
+        """
+        Apply the changes of a scraped bestlist to the database.
+
+        :param scrape_config: the scrape configuration.
+        :param bestlist: the scraped bestlist or None, if no results were found.
+        :return: whether the maximum amount of records was reached.
+        """
 
         # check if some data was extracted
         if bestlist is None:
             return False, SynchronizationStatistics()
+
+        # check if we reached the maximum amount of records
+        full_bl = len(bestlist.index) >= scrape_config.amount
+
+        # an unchanged page cannot change the database
+        digest: Optional[str] = None
+        if self.digest_store is not None:
+            digest = DigestStore.compute_digest(scrape_config, bestlist, self.ignored_entries)
+            if self.digest_store.is_unchanged(scrape_config, digest):
+                return full_bl, SynchronizationStatistics()
+
         processor = BestlistSynchronizer(self.config, scrape_config, bestlist)
         statistics = processor.synchronize(self.error_file_path, self.ignored_entries)
 
-        # check if we reached the maximum amount of records
-        if len(bestlist.index) >= scrape_config.amount:
-            return True, statistics
-        return False, statistics
+        if self.digest_store is not None and digest is not None:
+            self.digest_store.store(scrape_config, digest)
+        return full_bl, statistics
 
     def _get_scrape_years(self, start_year: Optional[int], end_year: Optional[int]) -> list[int]:
         """
@@ -234,21 +417,58 @@ class DisciplineSynchronizer:
 
         return filtered_years
 
-    def _setup_exclusive_driver(self) -> None:
+    @staticmethod
+    def create_driver_pools(config: dict) -> DriverPools:
+        """
+        Create the driver pools according to the configuration. In browserless mode, the drivers are plain HTTP
+        sessions that emulate the form.
+
+        :param config: the system configuration.
+        :return: the default and the exclusive driver pool.
+        """
+
+        scraping_config = config.get("scraping", {})
+        browserless: bool = scraping_config.get("browserless", False)
+        max_in_flight: int = scraping_config.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)
+        max_uses: int = scraping_config.get("driver_max_uses", DEFAULT_MAX_USES)
+
+        def open_driver() -> Driver:
+            if browserless:
+                session = JsfSession(pool_maxsize=max_in_flight)
+                session.open()
+                return session
+            return DisciplineSynchronizer._get_webdriver()
+
+        def open_exclusive_driver() -> Driver:
+            driver = open_driver()
+            DisciplineSynchronizer._setup_exclusive_driver(driver)
+            return driver
+
+        return DriverPools(
+            default=WebDriverPool(open_driver, max_uses=max_uses),
+            exclusive=WebDriverPool(open_exclusive_driver, max_uses=max_uses),
+        )
+
+    @staticmethod
+    def _setup_exclusive_driver(driver: Driver) -> None:
         """
         Set up the driver for exclusive categories.
+
+        :param driver: the driver in "Alle Resultate" mode.
         """
 
-        assert self.driver, "No driver available."
+        if isinstance(driver, JsfSession):
+            driver.enable_exclusive_categories()
+            return
 
         time.sleep(1)
-        self.driver.find_element(By.ID, "form_anonym:bestlistYear_label").click()
-        self.driver.find_element(By.XPATH, "//li[@data-label='2023']").click()
+        driver.find_element(By.ID, "form_anonym:bestlistYear_label").click()
+        driver.find_element(By.XPATH, "//li[@data-label='2023']").click()
         time.sleep(1)
-        self.driver.find_element(By.ID, "form_anonym:bestlistCategory_label").click()
-        self.driver.find_element(By.XPATH, "//li[@data-label='U10 Männer']").click()
+        driver.find_element(By.ID, "form_anonym:bestlistCategory_label").click()
+        driver.find_element(By.XPATH, "//li[@data-label='U10 Männer']").click()
         time.sleep(1)
-        self.driver.find_element(By.ID, "form_anonym:categoryExclusive").click()
+        driver.find_element(By.ID, "form_anonym:categoryExclusive").click()
         time.sleep(1)
 
     @staticmethod
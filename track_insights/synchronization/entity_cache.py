@@ -0,0 +1,131 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, ClassVar, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+PENDING_KEY = "entity_cache_pending"
+
+
+@dataclass(frozen=True)
+class CachedEntity:
+    """
+    Snapshot of an athlete, club or event: its primary key, the date of its latest result and the values that are
+    updated from the bestlist.
+    """
+
+    id: int
+    latest_date: date
+    values: tuple
+
+
+class EntityCache:
+    """
+    Process-wide cache of athletes, clubs and events shared by all synchronizers of a run. Entries are keyed by the
+    kind of entity and its code, the least recently used entries are evicted once the cache is full. An entry only
+    becomes visible after the transaction that staged it is committed, entries staged by a rolled back transaction are
+    discarded.
+    """
+
+    _instances: ClassVar[dict[tuple, "EntityCache"]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, max_entries: int) -> None:
+        """
+        Initialize the cache.
+
+        :param max_entries: the maximum number of cached entities (the memory bound of the cache).
+        """
+
+        assert max_entries > 0, "The cache must hold at least one entity."
+
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], CachedEntity] = OrderedDict()
+
+    @classmethod
+    def from_config(cls, config: dict) -> Optional["EntityCache"]:
+        """
+        Get the cache of the configured database. Since the cache is shared by the whole process, synchronizers of
+        the same database receive the same cache.
+
+        :param config: the system configuration.
+        :return: the cache or None, if caching is not configured.
+        """
+
+        max_entries = config.get("synchronization", {}).get("entity_cache_size")
+        if max_entries is None:
+            return None
+
+        database_config = config["database"]
+        key = tuple(database_config.get(name) for name in ("drivername", "host", "port", "database"))
+        with cls._instances_lock:
+            if key not in cls._instances or cls._instances[key].max_entries != max_entries:
+                cls._instances[key] = cls(max_entries)
+            return cls._instances[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = 100 * self.hits / lookups if lookups > 0 else 0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate), {len(self)} entries"
+
+    def get(self, kind: str, code: str) -> Optional[CachedEntity]:
+        """
+        Get a cached entity.
+
+        :param kind: the kind of the entity (e.g., the table name).
+        :param code: the code of the entity.
+        :return: the snapshot or None, if the entity is not cached.
+        """
+
+        with self._lock:
+            entity = self._entries.get((kind, code))
+            if entity is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end((kind, code))
+            return entity
+
+    def stage(self, session: Session, kind: str, code: str, entity: CachedEntity) -> None:
+        """
+        Stage a snapshot, which is cached once the current transaction of the session is committed.
+
+        :param session: the session that read or wrote the entity.
+        :param kind: the kind of the entity.
+        :param code: the code of the entity.
+        :param entity: the snapshot.
+        """
+
+        if PENDING_KEY not in session.info:
+            session.info[PENDING_KEY] = {}
+            event.listen(session, "after_commit", self._apply_pending)
+            event.listen(session, "after_soft_rollback", EntityCache._discard_pending)
+        session.info[PENDING_KEY][(kind, code)] = entity
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _apply_pending(self, session: Session) -> None:
+        pending: dict[tuple[str, str], CachedEntity] = session.info.get(PENDING_KEY, {})
+        with self._lock:
+            for key, entity in pending.items():
+                self._entries[key] = entity
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        pending.clear()
+
+    @staticmethod
+    def _discard_pending(session: Session, _previous_transaction: Any) -> None:
+        session.info.get(PENDING_KEY, {}).clear()
@@ -0,0 +1,110 @@
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional
+from urllib.parse import urlparse
+
+from track_insights.database import DatabaseConnection
+from track_insights.database.models import MetadataEntry
+from track_insights.scraping import BASE_URL, Scraper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METADATA_TTL = 24.0  # hours
+
+
+class MetadataCatalogue:
+    """
+    Serves the metadata of the bestlist (available years and disciplines) from memory. Each entry is requested at most
+    once per run and persisted in the database, such that subsequent runs reuse it until its time-to-live expired.
+    """
+
+    def __init__(
+        self, config: dict, ttl: timedelta = timedelta(hours=DEFAULT_METADATA_TTL), refresh: bool = False
+    ) -> None:
+        """
+        Initialize the catalogue.
+
+        :param config: the system configuration.
+        :param ttl: the time after which a persisted entry is requested again.
+        :param refresh: whether to ignore the persisted entries and request every entry once.
+        """
+
+        self.config = config
+        self.ttl = ttl
+        self.refresh = refresh
+
+        self._lock = threading.Lock()
+        self._entries: dict[str, Any] = {}
+
+    @classmethod
+    def from_config(cls, config: dict, refresh: bool = False) -> "MetadataCatalogue":
+        """
+        Create the catalogue according to the system configuration.
+
+        :param config: the system configuration.
+        :param refresh: whether to ignore the persisted entries and request every entry once.
+        :return: the catalogue.
+        """
+
+        ttl = config.get("synchronization", {}).get("metadata_ttl", DEFAULT_METADATA_TTL)
+        return cls(config, timedelta(hours=ttl), refresh)
+
+    def get_available_years(self) -> list[int]:
+        """
+        Get the years for which results are available.
+
+        :return: list of available years in descending order.
+        """
+
+        return self._get("years", Scraper.extract_available_years)
+
+    def get_disciplines(self, male: bool, indoor: bool, year: Optional[int] = None) -> list[tuple[str, str]]:
+        """
+        Get the disciplines for which results are available.
+
+        :param male: whether we consider male athletes.
+        :param indoor: whether we consider indoor results.
+        :param year: (Optional) a particular year we consider otherwise we consider them all.
+        :return: (name, code)-pairs of discipline names and codes.
+        """
+
+        key = f"disciplines:{'M' if male else 'W'}:{'indoor' if indoor else 'outdoor'}:{year or 'ALL'}"
+        disciplines = self._get(key, lambda: Scraper.extract_disciplines(male, indoor, year))
+        # json serializes the pairs as lists
+        return [(name, code) for name, code in disciplines]  # pylint: disable=unnecessary-comprehension
+
+    def _get(self, key: str, extract: Callable[[], Any]) -> Any:
+        """
+        Get an entry from memory, from the database or from the bestlist (in this order).
+
+        :param key: the key of the entry.
+        :param extract: requests the entry from the bestlist.
+        :return: the entry.
+        """
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+
+            # entries of different bestlists (e.g., the stand-in server) must not be mixed up
+            stored_key = f"{urlparse(BASE_URL).netloc}:{key}"
+            with DatabaseConnection(self.config) as database:
+                entry: Optional[MetadataEntry] = (
+                    database.session.query(MetadataEntry).filter(MetadataEntry.key == stored_key).first()
+                )
+                if entry is not None and not self.refresh and datetime.now() - entry.fetch_date < self.ttl:
+                    value = json.loads(entry.value)
+                else:
+                    logger.debug(f"Requesting metadata entry '{key}'.")
+                    value = extract()
+                    if entry is None:
+                        entry = MetadataEntry(key=stored_key)
+                        database.session.add(entry)
+                    entry.value = json.dumps(value)
+                    entry.fetch_date = datetime.now()
+                    database.session.commit()
+
+            self._entries[key] = value
+            return value
@@ -1,9 +1,11 @@
 import logging
 from typing import Optional
 
+from sqlalchemy.orm import Session
 from track_insights.database import DatabaseConnection
 from track_insights.database.models import Discipline, DisciplineConfiguration
 from track_insights.scraping import Scraper
+from track_insights.synchronization.metadata_catalogue import MetadataCatalogue
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +16,26 @@ class MetadataSynchronizer:
     It is responsible for checking if all disciplines are registered and for fetching disciplines.
     """
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, catalogue: Optional[MetadataCatalogue] = None):
+        """
+        Initialize the metadata synchronizer.
+
+        :param config: the system configuration.
+        :param catalogue: (Optional) the catalogue serving the metadata, otherwise it is requested from the bestlist.
+        """
+
         self.config = config
+        self.catalogue = catalogue
+
+    def get_available_years(self) -> list[int]:
+        if self.catalogue is not None:
+            return self.catalogue.get_available_years()
+        return Scraper.extract_available_years()
+
+    def get_disciplines(self, male: bool, indoor: bool, year: Optional[int] = None) -> list[tuple[str, str]]:
+        if self.catalogue is not None:
+            return self.catalogue.get_disciplines(male, indoor, year)
+        return Scraper.extract_disciplines(male, indoor, year)
 
     def check_disciplines(self, year: Optional[int] = None) -> None:
         """
@@ -25,10 +45,16 @@ class MetadataSynchronizer:
         :param year: year to check disciplines (ALL if not provided).
         """
 
+        # the metadata is requested before the session is opened, since the catalogue persists it in the database
+        available_disciplines = {
+            (male, indoor): self.get_disciplines(male, indoor, year)
+            for male in [True, False]
+            for indoor in [True, False]
+        }
         with DatabaseConnection(self.config) as database:
             for male in [True, False]:
                 for indoor in [True, False]:
-                    disciplines = Scraper.extract_disciplines(male, indoor, year)
+                    disciplines = available_disciplines[(male, indoor)]
                     for discipline, code in disciplines:
                         # if discipline code not in database, it gets added
                         if (
@@ -41,24 +67,36 @@ class MetadataSynchronizer:
                             .first()
                             is None
                         ):
-                            config = (
-                                database.session.query(DisciplineConfiguration)
-                                .filter(DisciplineConfiguration.name == discipline)
-                                .first()
-                            )
-                            if config is None:
-                                # add the discipline configuration
-                                config = DisciplineConfiguration(name=discipline, ascending=True)  # default
-                                database.session.add(config)
+                            MetadataSynchronizer.register_discipline(database.session, discipline, code, indoor, male)
+            database.session.commit()
 
-                                logger.info(f"Insert new discipline configuration: '{discipline}'.")
+    @staticmethod
+    def register_discipline(session: Session, name: str, code: str, indoor: bool, male: bool) -> Discipline:
+        """
+        Add a discipline (and its configuration, if it is new) to the session.
+
+        :param session: the database session.
+        :param name: the name of the discipline.
+        :param code: the code of the discipline.
+        :param indoor: whether the discipline is indoor.
+        :param male: whether the discipline is for male athletes.
+        :return: the added discipline.
+        """
 
-                            # add the discipline
-                            db_discipline = Discipline(config=config, discipline_code=code, indoor=indoor, male=male)
-                            database.session.add(db_discipline)
+        config = session.query(DisciplineConfiguration).filter(DisciplineConfiguration.name == name).first()
+        if config is None:
+            # add the discipline configuration
+            config = DisciplineConfiguration(name=name, ascending=True)  # default
+            session.add(config)
 
-                            logger.info(f"Insert new discipline object belonging to '{discipline}'.")
-            database.session.commit()
+            logger.info(f"Insert new discipline configuration: '{name}'.")
+
+        # add the discipline
+        discipline = Discipline(config=config, discipline_code=code, indoor=indoor, male=male)
+        session.add(discipline)
+
+        logger.info(f"Insert new discipline object belonging to '{name}'.")
+        return discipline
 
     # pylint: disable=too-many-locals
     def get_all_disciplines(
@@ -84,15 +122,20 @@ class MetadataSynchronizer:
         """
 
         if year is not None and discipline_name is None:
-            assert year in Scraper.extract_available_years(), f"Results for year {year} are not available"
+            assert year in self.get_available_years(), f"Results for year {year} are not available"
 
             place_filter = [True, False] if indoor is None else [indoor]
             gender_filter = [True, False] if male is None else [male]
+            available_disciplines = {
+                (male_val, indoor_val): self.get_disciplines(male_val, indoor_val, year)
+                for indoor_val in place_filter
+                for male_val in gender_filter
+            }
             disciplines: list[Discipline] = []
             with DatabaseConnection(self.config) as database:
                 for indoor_val in place_filter:
                     for male_val in gender_filter:
-                        for name, code in Scraper.extract_disciplines(male_val, indoor_val, year):
+                        for name, code in available_disciplines[(male_val, indoor_val)]:
                             discipline: Optional[Discipline] = (
                                 database.session.query(Discipline)
                                 .filter(
@@ -1,14 +1,65 @@
+import hashlib
 from dataclasses import dataclass
 from datetime import date
 from typing import Optional
 
 import pandas as pd
+from sqlalchemy import Row
 from track_insights.common.utils import parse_date, parse_float, parse_result
-from track_insights.database.models import Result
+from track_insights.database.models import Athlete, Club, Event, Result
 from track_insights.scraping import BestlistColumn
 
 MIN_WIND = -100.0
 MAX_WIND = 100.0
+FINGERPRINT_SIZE = 8  # bytes, fits a signed 64-bit integer column
+
+# the fields that are hashed by the fingerprints in this order, the wind is normalized (see Record.normalize_wind)
+FINGERPRINT_FIELDS = (
+    "performance",
+    "wind",
+    "rank",
+    "not_homologated",
+    "athlete",
+    "club",
+    "nationality",
+    "birthdate",
+    "event",
+    "location",
+    "event_date",
+    "athlete_code",
+    "club_code",
+    "event_code",
+)
+SIMILARITY_FINGERPRINT_FIELDS = (
+    "performance",
+    "wind",
+    "rank",
+    "location",
+    "event_date",
+    "athlete_code",
+    "event_code",
+    "not_homologated",
+)
+
+# the columns of a database row (see Record.from_database_row), the results must be joined with their entries
+DATABASE_COLUMNS = (
+    Result.id,
+    Result.performance,
+    Result.wind,
+    Result.rank,
+    Result.homologated,
+    Result.location,
+    Result.date,
+    Result.manual,
+    Athlete.name.label("athlete"),
+    Athlete.nationality,
+    Athlete.birthdate,
+    Athlete.athlete_code,
+    Club.name.label("club"),
+    Club.club_code,
+    Event.name.label("event"),
+    Event.event_code,
+)
 
 
 @dataclass
@@ -80,30 +131,30 @@ class Record:
         )
 
     @classmethod
-    def from_database_row(cls, result: Result) -> "Record":
+    def from_database_row(cls, row: Row) -> "Record":
         """
         Parses a row from the database to a Record object.
 
-        :param result: row from the database.
+        :param row: row from the database consisting of the DATABASE_COLUMNS.
         :return: a new Record object.
         """
         return cls(
-            performance=result.performance,
-            wind=float(result.wind) if result.wind is not None else None,
-            rank=result.rank,
-            not_homologated=not result.homologated,
-            athlete=result.athlete.name,
-            club=result.club.name,
-            nationality=result.athlete.nationality,
-            birthdate=result.athlete.birthdate,
-            event=result.event.name,
-            location=result.location,
-            event_date=result.date,
-            athlete_code=result.athlete.athlete_code,
-            club_code=result.club.club_code or "",
-            event_code=result.event.event_code,
-            manual=result.manual,
-            id=result.id,
+            performance=row.performance,
+            wind=float(row.wind) if row.wind is not None else None,
+            rank=row.rank,
+            not_homologated=not row.homologated,
+            athlete=row.athlete,
+            club=row.club,
+            nationality=row.nationality,
+            birthdate=row.birthdate,
+            event=row.event,
+            location=row.location,
+            event_date=row.date,
+            athlete_code=row.athlete_code,
+            club_code=row.club_code or "",
+            event_code=row.event_code,
+            manual=row.manual,
+            id=row.id,
         )
 
     def is_valid(self) -> bool:
@@ -142,6 +193,28 @@ class Record:
 
         return similar
 
+    def get_fingerprint(self) -> int:
+        """
+        Computes the fingerprint of the record. Equal records (see __eq__) share the same fingerprint.
+
+        :return: a stable 64-bit hash of the compared fields.
+        """
+
+        return Record.hash_fields(*self._get_hashed_values(FINGERPRINT_FIELDS))
+
+    def get_similarity_fingerprint(self) -> int:
+        """
+        Computes the similarity fingerprint of the record. Similar records (see is_similar) share the same similarity
+        fingerprint. The club is not part of the fingerprint, since it is either compared by code or by name.
+
+        :return: a stable 64-bit hash of the fields that are compared regardless of the club.
+        """
+
+        return Record.hash_fields(*self._get_hashed_values(SIMILARITY_FINGERPRINT_FIELDS))
+
+    def _get_hashed_values(self, fields: tuple[str, ...]) -> list[object]:
+        return [Record.normalize_wind(self.wind) if field == "wind" else getattr(self, field) for field in fields]
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Record):
             return False
@@ -173,8 +246,28 @@ class Record:
         :return: True if the wind values are equal, False otherwise.
         """
 
-        if wind1 is None and wind2 is None:
-            return True
-        if wind1 is not None and wind2 is not None:
-            return int(wind1 * 10) == int(wind2 * 10)
-        return False
+        return Record.normalize_wind(wind1) == Record.normalize_wind(wind2)
+
+    @staticmethod
+    def normalize_wind(wind: Optional[float]) -> Optional[int]:
+        """
+        Normalizes a wind value to the tenths of a meter per second, which are compared by equal_wind.
+
+        :param wind: the wind value.
+        :return: the normalized wind value.
+        """
+
+        return int(wind * 10) if wind is not None else None
+
+    @staticmethod
+    def hash_fields(*fields: object) -> int:
+        """
+        Computes a stable hash of the fields, which does not depend on the process (unlike the builtin hash).
+
+        :param fields: the fields to hash.
+        :return: the hash as signed 64-bit integer.
+        """
+
+        encoded_fields = "\x1f".join(map(str, fields)).encode("utf-8")
+        digest = hashlib.blake2b(encoded_fields, digest_size=FINGERPRINT_SIZE).digest()
+        return int.from_bytes(digest, "big", signed=True)
@@ -1,22 +1,59 @@
+import dataclasses
 import logging
 import pathlib
+from typing import Any, Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
-from track_insights.database.models import Result
-from track_insights.synchronization.record import Record
+from sqlalchemy import Row
+from track_insights.common.utils import parse_dates, parse_floats, parse_results
+from track_insights.scraping import BestlistColumn
+from track_insights.synchronization.record import (
+    FINGERPRINT_FIELDS,
+    MAX_WIND,
+    MIN_WIND,
+    SIMILARITY_FINGERPRINT_FIELDS,
+    Record,
+)
 
 logger = logging.getLogger(__name__)
 
+# the fields of a record in the order of its constructor
+RECORD_FIELDS = tuple(field.name for field in dataclasses.fields(Record))
+# the strings are dictionary-encoded, i.e., stored as codes into the sorted distinct values of the field
+ENCODED_FIELDS = (
+    "rank",
+    "athlete",
+    "club",
+    "nationality",
+    "event",
+    "location",
+    "athlete_code",
+    "club_code",
+    "event_code",
+)
+DATE_FIELDS = ("birthdate", "event_date")
+BOOLEAN_FIELDS = ("not_homologated", "manual")
+MISSING_ID = -1  # the ids of the database are positive
+
 
 class RecordCollection:
     """
     This class represents a collection of records. It hence represents a bestlist or a list of results from
     the database.
+
+    Collections parsed from a bestlist or the database are stored column by column in typed NumPy arrays and their
+    strings are dictionary-encoded, such that sorting, checking and fingerprinting them does not create Record objects.
+    Once the records are accessed, they are created and take the place of the columns, since they may be modified in
+    place.
     """
 
     def __init__(self, records: list[Record]):
-        self.records = records
+        self._records: Optional[list[Record]] = records
+        self._columns: dict[str, np.ndarray] = {}
+        self._dictionaries: dict[str, np.ndarray] = {}
 
+    # pylint: disable=too-many-locals
     @classmethod
     def from_dataframe(
         cls, df: pd.DataFrame, anomaly_file: pathlib.Path, ignored_entries: set[str]
@@ -33,34 +70,207 @@ class RecordCollection:
         # Get the list of columns in the DataFrame
         columns: set[str] = set(df.columns.tolist())
 
-        records = [Record.from_dataframe_row(row, columns) for _, row in df.iterrows()]
-        valid_records: list[Record] = []
+        # the columns are parsed as a whole (see Record.from_dataframe_row)
+        performances = parse_results(df[BestlistColumn.RESULT])
+        winds = parse_floats(df[BestlistColumn.WIND]) if BestlistColumn.WIND in columns else [None] * len(df.index)
+        birthdates = parse_dates(df[BestlistColumn.BIRTHDATE])
+        event_dates = parse_dates(df[BestlistColumn.DATE])
+
+        # see Record.is_valid
+        wind_values = np.array(winds, dtype=np.float64)
+        valid = (
+            (performances >= 0)
+            & (
+                np.array([wind is None for wind in winds], dtype=bool)
+                | ((MIN_WIND < wind_values) & (wind_values < MAX_WIND))
+            )
+            & ~np.isnat(event_dates)
+            & ~np.isnat(birthdates)
+            & df[BestlistColumn.NATIONALITY].str.len().le(3).fillna(False).to_numpy(dtype=bool)
+        )
+
+        # an invalid row is serialized like a row of the anomaly file, which are compared to the ignored entries
+        invalid_rows = np.flatnonzero(~valid)
+        if len(invalid_rows) > 0:
+            serialized_rows = df.iloc[invalid_rows].to_json(orient="records", lines=True).rstrip("\n").split("\n")
+            anomalies = [row for row in serialized_rows if row not in ignored_entries]
+            if len(anomalies) > 0:
+                logger.warning(f"Found {len(anomalies)} invalid records.")
+                with open(anomaly_file, "a", encoding="utf-8") as file:
+                    file.write("".join(f"{row}\n" for row in anomalies))
+
+        def get_strings(column: BestlistColumn) -> list[Any]:
+            return df[column].to_numpy(dtype=object)[valid].tolist()
+
+        not_homologated = (
+            (df[BestlistColumn.NOT_HOMOLOGATED] == "X").to_numpy(dtype=bool)[valid]
+            if BestlistColumn.NOT_HOMOLOGATED in columns
+            else np.zeros(np.count_nonzero(valid), dtype=bool)
+        )
+        return cls.from_columns(
+            {
+                "performance": performances[valid],
+                "wind": [wind for wind, keep in zip(winds, valid.tolist()) if keep],
+                "rank": get_strings(BestlistColumn.RANK),
+                "not_homologated": not_homologated,
+                "athlete": get_strings(BestlistColumn.ATHLETE),
+                "club": get_strings(BestlistColumn.CLUB),
+                "nationality": get_strings(BestlistColumn.NATIONALITY),
+                "birthdate": birthdates[valid],
+                "event": get_strings(BestlistColumn.EVENT),
+                "location": get_strings(BestlistColumn.LOCATION),
+                "event_date": event_dates[valid],
+                "athlete_code": get_strings(BestlistColumn.ATHLETE_CODE),
+                "club_code": get_strings(BestlistColumn.CLUB_CODE),
+                "event_code": get_strings(BestlistColumn.EVENT_CODE),
+            }
+        )
+
+    @classmethod
+    def from_database(cls, rows: Iterable[Row]) -> "RecordCollection":
+        """
+        Parses database rows to a RecordCollection object without creating Record objects.
+
+        :param rows: the database rows (see Record.from_database_row).
+        :return: a new RecordCollection object.
+        """
 
-        invalid_idx: list[int] = []
-        for idx, record in enumerate(records):
-            if record.is_valid():
-                valid_records.append(record)
-            else:
-                record_json = df.iloc[idx].to_json()
+        rows = list(rows)
+        return cls.from_columns(
+            {
+                "performance": [row.performance for row in rows],
+                "wind": [float(row.wind) if row.wind is not None else None for row in rows],
+                "rank": [row.rank for row in rows],
+                "not_homologated": [not row.homologated for row in rows],
+                "athlete": [row.athlete for row in rows],
+                "club": [row.club for row in rows],
+                "nationality": [row.nationality for row in rows],
+                "birthdate": [row.birthdate for row in rows],
+                "event": [row.event for row in rows],
+                "location": [row.location for row in rows],
+                "event_date": [row.date for row in rows],
+                "athlete_code": [row.athlete_code for row in rows],
+                "club_code": [row.club_code or "" for row in rows],
+                "event_code": [row.event_code for row in rows],
+                "manual": [row.manual for row in rows],
+                "id": [row.id for row in rows],
+            }
+        )
 
-                if record_json not in ignored_entries:
-                    invalid_idx.append(idx)
+    @classmethod
+    def from_columns(cls, values: dict[str, Sequence[Any]]) -> "RecordCollection":
+        """
+        Creates a RecordCollection object from the values of each field of the records.
 
-        if len(invalid_idx) > 0:
-            logger.warning(f"Found {len(invalid_idx)} invalid records.")
-            df.iloc[invalid_idx].to_json(anomaly_file, orient="records", lines=True, mode="a")
+        :param values: the values by field name (see Record), manual and id may be omitted.
+        :return: a new RecordCollection object.
+        """
 
-        return cls(valid_records)
+        size = len(values["performance"])
+        values = {"manual": [False] * size, "id": [None] * size, **values}
+        collection = cls.__new__(cls)
+        collection._records = None
+        collection._columns = {}
+        collection._dictionaries = {}
+        for name in RECORD_FIELDS:
+            collection._columns[name], dictionary = RecordCollection._encode_column(name, values[name])
+            if dictionary is not None:
+                collection._dictionaries[name] = dictionary
+        return collection
 
     @classmethod
-    def from_database(cls, results: list[Result]) -> "RecordCollection":
+    def concatenate(cls, collections: Sequence["RecordCollection"]) -> "RecordCollection":
         """
-        Parses a list of database results to a RecordCollection object.
+        Concatenates collections in their order.
 
-        :param results: list of database results.
+        :param collections: the collections to concatenate.
         :return: a new RecordCollection object.
         """
-        return cls([Record.from_database_row(result) for result in results])
+
+        if len(collections) == 1:
+            return collections[0]
+        return cls.from_columns(
+            {
+                name: [value for collection in collections for value in collection.get_values(name)]
+                for name in RECORD_FIELDS
+            }
+        )
+
+    @property
+    def records(self) -> list[Record]:
+        """
+        The records of the collection, which are created on first access.
+        """
+
+        if self._records is None:
+            self._records = [Record(*values) for values in zip(*(self.get_values(name) for name in RECORD_FIELDS))]
+            self._columns = {}
+            self._dictionaries = {}
+        return self._records
+
+    @property
+    def performances(self) -> np.ndarray:
+        """
+        The performances of the records.
+        """
+
+        return self._get_column("performance")
+
+    def get_values(self, name: str) -> list[Any]:
+        """
+        Gets the values of a field as Python objects (e.g., None for a missing wind or id).
+
+        :param name: the name of the field (see Record).
+        :return: the values in the order of the records.
+        """
+
+        if self._records is not None:
+            return [getattr(record, name) for record in self._records]
+
+        column = self._columns[name]
+        if name in ENCODED_FIELDS:
+            return self._dictionaries[name][column].tolist()
+        if name == "wind":
+            return [None if np.isnan(wind) else wind for wind in column.tolist()]
+        if name == "id":
+            return [None if record_id == MISSING_ID else record_id for record_id in column.tolist()]
+        return column.tolist()
+
+    def get_fingerprints(self) -> np.ndarray:
+        """
+        Computes the fingerprints of the records (see Record.get_fingerprint).
+
+        :return: the fingerprints as signed 64-bit integers.
+        """
+
+        return self._hash_fields(FINGERPRINT_FIELDS)
+
+    def get_similarity_fingerprints(self) -> np.ndarray:
+        """
+        Computes the similarity fingerprints of the records (see Record.get_similarity_fingerprint).
+
+        :return: the similarity fingerprints as signed 64-bit integers.
+        """
+
+        return self._hash_fields(SIMILARITY_FINGERPRINT_FIELDS)
+
+    def take(self, indices: Sequence[int] | np.ndarray) -> "RecordCollection":
+        """
+        Selects records by their index.
+
+        :param indices: the indices of the selected records.
+        :return: a new RecordCollection object of the selected records in the order of the indices.
+        """
+
+        selection = np.asarray(indices, dtype=np.intp)
+        if self._records is not None:
+            return RecordCollection([self._records[index] for index in selection.tolist()])
+
+        collection = RecordCollection.__new__(RecordCollection)
+        collection._records = None
+        collection._columns = {name: column[selection] for name, column in self._columns.items()}
+        collection._dictionaries = self._dictionaries
+        return collection
 
     def sort_records(self, ascending: bool) -> None:
         """
@@ -68,17 +278,22 @@ class RecordCollection:
 
         :param ascending: whether to sort in ascending order.
         """
-        # Sort by result, then by name
-        self.records = sorted(
-            self.records,
-            key=lambda record: (
-                (1 if ascending else -1) * record.performance,
-                record.event_date,
-                record.athlete,
-                record.event,
-                record.rank,
-            ),
+        # Sort by result, then by date, name, event and rank. The dictionaries are sorted, hence the order of the codes
+        # is the order of the strings. np.lexsort sorts by the last key first and is stable.
+        performances = self.performances
+        order = np.lexsort(
+            (
+                self._get_column("rank"),
+                self._get_column("event"),
+                self._get_column("athlete"),
+                self._get_column("event_date"),
+                performances if ascending else -performances,
+            )
         )
+        if self._records is not None:
+            self._records = [self._records[index] for index in order.tolist()]
+        else:
+            self._columns = {name: column[order] for name, column in self._columns.items()}
 
     def sanity_check_results(self, ascending: bool) -> bool:
         """
@@ -87,11 +302,10 @@ class RecordCollection:
         :param ascending: whether to check for ascending or descending order.
         :return: whether the records are sorted in the correct order.
         """
-        if len(self) <= 1:
-            return True
+        differences = np.diff(self.performances)
         if ascending:
-            return all(self[i].performance <= self[i + 1].performance for i in range(len(self) - 1))
-        return all(self[i].performance >= self[i + 1].performance for i in range(len(self) - 1))
+            return bool(np.all(differences >= 0))
+        return bool(np.all(differences <= 0))
 
     def __getitem__(self, index: int) -> Record:
         return self.records[index]
@@ -105,4 +319,53 @@ class RecordCollection:
         del self.records[index]
 
     def __len__(self) -> int:
-        return len(self.records)
+        if self._records is not None:
+            return len(self._records)
+        return len(self._columns["performance"])
+
+    def _get_column(self, name: str) -> np.ndarray:
+        if self._records is not None:
+            column, _ = RecordCollection._encode_column(name, self.get_values(name))
+            return column
+        return self._columns[name]
+
+    def _hash_fields(self, fields: tuple[str, ...]) -> np.ndarray:
+        values = [self.get_values(name) for name in fields]
+        wind_index = fields.index("wind")
+        values[wind_index] = [Record.normalize_wind(wind) for wind in values[wind_index]]
+        return np.fromiter(
+            (Record.hash_fields(*record_values) for record_values in zip(*values)), dtype=np.int64, count=len(self)
+        )
+
+    @staticmethod
+    def _encode_column(name: str, values: Sequence[Any]) -> tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Stores the values of a field in a typed column. Missing winds are NaN, missing dates NaT and missing ids
+        MISSING_ID. Strings are encoded by their index into the sorted distinct values (i.e., the dictionary).
+
+        :param name: the name of the field (see Record).
+        :param values: the values of the field.
+        :return: the column and the dictionary (None, if the field is not dictionary-encoded).
+        """
+
+        if name in ENCODED_FIELDS:
+            # values that are not strings (e.g., None) are kept as they are and ordered after the strings
+            distinct_values = sorted(
+                set(values), key=lambda value: (0, value) if isinstance(value, str) else (1, str(value))
+            )
+            codes = {value: code for code, value in enumerate(distinct_values)}
+            dictionary: np.ndarray = np.empty(len(distinct_values), dtype=object)
+            dictionary[:] = distinct_values
+            return np.fromiter((codes[value] for value in values), dtype=np.int32, count=len(values)), dictionary
+        if name in DATE_FIELDS:
+            return np.array(values, dtype="datetime64[D]"), None
+        if name in BOOLEAN_FIELDS:
+            return np.array(values, dtype=bool), None
+        if name == "wind":
+            return np.array([np.nan if wind is None else wind for wind in values], dtype=np.float64), None
+        if name == "id":
+            return (
+                np.array([MISSING_ID if record_id is None else record_id for record_id in values], dtype=np.int64),
+                None,
+            )
+        return np.array(values, dtype=np.int64), None
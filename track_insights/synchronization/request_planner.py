@@ -0,0 +1,186 @@
+import math
+from dataclasses import dataclass, field
+from typing import Optional
+
+import sqlalchemy
+from sqlalchemy import func
+from track_insights.database import DatabaseConnection
+from track_insights.database.models import Athlete, Discipline, Result
+from track_insights.scraping import BestlistCategory
+
+VALID_AMOUNTS = (10, 30, 100, 500, 5000)
+MAX_AMOUNT = VALID_AMOUNTS[-1]
+HEADROOM = 1.25  # expected growth of a bestlist since its last synchronization
+
+RowCounts = dict[tuple[int, int], int]  # (year, age) -> number of results
+
+
+@dataclass(frozen=True)
+class PlannedRequest:
+    """
+    Bestlist page that is requested.
+    """
+
+    year: Optional[int]
+    category: BestlistCategory
+    amount: int = MAX_AMOUNT
+
+
+@dataclass
+class RequestPlan:
+    """
+    Requests to synchronize a discipline. The bestlist of all years is requested first, if it is not full, the
+    remaining requests are skipped. Afterward, the bestlists of the years are requested. The categories of a year are
+    requested if the bestlist of the year is known to be full (or turns out to be full).
+    """
+
+    all_years: Optional[PlannedRequest] = None
+    years: list[PlannedRequest] = field(default_factory=list)
+    categories: dict[int, list[PlannedRequest]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return (
+            (self.all_years is not None)
+            + len(self.years)
+            + sum(len(category_requests) for category_requests in self.categories.values())
+        )
+
+
+class RequestPlanner:
+    """
+    Plans the requests of a discipline based on the number of results of previous synchronizations. Bestlists that
+    are known to exceed the maximum amount of records are not requested, instead their partitions (years or
+    categories) are requested directly. Every other bestlist is requested with the smallest amount that covers its
+    expected number of results. Without history, the planner falls back to requesting every bestlist completely.
+    """
+
+    def __init__(self, discipline: Discipline, row_counts: Optional[RowCounts] = None) -> None:
+        """
+        Initialize the planner.
+
+        :param discipline: the discipline to plan.
+        :param row_counts: the number of results in the database per (year, age of the athlete).
+        """
+
+        self.discipline = discipline
+        self.row_counts: RowCounts = row_counts or {}
+
+    @classmethod
+    def from_config(cls, config: dict, discipline: Discipline) -> "RequestPlanner":
+        """
+        Create the planner of a discipline. The history is only read if planning is enabled.
+
+        :param config: the system configuration.
+        :param discipline: the discipline to plan.
+        :return: the planner.
+        """
+
+        if not config.get("scraping", {}).get("plan_requests", False):
+            return cls(discipline)
+        return cls(discipline, RequestPlanner.read_row_counts(config, discipline))
+
+    @staticmethod
+    def read_row_counts(config: dict, discipline: Discipline) -> RowCounts:
+        """
+        Count the results of the discipline in the database.
+
+        :param config: the system configuration.
+        :param discipline: the discipline.
+        :return: the number of results per (year, age of the athlete).
+        """
+
+        year = sqlalchemy.extract("year", Result.date)
+        age = year - sqlalchemy.extract("year", Athlete.birthdate)
+        with DatabaseConnection(config) as database:
+            rows = (
+                database.session.query(year, age, func.count(Result.id))  # pylint: disable=not-callable
+                .join(Athlete, Result.athlete)
+                .filter(Result.discipline_id == discipline.id)
+                .group_by(year, age)
+                .all()
+            )
+        return {(int(row_year), int(row_age)): count for row_year, row_age, count in rows}
+
+    def plan(self, years: list[int], include_all_years: bool) -> RequestPlan:
+        """
+        Plan the requests of the discipline.
+
+        :param years: the years to synchronize.
+        :param include_all_years: whether the bestlist of all years is requested first.
+        :return: the plan.
+        """
+
+        plan = RequestPlan()
+        all_category = BestlistCategory.ALL_MEN if self.discipline.male else BestlistCategory.ALL_WOMEN
+        if include_all_years:
+            plan.all_years = self._plan_request(None, all_category)
+
+        for year in years:
+            request = self._plan_request(year, all_category)
+            if request is not None:
+                plan.years.append(request)
+            else:
+                plan.categories[year] = self.plan_categories(year)
+        return plan
+
+    def plan_categories(self, year: int) -> list[PlannedRequest]:
+        """
+        Plan the requests of all categories of a year. The categories are not partitioned any further, hence they
+        are always requested.
+
+        :param year: the year.
+        :return: the requests starting with the adult category followed by the junior categories.
+        """
+
+        adult_category = BestlistCategory.MEN if self.discipline.male else BestlistCategory.WOMEN
+        categories = [adult_category] + BestlistCategory.get_junior_categories(self.discipline.male)
+        return [
+            self._plan_request(year, category) or PlannedRequest(year, category, MAX_AMOUNT) for category in categories
+        ]
+
+    def get_expected_rows(self, year: Optional[int], category: BestlistCategory) -> Optional[int]:
+        """
+        Get the expected number of results of a bestlist.
+
+        :param year: (Optional) the year of the bestlist, otherwise all years are considered.
+        :param category: the category of the bestlist.
+        :return: the number of results or None, if the discipline has no history.
+        """
+
+        if len(self.row_counts) == 0:
+            return None
+
+        lower_bound, upper_bound = BestlistCategory.get_age_bounds(category)
+        return sum(
+            count
+            for (row_year, age), count in self.row_counts.items()
+            if (year is None or row_year == year) and lower_bound <= age < upper_bound
+        )
+
+    def _plan_request(self, year: Optional[int], category: BestlistCategory) -> Optional[PlannedRequest]:
+        """
+        Plan the request of a single bestlist.
+
+        :param year: (Optional) the year of the bestlist.
+        :param category: the category of the bestlist.
+        :return: the request or None, if the bestlist is known to be full.
+        """
+
+        expected_rows = self.get_expected_rows(year, category)
+        if expected_rows is None:
+            return PlannedRequest(year, category, MAX_AMOUNT)
+        if expected_rows >= MAX_AMOUNT:
+            return None
+        return PlannedRequest(year, category, RequestPlanner.get_amount(expected_rows))
+
+    @staticmethod
+    def get_amount(expected_rows: int) -> int:
+        """
+        Get the smallest valid amount that covers the expected number of results.
+
+        :param expected_rows: the expected number of results.
+        :return: the amount.
+        """
+
+        required_rows = math.ceil(expected_rows * HEADROOM)
+        return next((amount for amount in VALID_AMOUNTS if amount > required_rows), MAX_AMOUNT)
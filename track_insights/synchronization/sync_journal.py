@@ -0,0 +1,137 @@
+import json
+import logging
+from datetime import datetime
+from typing import Optional
+
+from track_insights.database import DatabaseConnection
+from track_insights.database.models import SyncRun, SyncUnit
+from track_insights.scraping import ScrapeConfig
+from track_insights.synchronization.synchronization_statistics import SynchronizationStatistics
+
+logger = logging.getLogger(__name__)
+
+UnitKey = tuple[int, str, Optional[int], bool]
+
+
+class SyncJournal:
+    """
+    Durable progress journal of a result fetcher run. Every bestlist page (unit) that is completely synchronized is
+    recorded together with its statistics, such that an interrupted run can be resumed without synchronizing the
+    completed units again.
+    """
+
+    def __init__(self, config: dict, run_id: int, completed_units: Optional[dict[UnitKey, bool]] = None) -> None:
+        """
+        Initialize the journal of a run. Use start() to create or resume a run.
+
+        :param config: the system configuration.
+        :param run_id: the identifier of the run.
+        :param completed_units: the units completed so far with whether their bestlist was full.
+        """
+
+        self.config = config
+        self.run_id = run_id
+        self.completed_units: dict[UnitKey, bool] = completed_units or {}
+
+    @classmethod
+    def start(cls, config: dict, arguments: dict, resume: bool = False) -> "SyncJournal":
+        """
+        Start a new run or resume the latest incomplete run with the same arguments.
+
+        :param config: the system configuration.
+        :param arguments: the filters of the run.
+        :param resume: whether to resume the latest incomplete run.
+        :return: the journal of the run.
+        """
+
+        serialized_arguments = json.dumps(arguments, sort_keys=True)
+        with DatabaseConnection(config) as database:
+            run: Optional[SyncRun] = None
+            if resume:
+                run = (
+                    database.session.query(SyncRun)
+                    .filter(SyncRun.arguments == serialized_arguments, SyncRun.end_date.is_(None))
+                    .order_by(SyncRun.id.desc())
+                    .first()
+                )
+                if run is None:
+                    logger.info("Found no incomplete run to resume. Starting a new run.")
+
+            if run is None:
+                run = SyncRun(arguments=serialized_arguments)
+                database.session.add(run)
+                database.session.commit()
+                return cls(config, run.id)
+
+            completed_units = {
+                (unit.discipline_id, unit.category, unit.year, unit.homologated): unit.full for unit in run.units
+            }
+            added_records = sum(unit.added_records for unit in run.units)
+            logger.info(
+                f"Resuming run {run.id}: {len(completed_units)} unit(s) are completed "
+                f"({added_records} records were inserted)."
+            )
+            return cls(config, run.id, completed_units)
+
+    @staticmethod
+    def get_key(scrape_config: ScrapeConfig) -> UnitKey:
+        return (
+            scrape_config.discipline.id,
+            scrape_config.category.value,
+            scrape_config.year,
+            scrape_config.only_homologated,
+        )
+
+    def get_completed(self, scrape_config: ScrapeConfig) -> Optional[bool]:
+        """
+        Check whether the unit was already completed during this run.
+
+        :param scrape_config: the scrape configuration of the unit.
+        :return: whether the bestlist of the unit was full or None, if the unit is not completed.
+        """
+
+        return self.completed_units.get(SyncJournal.get_key(scrape_config))
+
+    def record(self, scrape_config: ScrapeConfig, full_bl: bool, statistics: SynchronizationStatistics) -> None:
+        """
+        Record a completed unit.
+
+        :param scrape_config: the scrape configuration of the unit.
+        :param full_bl: whether the bestlist of the unit was full.
+        :param statistics: the synchronization statistics of the unit.
+        """
+
+        key = SyncJournal.get_key(scrape_config)
+        if key in self.completed_units:
+            return
+
+        with DatabaseConnection(self.config) as database:
+            database.session.add(
+                SyncUnit(
+                    run_id=self.run_id,
+                    discipline_id=scrape_config.discipline.id,
+                    category=scrape_config.category.value,
+                    year=scrape_config.year,
+                    homologated=scrape_config.only_homologated,
+                    full=full_bl,
+                    added_records=statistics.added_records,
+                    added_athletes=statistics.added_athletes,
+                    added_clubs=statistics.added_clubs,
+                    added_events=statistics.added_events,
+                    updates=statistics.updates,
+                    deletions=len(statistics.deletions),
+                )
+            )
+            database.session.commit()
+        self.completed_units[key] = full_bl
+
+    def finish(self) -> None:
+        """
+        Mark the run as complete, such that it is not resumed anymore.
+        """
+
+        with DatabaseConnection(self.config) as database:
+            run = database.session.get(SyncRun, self.run_id)
+            if run is not None:
+                run.end_date = datetime.now()
+                database.session.commit()
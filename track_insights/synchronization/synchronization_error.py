@@ -1,7 +1,7 @@
-from enum import auto
+from enum import Enum, auto
 
 
-class SynchronizationErrorType:
+class SynchronizationErrorType(Enum):
     CONNECTION_LOST = auto()
     UNKNOWN = auto()
 
@@ -15,3 +15,7 @@ class SynchronizationError(Exception):
         super().__init__(f"{error_type}: {message}")
         self.error_type = error_type
         self.message = message
+
+    def __reduce__(self) -> tuple[type, tuple[str, SynchronizationErrorType]]:
+        # errors are raised in worker processes and pickled to the main process
+        return SynchronizationError, (self.message, self.error_type)
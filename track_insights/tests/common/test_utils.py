@@ -1,4 +1,35 @@
-from track_insights.common.utils import parse_result
+import math
+
+import numpy as np
+import pandas as pd
+from track_insights.common.utils import (
+    parse_date,
+    parse_dates,
+    parse_float,
+    parse_floats,
+    parse_result,
+    parse_results,
+)
+
+SERIALIZED_RESULTS = [
+    "6.21",
+    "8",
+    "102.1",
+    "10931",
+    "0:09.14",
+    "01:35.5",
+    "63:12.3",
+    "1:05:15.10",
+    "25:58:32",
+    "10.23_SR_U23",
+    "1:02.48_SB\nWind",
+    "12,4",
+    "1:62.9",
+    "83.48.12",
+    "25:12:54:31",
+    "10.a4",
+    "",
+]
 
 
 def test_parse_result():
@@ -34,3 +65,29 @@ def test_parse_result():
     assert parse_result("83.48.12") == -1
     assert parse_result("25:12:54:31") == -1
     assert parse_result("10.a4") == -1
+
+
+def test_parse_results():
+    results = parse_results(pd.Series(SERIALIZED_RESULTS))
+    assert results.dtype == np.int64
+    assert results.tolist() == [parse_result(result) for result in SERIALIZED_RESULTS]
+    assert parse_results(pd.Series([], dtype=str)).tolist() == []
+
+
+def test_parse_dates():
+    serialized_dates = ["15.02.2000", "1.2.2000", "29.02.2024", "29.02.2023", "31.04.2020", "32.01.2020", "01.13.2020"]
+    serialized_dates += ["01.01.0878", "01.01.0000", "2000-02-15", "15.02.00", ""]
+    dates = parse_dates(pd.Series(serialized_dates))
+    assert dates.dtype == np.dtype("datetime64[D]")
+    assert [None if np.isnat(value) else value.item() for value in dates] == [
+        parse_date(serialized_date) for serialized_date in serialized_dates
+    ]
+
+
+def test_parse_floats():
+    serialized_values = ["1.2", "-0.4", "", "0"]
+    assert parse_floats(pd.Series(serialized_values)) == [parse_float(value) for value in serialized_values]
+
+    floats = parse_floats(pd.Series(["x", "", "2.1"]))
+    assert math.isnan(floats[0])
+    assert floats[1:] == [None, 2.1]
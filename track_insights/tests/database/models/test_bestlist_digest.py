@@ -0,0 +1,50 @@
+# pylint: disable=redefined-outer-name
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from track_insights.database.models import BestlistDigest, Discipline, DisciplineConfiguration
+
+
+@pytest.fixture(autouse=True)
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=True)
+    sess = sessionmaker(bind=engine)()
+
+    BestlistDigest.metadata.create_all(engine)
+
+    discipline_config = DisciplineConfiguration(name="Weit", ascending=False)
+    discipline = Discipline(discipline_code="Discipline_1", config=discipline_config, indoor=False, male=True)
+    sess.add(discipline)
+    sess.commit()
+
+    yield sess
+
+    sess.close()
+    engine.dispose()
+
+
+def test_add_bestlist_digest(session):
+    digest = BestlistDigest(discipline_id=1, category="M", year=None, homologated=False, digest="a" * 64)
+    session.add(digest)
+    session.commit()
+
+    extracted_digest: BestlistDigest = session.query(BestlistDigest).filter(BestlistDigest.id == 1).first()
+
+    assert extracted_digest is not None
+    assert extracted_digest.discipline_id == 1
+    assert extracted_digest.category == "M"
+    assert extracted_digest.year is None
+    assert not extracted_digest.homologated
+    assert extracted_digest.digest == "a" * 64
+    assert extracted_digest.sync_date is not None
+
+
+def test_constraints_bestlist_digest(session):
+    session.add(BestlistDigest(discipline_id=1, category="M", year=2023, homologated=False, digest="a" * 64))
+    session.add(BestlistDigest(discipline_id=1, category="M", year=2023, homologated=True, digest="b" * 64))
+    session.commit()
+
+    session.add(BestlistDigest(discipline_id=1, category="M", year=2023, homologated=False, digest="c" * 64))
+    with pytest.raises(IntegrityError):
+        session.commit()
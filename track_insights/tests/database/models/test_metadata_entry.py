@@ -0,0 +1,41 @@
+# pylint: disable=redefined-outer-name
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from track_insights.database.models import MetadataEntry
+
+
+@pytest.fixture(autouse=True)
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=True)
+    sess = sessionmaker(bind=engine)()
+
+    MetadataEntry.metadata.create_all(engine)
+
+    yield sess
+
+    sess.close()
+    engine.dispose()
+
+
+def test_add_metadata_entry(session):
+    fetch_date = datetime(2023, 5, 1, 12, 0)
+    session.add(MetadataEntry(key="years", value="[2023, 2022]", fetch_date=fetch_date))
+    session.commit()
+
+    extracted_entry: MetadataEntry = session.query(MetadataEntry).filter(MetadataEntry.key == "years").first()
+    assert extracted_entry is not None
+    assert extracted_entry.value == "[2023, 2022]"
+    assert extracted_entry.fetch_date == fetch_date
+
+
+def test_unique_key(session):
+    session.add(MetadataEntry(key="years", value="[]", fetch_date=datetime.now()))
+    session.commit()
+
+    session.add(MetadataEntry(key="years", value="[]", fetch_date=datetime.now()))
+    with pytest.raises(IntegrityError):
+        session.commit()
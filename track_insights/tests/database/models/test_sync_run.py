@@ -0,0 +1,66 @@
+# pylint: disable=redefined-outer-name
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from track_insights.database.models import Discipline, DisciplineConfiguration, SyncRun, SyncUnit
+
+
+@pytest.fixture(autouse=True)
+def session():
+    engine = create_engine("sqlite:///:memory:", echo=True)
+    sess = sessionmaker(bind=engine)()
+
+    SyncRun.metadata.create_all(engine)
+
+    discipline_config = DisciplineConfiguration(name="Weit", ascending=False)
+    discipline = Discipline(discipline_code="Discipline_1", config=discipline_config, indoor=False, male=True)
+    sess.add(discipline)
+    sess.commit()
+
+    yield sess
+
+    sess.close()
+    engine.dispose()
+
+
+def test_add_sync_run(session):
+    run = SyncRun(arguments='{"year": 2023}')
+    session.add(run)
+    session.commit()
+
+    unit = SyncUnit(run=run, discipline_id=1, category="M", year=None, homologated=False, full=True, added_records=5)
+    session.add(unit)
+    session.commit()
+
+    extracted_run: SyncRun = session.query(SyncRun).filter(SyncRun.id == 1).first()
+    assert extracted_run is not None
+    assert extracted_run.arguments == '{"year": 2023}'
+    assert extracted_run.start_date is not None
+    assert extracted_run.end_date is None
+    assert len(extracted_run.units) == 1
+
+    extracted_unit = extracted_run.units[0]
+    assert extracted_unit.full
+    assert extracted_unit.year is None
+    assert extracted_unit.added_records == 5
+    assert extracted_unit.updates == 0
+    assert extracted_unit.completion_date is not None
+
+    extracted_run.end_date = datetime.now()
+    session.commit()
+    assert session.query(SyncRun).filter(SyncRun.end_date.is_(None)).first() is None
+
+
+def test_constraints_sync_unit(session):
+    run = SyncRun(arguments="{}")
+    session.add(run)
+    session.add(SyncUnit(run=run, discipline_id=1, category="M", year=2023, homologated=False, full=True))
+    session.add(SyncUnit(run=run, discipline_id=1, category="M", year=2023, homologated=True, full=False))
+    session.commit()
+
+    session.add(SyncUnit(run=run, discipline_id=1, category="M", year=2023, homologated=False, full=False))
+    with pytest.raises(IntegrityError):
+        session.commit()
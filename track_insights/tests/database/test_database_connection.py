@@ -1,3 +1,6 @@
+import tempfile
+
+from sqlalchemy import inspect, text
 from track_insights.database import DatabaseConnection
 
 
@@ -27,3 +30,27 @@ def test_database_connection():
         assert database.host == ""
         assert database.port == 0
         assert database.database == ":memory:"
+
+
+def test_upgrade_tables():
+    with tempfile.TemporaryDirectory() as directory:
+        config = get_minimal_config()
+        config["database"]["database"] = f"{directory}/test.database"
+        with DatabaseConnection(config) as database:
+            database.create_tables()
+            # emulate a database created before the fingerprints were introduced
+            with database.engine.begin() as connection:
+                connection.execute(text("DROP INDEX ix_fingerprint"))
+                connection.execute(text("DROP INDEX ix_discipline_performance"))
+                connection.execute(text("DROP INDEX ix_discipline_date"))
+                connection.execute(text("ALTER TABLE results DROP COLUMN fingerprint"))
+
+            database.create_tables()
+            inspector = inspect(database.engine)
+            assert "fingerprint" in {column["name"] for column in inspector.get_columns("results")}
+            assert {"ix_fingerprint", "ix_discipline_performance", "ix_discipline_date"} <= {
+                index["name"] for index in inspector.get_indexes("results")
+            }
+
+            # upgrading an up-to-date database does not change it
+            database.upgrade_tables()
@@ -0,0 +1,75 @@
+import tempfile
+
+from sqlalchemy import text
+from track_insights.database import DatabaseConnection, EngineRegistry, PoolStatistics
+
+
+def get_minimal_config(database: str) -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": database,
+        }
+    }
+
+
+def test_shared_engine():
+    with tempfile.TemporaryDirectory() as directory:
+        config = get_minimal_config(f"{directory}/test.database")
+        config["database"]["pool"] = {"size": 2, "max_overflow": 1, "recycle": 3600, "pre_ping": True}
+        other_config = get_minimal_config(f"{directory}/other.database")
+
+        statistics = EngineRegistry.get_statistics()
+        try:
+            with DatabaseConnection(config) as database:
+                engine = database.engine
+                database.session.execute(text("SELECT 1"))
+            for _ in range(3):
+                with DatabaseConnection(config) as database:
+                    assert database.engine is engine
+                    database.session.execute(text("SELECT 1"))
+            with DatabaseConnection(other_config) as database:
+                assert database.engine is not engine
+
+            assert engine.pool.size() == 2
+            assert engine.pool._max_overflow == 1  # type: ignore[attr-defined]  # pylint: disable=protected-access
+            assert engine.pool._recycle == 3600  # type: ignore[attr-defined]  # pylint: disable=protected-access
+            assert engine.pool._pre_ping  # type: ignore[attr-defined]  # pylint: disable=protected-access
+            assert len(EngineRegistry.get_status()) >= 2
+
+            # the connection of the first session is reused by the subsequent sessions
+            total_statistics = EngineRegistry.get_statistics()
+            assert total_statistics.connects - statistics.connects == 1
+            assert total_statistics.checkouts - statistics.checkouts >= 4
+        finally:
+            EngineRegistry.dispose()
+
+        with DatabaseConnection(config) as database:
+            assert database.engine is not engine
+        EngineRegistry.dispose()
+
+
+def test_reset_after_fork():
+    with tempfile.TemporaryDirectory() as directory:
+        config = get_minimal_config(f"{directory}/test.database")
+        with DatabaseConnection(config) as database:
+            engine = database.engine
+            database.session.execute(text("SELECT 1"))
+
+        EngineRegistry._reset_after_fork()  # pylint: disable=protected-access
+        assert EngineRegistry.get_statistics() == PoolStatistics()
+        with DatabaseConnection(config) as database:
+            assert database.engine is not engine
+        EngineRegistry.dispose()
+
+
+def test_pool_statistics():
+    statistics = PoolStatistics(connects=1, checkouts=4, invalidations=0)
+    statistics.add(PoolStatistics(connects=1, checkouts=4, invalidations=1))
+    assert statistics == PoolStatistics(connects=2, checkouts=8, invalidations=1)
+    assert str(statistics) == "2 connects, 8 checkouts (75.0% reused), 1 invalidations"
+    assert str(PoolStatistics()) == "0 connects, 0 checkouts (0.0% reused), 0 invalidations"
@@ -0,0 +1,99 @@
+import os
+import pathlib
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from track_insights.database.models import Discipline
+from track_insights.scraping import BestlistCategory, BestlistFetcher, ScrapeConfig
+from track_insights.scraping.scraper import BASE_URL
+
+DF_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "resources" / "sample_page.html"
+
+
+class FakeSession:
+    """
+    Session that returns the sample page and keeps track of the number of concurrent requests.
+    """
+
+    def __init__(self, delay: float = 0.0, fail_year: int = -1):
+        with open(DF_PATH, "r", encoding="utf-8") as sample_file:
+            self.html = "".join(line.strip() for line in sample_file.read().split("\n"))
+        self.delay = delay
+        self.fail_year = fail_year
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requested_years: list[int] = []
+
+    def request(self, method: str, url: str, params: dict, timeout: int) -> MagicMock:
+        assert method == "GET"
+        assert url == BASE_URL
+        assert timeout > 0
+
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.requested_years.append(params["blyear"])
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+
+        if params["blyear"] == self.fail_year:
+            raise requests.exceptions.ConnectionError("Connection lost.")
+        response = MagicMock()
+        response.text = self.html
+        return response
+
+
+def get_sample_configs(years: list[int]) -> list[ScrapeConfig]:
+    discipline = Discipline(id=1, config_id=1, discipline_code="Test_Discipline", indoor=False, male=True)
+    return [ScrapeConfig(year=year, category=BestlistCategory.MEN, discipline=discipline, amount=30) for year in years]
+
+
+def test_fetch_all():
+    session = FakeSession()
+    fetcher = BestlistFetcher(session, max_in_flight=3)
+    scrape_configs = get_sample_configs(list(range(2023, 2013, -1)))
+
+    results = fetcher.fetch_all(scrape_configs)
+
+    assert len(results) == len(scrape_configs)
+    for scrape_config, (fetched_config, bestlist) in zip(scrape_configs, results):
+        assert fetched_config is scrape_config
+        assert len(bestlist.index) == 10
+    assert sorted(session.requested_years) == list(range(2014, 2024))
+
+
+def test_max_in_flight():
+    session = FakeSession(delay=0.05)
+    fetcher = BestlistFetcher(session, max_in_flight=2)
+
+    fetched = list(fetcher.iter_completed(get_sample_configs(list(range(2023, 2015, -1)))))
+
+    assert len(fetched) == 8
+    assert session.max_in_flight == 2
+
+
+def test_iter_completed_raises():
+    session = FakeSession(fail_year=2021)
+    fetcher = BestlistFetcher(session, max_in_flight=1)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        list(fetcher.iter_completed(get_sample_configs([2023, 2022, 2021, 2020])))
+
+
+def test_from_driver():
+    driver = MagicMock()
+    driver.execute_script.return_value = "Test Agent"
+    driver.get_cookies.return_value = [
+        {"name": "JSESSIONID", "value": "abc", "domain": "alabus.swiss-athletics.ch", "path": "/satweb"}
+    ]
+
+    fetcher = BestlistFetcher.from_driver(driver, max_in_flight=5)
+
+    assert fetcher.max_in_flight == 5
+    assert fetcher.session.headers["User-Agent"] == "Test Agent"
+    assert fetcher.session.cookies.get("JSESSIONID", domain="alabus.swiss-athletics.ch") == "abc"
@@ -0,0 +1,46 @@
+from track_insights.scraping.bestlist_parser import BestlistParser
+
+ONCLICK = "openURLForBestlist('https://www.swiss-athletics.ch/?&amp;con=CONTACT.1'); return false;"
+
+SAMPLE_TABLE = f"""
+<html><body><div>Before the table</div>
+<table role="grid">
+<thead><tr><th><span>Nr</span></th><th>Resultat</th><th>Name</th></tr></thead>
+<tbody>
+<tr><td>1</td><td> <span>8.32_SR</span><div class="ui-tooltip ui-widget ui-tooltip-right"><div>Tooltip</div>
+</div></td><td><a id="link" onclick="{ONCLICK}">Max &amp; Moritz</a></td></tr>
+<tr><td>2</td><td>8.22</td><td><span>Tester</span><a onclick="ignored">Link</a></td></tr>
+</tbody>
+</table>
+<table><tr><th>Other</th></tr><tr><td>Table</td></tr></table>
+</body></html>
+"""
+
+
+def test_parse():
+    parser = BestlistParser.parse(SAMPLE_TABLE)
+
+    assert parser.done
+    assert parser.header == ["Nr", "Resultat", "Name"]
+    assert parser.rows == [["1", "8.32_SR", "Max & Moritz"], ["2", "8.22", "TesterLink"]]
+    assert parser.links == [
+        [None, None, "openURLForBestlist('https://www.swiss-athletics.ch/?&con=CONTACT.1'); return false;"],
+        [None, None, None],
+    ]
+
+
+def test_parse_incremental():
+    parser = BestlistParser()
+    for char in SAMPLE_TABLE:
+        parser.feed(char)
+    parser.close()
+
+    assert parser.rows == BestlistParser.parse(SAMPLE_TABLE).rows
+
+
+def test_no_table():
+    parser = BestlistParser.parse("<html><body><div>No results</div></body></html>")
+
+    assert not parser.done
+    assert parser.header == []
+    assert parser.rows == []
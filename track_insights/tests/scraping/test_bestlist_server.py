@@ -0,0 +1,64 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import patch
+
+import pytest
+import requests
+from track_insights.database.models import Discipline
+from track_insights.scraping import BestlistCategory, JsfSession, ScrapeConfig, Scraper
+from track_insights.scraping.bestlist_server import BestlistServer
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+
+
+@pytest.fixture
+def server():
+    generator = BestlistPageGenerator(num_disciplines=2, num_years=3, results_per_discipline=300)
+    with BestlistServer(generator) as bestlist_server:
+        with (
+            patch("track_insights.scraping.scraper.BASE_URL", bestlist_server.url),
+            patch("track_insights.scraping.jsf_session.BASE_URL", bestlist_server.url),
+        ):
+            yield bestlist_server
+
+
+def get_scrape_config(category: BestlistCategory) -> ScrapeConfig:
+    return ScrapeConfig(
+        category=category,
+        discipline=Discipline(id=1, discipline_code="synthetic-o-1", indoor=False, male=True),
+        amount=500,
+    )
+
+
+def test_extract_metadata(server):
+    assert Scraper.extract_available_years() == server.generator.years
+    assert Scraper.extract_disciplines(True, True) == server.generator.get_disciplines(True)
+
+
+def test_extract_data(server):
+    with requests.Session() as session:
+        bestlist = Scraper(get_scrape_config(BestlistCategory.ALL_MEN), session).extract_data()
+
+    assert bestlist is not None
+    assert len(bestlist.index) == 300
+
+    response = requests.get(server.url.replace("bestlist", "unknown"), timeout=10)
+    assert response.status_code == 404
+
+
+def test_exclusive_session(server):
+    scrape_config = get_scrape_config(BestlistCategory.U_18_M)
+
+    session = JsfSession()
+    session.open()
+    bestlist = Scraper(scrape_config, session).extract_data()
+
+    exclusive_session = JsfSession()
+    exclusive_session.open()
+    exclusive_session.enable_exclusive_categories()
+    exclusive_bestlist = Scraper(scrape_config, exclusive_session).extract_data()
+
+    assert session.window_guid == server.generator.window_guid
+    assert len(exclusive_bestlist.index) < len(bestlist.index)
+    assert set(exclusive_bestlist["athlete_code"]) <= set(bestlist["athlete_code"])
+
+    session.quit()
+    exclusive_session.quit()
@@ -0,0 +1,134 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from track_insights.scraping import CircuitBreaker, FetchPolicy, RateLimiter
+from track_insights.scraping.fetch_policy import AdaptiveTimeout
+
+
+def get_response(status_code: int, headers: dict = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+def test_rate_limiter():
+    rate_limiter = RateLimiter(rate=50, burst=2)
+
+    # the bucket starts full
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == 0
+
+    start_time = time.monotonic()
+    assert rate_limiter.acquire() > 0
+    assert time.monotonic() - start_time >= 0.015
+
+
+def test_circuit_breaker():
+    circuit_breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05, max_cooldown=0.1, max_trips=3)
+
+    circuit_breaker.record_failure()
+    assert not circuit_breaker.is_open
+    circuit_breaker.record_success()
+    circuit_breaker.record_failure()
+    assert not circuit_breaker.is_open
+
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open
+    assert circuit_breaker.trips == 1
+
+    # failures of requests that were in flight do not trip the breaker again
+    circuit_breaker.record_failure()
+    assert circuit_breaker.trips == 1
+
+    assert circuit_breaker.wait() > 0
+    assert not circuit_breaker.is_open
+
+    # a failing probe opens the breaker immediately
+    circuit_breaker.record_failure()
+    assert circuit_breaker.is_open
+    assert circuit_breaker.trips == 2
+    assert not circuit_breaker.exhausted
+
+    circuit_breaker.trip()
+    assert circuit_breaker.exhausted
+
+    circuit_breaker.record_success()
+    assert not circuit_breaker.is_open
+    assert not circuit_breaker.exhausted
+    assert circuit_breaker.wait() == 0
+
+
+def test_adaptive_timeout():
+    timeout = AdaptiveTimeout(min_timeout=10, max_timeout=120, seconds_per_record=0.0025)
+
+    assert timeout.get(30) == 10
+    assert timeout.get(5000) == 50
+    assert timeout.get(100000) == 120
+
+    # small pages are dominated by the latency and do not change the estimate
+    timeout.observe(30, 5)
+    assert timeout.seconds_per_record == 0.0025
+
+    timeout.observe(5000, 50)
+    assert timeout.seconds_per_record > 0.0025
+    assert timeout.get(5000) > 50
+
+
+def test_from_config():
+    policy = FetchPolicy.from_config({})
+    assert policy.rate_limiter is None
+    assert policy.max_retries == 3
+
+    policy = FetchPolicy.from_config(
+        {"scraping": {"fetch_policy": {"requests_per_second": 2, "burst": 4, "max_retries": 5, "max_trips": 2}}}
+    )
+    assert policy.rate_limiter.rate == 2
+    assert policy.rate_limiter.burst == 4
+    assert policy.max_retries == 5
+    assert policy.circuit_breaker.max_trips == 2
+
+    # concurrent processes share the rate
+    policy = FetchPolicy.from_config({"scraping": {"fetch_policy": {"requests_per_second": 2, "burst": 4}}}, 4)
+    assert policy.rate_limiter.rate == 0.5
+    assert policy.rate_limiter.burst == 1
+
+
+def test_get_backoff():
+    policy = FetchPolicy(backoff_base=1, backoff_max=5)
+
+    for attempt in range(10):
+        assert 0 <= policy.get_backoff(attempt) <= min(5, 2**attempt)
+
+
+@patch.object(time, "sleep")
+def test_request(sleep_mock: MagicMock):
+    policy = FetchPolicy(max_retries=2)
+    response = get_response(200)
+
+    send = MagicMock(side_effect=[requests.exceptions.ConnectionError(), requests.exceptions.ReadTimeout(), response])
+    assert policy.request(send, 5000) is response
+    assert send.call_count == 3
+    assert sleep_mock.call_count == 2
+    assert send.call_args_list[0].args[0] == 50
+    assert policy.circuit_breaker.failures == 0
+
+    send = MagicMock(side_effect=requests.exceptions.ConnectionError())
+    with pytest.raises(requests.exceptions.ConnectionError):
+        policy.request(send, 30)
+    assert send.call_count == 3
+
+
+@patch.object(time, "sleep")
+def test_request_throttled(sleep_mock: MagicMock):
+    policy = FetchPolicy(max_retries=1, backoff_base=0.001)
+
+    send = MagicMock(side_effect=[get_response(429, {"Retry-After": "7"}), get_response(200)])
+    assert policy.request(send, 30).status_code == 200
+    sleep_mock.assert_called_once_with(7.0)
+
+    send = MagicMock(return_value=get_response(503))
+    with pytest.raises(requests.exceptions.RetryError):
+        policy.request(send, 30)
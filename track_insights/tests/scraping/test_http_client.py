@@ -0,0 +1,63 @@
+# pylint: disable=redefined-outer-name
+from unittest.mock import MagicMock
+
+import pytest
+from track_insights.scraping import HttpClient, HttpStatistics
+from track_insights.scraping.bestlist_server import BestlistServer
+from track_insights.scraping.http_client import ACCEPT_ENCODING
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+
+
+@pytest.fixture
+def server():
+    generator = BestlistPageGenerator(num_disciplines=1, num_years=1, results_per_discipline=300)
+    with BestlistServer(generator) as bestlist_server:
+        yield bestlist_server
+
+
+def test_init():
+    client = HttpClient(pool_maxsize=4)
+
+    assert client.headers["Accept-Encoding"] == ACCEPT_ENCODING
+    assert "gzip" in ACCEPT_ENCODING and "deflate" in ACCEPT_ENCODING
+    assert client.get_adapter("https://www.example.com")._pool_maxsize == 4  # pylint: disable=protected-access
+    assert client.statistics == HttpStatistics()
+
+
+def test_shared():
+    assert HttpClient.shared() is HttpClient.shared()
+
+
+def test_from_driver():
+    driver = MagicMock()
+    driver.execute_script.return_value = "user-agent"
+    driver.get_cookies.return_value = [{"name": "JSESSIONID", "value": "session", "domain": "localhost", "path": "/"}]
+
+    client = HttpClient.from_driver(driver)
+
+    assert client.headers["User-Agent"] == "user-agent"
+    assert client.cookies.get("JSESSIONID") == "session"
+
+
+def test_request_statistics(server):
+    total_statistics = HttpClient.get_total_statistics()
+    with HttpClient() as client:
+        response = client.get(server.url, timeout=10)
+        response.raise_for_status()
+        client.get(server.url, timeout=10)
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert client.statistics.requests == 2
+    assert client.statistics.content_bytes == 2 * len(response.content)
+    assert 0 < client.statistics.received_bytes < client.statistics.content_bytes
+    assert client.statistics.elapsed_time > 0
+
+    total_statistics.add(client.statistics)
+    assert HttpClient.get_total_statistics() == total_statistics
+
+
+def test_statistics_add():
+    statistics = HttpStatistics(requests=1, received_bytes=10, content_bytes=20, elapsed_time=0.5)
+    statistics.add(HttpStatistics(requests=2, received_bytes=5, content_bytes=15, elapsed_time=1.0))
+
+    assert statistics == HttpStatistics(requests=3, received_bytes=15, content_bytes=35, elapsed_time=1.5)
@@ -0,0 +1,84 @@
+import os
+import pathlib
+from unittest.mock import MagicMock, patch
+
+import pytest
+from track_insights.scraping import BestlistCategory, JsfSession
+from track_insights.scraping.scraper import BASE_URL
+
+DF_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "resources" / "sample_page.html"
+
+PARTIAL_RESPONSE = """<?xml version='1.0' encoding='UTF-8'?>
+<partial-response id="j_id1"><changes>
+<update id="form_anonym:bestlistSearches"><![CDATA[<div></div>]]></update>
+<update id="j_id1:javax.faces.ViewState:0"><![CDATA[view-state-{0}]]></update>
+</changes></partial-response>"""
+
+ERROR_RESPONSE = """<?xml version='1.0' encoding='UTF-8'?>
+<partial-response><error><error-name>ViewExpiredException</error-name>
+<error-message><![CDATA[View expired]]></error-message></error></partial-response>"""
+
+
+def get_page_response() -> MagicMock:
+    with open(DF_PATH, "r", encoding="utf-8") as sample_file:
+        response = MagicMock()
+        response.text = sample_file.read()
+    return response
+
+
+def get_partial_response(index: int) -> MagicMock:
+    response = MagicMock()
+    response.text = PARTIAL_RESPONSE.format(index)
+    return response
+
+
+def test_open():
+    session = JsfSession()
+    with (
+        patch.object(session, "get", return_value=get_page_response()) as get_mock,
+        patch.object(session, "post", return_value=get_partial_response(1)) as post_mock,
+    ):
+        session.open()
+
+        get_mock.assert_called_once_with(BASE_URL, timeout=10)
+        post_mock.assert_called_once()
+
+        data = post_mock.call_args.kwargs["data"]
+        assert data["javax.faces.source"] == "form_anonym:bestlistType"
+        assert data["form_anonym:bestlistType_input"] == "0"
+        assert data["javax.faces.ViewState"] == "-1273999470537917596:-4139814188658411250"
+        assert data["aeswindowguid"] == "ba98d03b-e0c1-43a5-fd72-a05130146a60"
+        assert post_mock.call_args.kwargs["headers"]["Faces-Request"] == "partial/ajax"
+
+    assert session.view_state == "view-state-1"
+    assert session.window_guid == "ba98d03b-e0c1-43a5-fd72-a05130146a60"
+
+
+def test_enable_exclusive_categories():
+    session = JsfSession()
+    session.view_state = "view-state-0"
+
+    with patch.object(session, "post", side_effect=[get_partial_response(i) for i in range(1, 4)]) as post_mock:
+        session.enable_exclusive_categories()
+
+        assert post_mock.call_count == 3
+        sent_data = [call.kwargs["data"] for call in post_mock.call_args_list]
+
+    assert sent_data[0]["form_anonym:bestlistYear_input"] == "2023"
+    assert sent_data[1]["form_anonym:bestlistCategory_input"] == BestlistCategory.U_10_M.value
+    assert sent_data[2]["form_anonym:categoryExclusive_input"] == "on"
+
+    # every request carries the view state of the previous response
+    assert [data["javax.faces.ViewState"] for data in sent_data] == ["view-state-0", "view-state-1", "view-state-2"]
+    assert session.view_state == "view-state-3"
+
+
+def test_partial_response_error():
+    session = JsfSession()
+    session.view_state = "view-state-0"
+
+    error_response = MagicMock()
+    error_response.text = ERROR_RESPONSE
+    with patch.object(session, "post", return_value=error_response):
+        with pytest.raises(ValueError, match="View expired"):
+            session.enable_exclusive_categories()
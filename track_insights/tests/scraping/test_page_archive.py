@@ -0,0 +1,108 @@
+import os
+import pathlib
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from track_insights.database.models import Discipline, DisciplineConfiguration
+from track_insights.scraping import ArchivedPage, BestlistCategory, PageArchive, ScrapeConfig, Scraper
+from track_insights.scraping.page_archive import INDEX_SUFFIX, MEGABYTES_TO_BYTES, PAGES_SUFFIX
+
+
+def get_sample_config(year: int) -> ScrapeConfig:
+    discipline = Discipline(id=1, config_id=1, discipline_code="Test_Discipline", indoor=False, male=True)
+    discipline.config = DisciplineConfiguration(id=1, name="100 m", ascending=True)
+    return ScrapeConfig(year=year, category=BestlistCategory.MEN, discipline=discipline, amount=30)
+
+
+def test_from_config():
+    assert PageArchive.from_config({}) is None
+    assert PageArchive.from_config({"scraping": {}}) is None
+
+    archive = PageArchive.from_config({"scraping": {"archive": {"path": "/tmp/archive", "segment_size": 2}}})
+    assert archive.path == pathlib.Path("/tmp/archive")
+    assert archive.segment_size == 2 * MEGABYTES_TO_BYTES
+
+
+def test_put_read():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        archive.put(get_sample_config(2020), "<html>Bestlist äöü</html>")
+        archive.put(get_sample_config(2019), "<html>Bestlist 2019</html>")
+
+        pages = list(archive.iter_pages())
+        assert len(pages) == 2
+        assert pages[0].read() == "<html>Bestlist äöü</html>"
+        assert pages[1].read() == "<html>Bestlist 2019</html>"
+        assert pages[0].segment_path == pages[1].segment_path
+        assert pages[1].offset == pages[0].length
+
+        page = pages[0]
+        assert page.discipline_code == "Test_Discipline"
+        assert page.discipline_name == "100 m"
+        assert page.category == BestlistCategory.MEN
+        assert (page.year, page.amount, page.allow_wind, page.only_homologated) == (2020, 30, True, False)
+
+        sample_config = get_sample_config(2020)
+        assert page.get_scrape_config(sample_config.discipline) == sample_config
+
+
+def test_unit_key():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        config = get_sample_config(2020)
+        archive.put(config, "<html></html>")
+        config.amount = 5000
+        archive.put(config, "<html></html>")
+        archive.put(get_sample_config(2019), "<html></html>")
+
+        first, second, third = archive.iter_pages()
+        assert first.get_unit_key() == second.get_unit_key()
+        assert first.get_unit_key() != third.get_unit_key()
+
+
+def test_segments():
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory)
+        archive = PageArchive(path, segment_size=1 / MEGABYTES_TO_BYTES)
+        archive.put(get_sample_config(2020), "<html>2020</html>")
+        archive.put(get_sample_config(2019), "<html>2019</html>")
+
+        # every segment exceeds the size of a single byte
+        assert len(list(path.glob(f"*{PAGES_SUFFIX}"))) == 2
+        assert len(list(path.glob(f"*{INDEX_SUFFIX}"))) == 2
+        assert sorted(page.read() for page in archive.iter_pages()) == ["<html>2019</html>", "<html>2020</html>"]
+
+        # a forked process starts its own segment
+        archive = PageArchive(path)
+        archive.put(get_sample_config(2018), "<html>2018</html>")
+        with patch.object(os, "getpid", return_value=-1):
+            archive.put(get_sample_config(2017), "<html>2017</html>")
+        assert len(list(path.glob(f"*{PAGES_SUFFIX}"))) == 4
+
+
+def test_incomplete_index_entry():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        archive.put(get_sample_config(2020), "<html>2020</html>")
+
+        (index_path,) = pathlib.Path(directory).glob(f"*{INDEX_SUFFIX}")
+        with open(index_path, "a", encoding="utf-8") as index_file:
+            index_file.write('{"source": "interrupted')
+
+        pages = list(archive.iter_pages())
+        assert len(pages) == 1
+        assert isinstance(pages[0], ArchivedPage)
+
+
+def test_scraper_archives_requested_pages():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        driver = MagicMock()
+        driver.request.return_value = MagicMock(ok=True, text="<html>Bestlist</html>")
+
+        with patch.object(Scraper, "parse_bestlist", return_value=None):
+            Scraper(get_sample_config(2020), driver, archive=archive).extract_data()
+            driver.request.return_value = MagicMock(ok=False, text="<html>Error</html>")
+            Scraper(get_sample_config(2019), driver, archive=archive).extract_data()
+
+        assert [page.read() for page in archive.iter_pages()] == ["<html>Bestlist</html>"]
@@ -0,0 +1,89 @@
+import pathlib
+import tempfile
+import time
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from track_insights.database.models import Discipline
+from track_insights.scraping import BestlistCategory, ResponseCache, ScrapeConfig, Scraper
+from track_insights.scraping.response_cache import HOURS_TO_SECONDS
+
+
+def get_sample_config(year: int) -> ScrapeConfig:
+    return ScrapeConfig(
+        year=year,
+        category=BestlistCategory.MEN,
+        discipline=Discipline(id=1, config_id=1, discipline_code="Test_Discipline", indoor=False, male=True),
+        amount=30,
+    )
+
+
+def test_from_config():
+    assert ResponseCache.from_config({}) is None
+    assert ResponseCache.from_config({"scraping": {}}) is None
+
+    cache = ResponseCache.from_config({"scraping": {"cache": {"path": "/tmp/cache", "ttl_current_season": 1}}})
+    assert cache.path == pathlib.Path("/tmp/cache")
+    assert cache.ttl_current_season == HOURS_TO_SECONDS
+
+
+def test_get_key():
+    config = get_sample_config(2020)
+    assert ResponseCache.get_key(config) == ResponseCache.get_key(get_sample_config(2020))
+    assert ResponseCache.get_key(config) != ResponseCache.get_key(get_sample_config(2021))
+
+    config.only_homologated = True
+    assert ResponseCache.get_key(config) != ResponseCache.get_key(get_sample_config(2020))
+
+
+def test_put_get():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(pathlib.Path(directory))
+        config = get_sample_config(2020)
+
+        assert cache.get(config) is None
+        cache.put(config, "<html>Bestlist äöü</html>")
+        assert cache.get(config) == "<html>Bestlist äöü</html>"
+        assert cache.get(get_sample_config(2019)) is None
+
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert len(list(pathlib.Path(directory).rglob("*.html.gz"))) == 1
+        assert len(list(pathlib.Path(directory).rglob("*.tmp"))) == 0
+
+
+def test_ttl():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(pathlib.Path(directory), ttl_past_seasons=10, ttl_current_season=1)
+        past_config = get_sample_config(date.today().year - 1)
+        current_config = get_sample_config(date.today().year)
+        all_years_config = get_sample_config(date.today().year)
+        all_years_config.year = None
+
+        for config in [past_config, current_config, all_years_config]:
+            cache.put(config, "page")
+
+        now = time.time()
+        with patch("time.time", return_value=now + 2 * HOURS_TO_SECONDS):
+            assert cache.get(past_config) == "page"
+            assert cache.get(current_config) is None
+            assert cache.get(all_years_config) is None
+
+        with patch("time.time", return_value=now + 11 * HOURS_TO_SECONDS):
+            assert cache.get(past_config) is None
+
+
+def test_scraper_uses_cache():
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ResponseCache(pathlib.Path(directory))
+        config = get_sample_config(2020)
+        driver = MagicMock()
+        driver.request.return_value.text = "<html></html>"
+
+        with patch.object(Scraper, "parse_bestlist", return_value=None) as parse_mock:
+            Scraper(config, driver, cache).extract_data()
+            Scraper(config, driver, cache).extract_data()
+
+            driver.request.assert_called_once()
+            assert parse_mock.call_count == 2
+            parse_mock.assert_called_with("<html></html>")
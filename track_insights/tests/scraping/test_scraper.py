@@ -2,10 +2,13 @@ import os
 import pathlib
 from unittest.mock import MagicMock, patch
 
+import pytest
 from bs4 import BeautifulSoup, Tag
 from track_insights.database.models import Discipline
-from track_insights.scraping import BestlistCategory, BestlistColumn, ScrapeConfig, Scraper
-from track_insights.scraping.scraper import BASE_URL, EVENT_KEY
+from track_insights.scraping import BestlistCategory, BestlistColumn, HttpClient, ScrapeConfig, Scraper
+from track_insights.scraping.bestlist_parser import BestlistParser
+from track_insights.scraping.scraper import ATHLETE_KEY, BASE_URL, CLUB_KEY, EVENT_KEY
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
 
 DF_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "resources" / "sample_page.html"
 
@@ -52,6 +55,57 @@ def test__extract_code():
     assert event == "a21aa-6dqfqu-lik5k1lr-1-liy58dcw-4w2"
 
 
+def test__parse_codes():
+    onclicks = [
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?&mobile=false&evt=EVT_1&con=CON_1'); return false;",
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?con=CON%2F2&evt=EVT+2');"
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?con=OTHER');",
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?mobile=false'); return false;",
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?econ=WRONG&con=CON_4#con=FRAGMENT');",
+    ]
+    for key in (ATHLETE_KEY, EVENT_KEY):
+        assert Scraper._parse_codes(onclicks, key) == [Scraper._parse_code(onclick, key) for onclick in onclicks]
+    assert Scraper._parse_codes(onclicks, ATHLETE_KEY) == ["CON_1", "CON/2", "", "CON_4"]
+    assert Scraper._parse_codes(onclicks, EVENT_KEY) == ["EVT_1", "EVT 2", "", ""]
+    assert Scraper._parse_codes([], EVENT_KEY) == []
+
+    # handlers without links are reported like in the per-cell path
+    with pytest.raises(ValueError):
+        Scraper._parse_codes(onclicks + [None], ATHLETE_KEY)
+    with pytest.raises(IndexError):
+        Scraper._parse_codes(onclicks + ["return false;"], ATHLETE_KEY)
+
+    # the first link of a handler is parsed, even if a later link of the handler holds the key
+    onclicks.append(
+        "return true; openURLForBestlist('https://www.swiss-athletics.ch/de/page');"
+        "openURLForBestlist('https://www.swiss-athletics.ch/de/page?con=LATER&evt=LATER');"
+    )
+    for key in (ATHLETE_KEY, EVENT_KEY):
+        assert Scraper._parse_codes(onclicks, key) == [Scraper._parse_code(onclick, key) for onclick in onclicks]
+    assert Scraper._parse_codes(onclicks, ATHLETE_KEY) == ["CON_1", "CON/2", "", "CON_4", ""]
+
+
+@pytest.mark.parametrize("indoor", [True, False])
+def test__parse_codes_page(indoor: bool):
+    with open(DF_PATH, "r", encoding="utf-8") as sample_file:
+        sample_page = "".join(line.strip() for line in sample_file.read().split("\n"))
+    generator = BestlistPageGenerator(num_disciplines=1, num_years=2, results_per_discipline=500)
+    _, code = generator.get_disciplines(indoor)[0]
+    synthetic_page = generator.render_page({"disci": code, "blcat": "M", "blyear": "all", "top": "500"})
+
+    for page in (sample_page, synthetic_page):
+        parser = BestlistParser.parse(page)
+        assert len(parser.links) > 0
+        for index in range(len(parser.header)):
+            onclicks = [links[index] for links in parser.links]
+            if None in onclicks:
+                continue
+            for key in (ATHLETE_KEY, CLUB_KEY, EVENT_KEY):
+                assert Scraper._parse_codes(onclicks, key) == [
+                    Scraper._parse_code(onclick, key) for onclick in onclicks
+                ]
+
+
 def test_extract_data():
     config = get_sample_config()
 
@@ -116,7 +170,7 @@ def test_extract_data():
         assert val[5] == f"{idx + 1:02d}.08.2022"
 
 
-@patch("requests.get")
+@patch.object(HttpClient, "get")
 def test_extract_available_years(requests_mock: MagicMock):
     config = get_sample_config()
 
@@ -134,7 +188,7 @@ def test_extract_available_years(requests_mock: MagicMock):
     requests_mock.assert_called_once_with(BASE_URL, timeout=10)
 
 
-@patch("requests.get")
+@patch.object(HttpClient, "get")
 def test_extract_disciplines(requests_mock: MagicMock):
     config = get_sample_config()
 
@@ -0,0 +1,72 @@
+from track_insights.scraping import BestlistCategory, Scraper
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+
+
+def get_generator() -> BestlistPageGenerator:
+    return BestlistPageGenerator(num_disciplines=3, num_years=3, results_per_discipline=500, seed=1)
+
+
+def test_get_disciplines():
+    generator = get_generator()
+
+    outdoor_disciplines = generator.get_disciplines(False)
+    assert len(outdoor_disciplines) == 3
+    assert outdoor_disciplines[0] == ("60 m", "synthetic-o-0")
+    assert generator.get_disciplines(True)[1] == ("100 m Halle", "synthetic-i-1")
+
+
+def test_get_results():
+    generator = get_generator()
+    all_results = generator.get_results("synthetic-o-0", BestlistCategory.ALL_MEN)
+
+    assert len(all_results) == 500
+    assert all_results == sorted(all_results, key=lambda result: result.performance)
+    assert all_results == get_generator().get_results("synthetic-o-0", BestlistCategory.ALL_MEN)
+
+    top_results = generator.get_results("synthetic-o-0", BestlistCategory.ALL_MEN, amount=30)
+    assert top_results == all_results[:30]
+
+    year = generator.years[1]
+    year_results = generator.get_results("synthetic-o-0", BestlistCategory.ALL_MEN, year)
+    assert 0 < len(year_results) < len(all_results)
+    assert all(generator.get_event_date(result.event).year == year for result in year_results)
+
+    no_wind_results = generator.get_results("synthetic-o-0", BestlistCategory.ALL_MEN, allow_wind=False)
+    assert all(result.wind <= 2.0 for result in no_wind_results)
+
+    homologated_results = generator.get_results("synthetic-o-0", BestlistCategory.ALL_MEN, only_homologated=True)
+    assert all(result.homologated for result in homologated_results)
+
+
+def test_get_results_exclusive():
+    generator = get_generator()
+
+    results = generator.get_results("synthetic-o-0", BestlistCategory.U_16_M)
+    exclusive_results = generator.get_results("synthetic-o-0", BestlistCategory.U_16_M, exclusive=True)
+    assert set(exclusive_results) < set(results)
+
+    for result in exclusive_results:
+        age = generator.get_event_date(result.event).year - generator.get_birthdate(result.athlete).year
+        assert 14 <= age < 16
+
+
+def test_render_page():
+    generator = get_generator()
+    params = {"blyear": "all", "blcat": BestlistCategory.ALL_WOMEN.value, "disci": "synthetic-o-2", "top": "100"}
+
+    bestlist = Scraper.parse_bestlist(generator.render_page(params))
+    assert bestlist is not None
+    assert len(bestlist.index) == 100
+    assert list(bestlist.columns[:4]) == ["Nr", "Resultat", "Wind", "NH*"]
+    assert bestlist["athlete_code"].str.startswith("CONTACT.SYN.").all()
+    assert bestlist["club_code"].str.startswith("ACC.SYN.").all()
+    assert bestlist["event_code"].str.startswith("evt-syn-").all()
+
+    params["indoor"] = "True"
+    params["hom"] = "1"
+    indoor_bestlist = Scraper.parse_bestlist(generator.render_page(params))
+    assert "Wind" not in indoor_bestlist.columns
+    assert "NH*" not in indoor_bestlist.columns
+
+    params["blyear"] = str(generator.years[0] + 1)
+    assert Scraper.parse_bestlist(generator.render_page(params)) is None
@@ -0,0 +1,77 @@
+from unittest.mock import MagicMock
+
+from selenium.common.exceptions import WebDriverException
+from track_insights.scraping import WebDriverPool
+from track_insights.scraping.webdriver_pool import is_healthy
+
+
+def get_factory() -> MagicMock:
+    return MagicMock(side_effect=MagicMock)
+
+
+def test_acquire_release():
+    factory = get_factory()
+    pool = WebDriverPool(factory, max_uses=10)
+
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() == driver
+    factory.assert_called_once()
+
+    # a second driver is created while the first one is in use
+    other_driver = pool.acquire()
+    assert other_driver != driver
+    assert pool.created == 2
+
+
+def test_warm_up():
+    factory = get_factory()
+    pool = WebDriverPool(factory, max_idle=2)
+
+    pool.warm_up(5)
+    assert factory.call_count == 2
+
+    pool.acquire()
+    assert factory.call_count == 2
+
+
+def test_recycle_after_max_uses():
+    factory = get_factory()
+    pool = WebDriverPool(factory, max_uses=2)
+
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() == driver
+    pool.release(driver)
+
+    driver.quit.assert_called_once()
+    assert pool.recycled == 1
+    assert pool.acquire() != driver
+
+
+def test_unhealthy_drivers():
+    factory = get_factory()
+    pool = WebDriverPool(factory)
+
+    driver = pool.acquire()
+    pool.release(driver, healthy=False)
+    driver.quit.assert_called_once()
+
+    driver = pool.acquire()
+    pool.release(driver)
+    type(driver).current_url = property(MagicMock(side_effect=WebDriverException("Chrome crashed.")))
+    assert not is_healthy(driver)
+    assert pool.acquire() != driver
+    assert driver.quit.call_count == 1
+
+
+def test_close():
+    factory = get_factory()
+    with WebDriverPool(factory, max_idle=3) as pool:
+        pool.warm_up(3)
+        drivers = [pool.acquire() for _ in range(3)]
+        for driver in drivers:
+            pool.release(driver)
+
+    for driver in drivers:
+        driver.quit.assert_called_once()
@@ -0,0 +1,112 @@
+import os
+import pathlib
+import tempfile
+
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Discipline, DisciplineConfiguration, Result
+from track_insights.scraping import BestlistCategory, PageArchive, ScrapeConfig
+from track_insights.scraping.synthetic_bestlist import BestlistPageGenerator
+from track_insights.synchronization import ArchiveReplayer, SynchronizationStatistics
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_archive_replayer.database"
+GENERATOR = BestlistPageGenerator(num_disciplines=2, num_years=2, results_per_discipline=200)
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        }
+    }
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def get_scrape_config(index: int, year=None, amount: int = 5000) -> ScrapeConfig:
+    name, code = GENERATOR.get_disciplines(False)[index]
+    discipline = Discipline(discipline_code=code, indoor=False, male=True)
+    discipline.config = DisciplineConfiguration(name=name, ascending=True)
+    return ScrapeConfig(category=BestlistCategory.ALL_MEN, discipline=discipline, year=year, amount=amount)
+
+
+def archive_page(archive: PageArchive, scrape_config: ScrapeConfig, amount=None) -> None:
+    params = {key: str(value) for key, value in scrape_config.get_query_arguments().items()}
+    if amount is not None:
+        params["top"] = str(amount)
+    archive.put(scrape_config, GENERATOR.render_page(params))
+
+
+def replay(replayer: ArchiveReplayer, num_workers: int, **filters) -> SynchronizationStatistics:
+    disciplines = replayer.get_disciplines(**filters)
+    statistics = SynchronizationStatistics()
+    for outcome in replayer.replay(disciplines, filters.get("year"), num_workers):
+        statistics.add(outcome())
+    return statistics
+
+
+def test_get_disciplines():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        archive_page(archive, get_scrape_config(0))
+        archive_page(archive, get_scrape_config(1, year=GENERATOR.years[0]))
+
+        replayer = ArchiveReplayer(get_minimal_config(), archive, set())
+        disciplines = replayer.get_disciplines()
+        assert [discipline.discipline_code for discipline in disciplines] == ["synthetic-o-0", "synthetic-o-1"]
+        assert disciplines[0].config.name == GENERATOR.get_disciplines(False)[0][0]
+
+        # registered disciplines are reused
+        assert [discipline.id for discipline in replayer.get_disciplines()] == [disciplines[0].id, disciplines[1].id]
+
+        assert len(replayer.get_disciplines(year=GENERATOR.years[0])) == 1
+        assert len(replayer.get_disciplines(discipline_name=GENERATOR.get_disciplines(False)[0][0])) == 1
+        assert len(replayer.get_disciplines(indoor=True)) == 0
+        assert len(replayer.get_disciplines(male=False)) == 0
+
+
+def test_replay():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        # the first page is superseded by the second page of the same bestlist
+        archive_page(archive, get_scrape_config(0, amount=100), amount=50)
+        archive_page(archive, get_scrape_config(0))
+        archive_page(archive, get_scrape_config(1))
+
+        replayer = ArchiveReplayer(get_minimal_config(), archive, set())
+        assert len(replayer.pages) == 2
+
+        statistics = replay(replayer, num_workers=1)
+        assert statistics.added_records > 0
+        with DatabaseConnection(get_minimal_config()) as database:
+            num_results = database.session.query(Result).count()
+        assert num_results == statistics.added_records
+
+        # replaying again (in worker processes) does not change the database
+        statistics = replay(ArchiveReplayer(get_minimal_config(), archive, set()), num_workers=2)
+        assert statistics.added_records == 0
+        assert statistics.updates == 0
+        assert len(statistics.deletions) == 0
+
+
+def test_replay_truncated_page():
+    with tempfile.TemporaryDirectory() as directory:
+        archive = PageArchive(pathlib.Path(directory))
+        archive_page(archive, get_scrape_config(0, amount=30))
+
+        statistics = replay(ArchiveReplayer(get_minimal_config(), archive, set()), num_workers=1)
+        assert statistics.added_records == 0
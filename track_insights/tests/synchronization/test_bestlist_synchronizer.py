@@ -1,13 +1,23 @@
 import os
 import pathlib
 import tempfile
+from dataclasses import replace
 from datetime import date
 
 import pandas as pd
-from track_insights.database import DatabaseConnection
+import sqlalchemy
+from track_insights.database import DatabaseConnection, EngineRegistry
 from track_insights.database.models import Athlete, Club, Discipline, DisciplineConfiguration, Event, Result
 from track_insights.scraping import BestlistCategory, ScrapeConfig
-from track_insights.synchronization import BestlistSynchronizer, Record, RecordCollection
+from track_insights.synchronization import (
+    BestlistSynchronizer,
+    CachedEntity,
+    DigestStore,
+    EntityCache,
+    Record,
+    RecordCollection,
+    SynchronizationStatistics,
+)
 
 DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_bestlist_synchronizer.database"
 DF_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "resources" / "sample_dataframe.csv"
@@ -65,6 +75,7 @@ def setup_function():
 
 
 def teardown_function():
+    EngineRegistry.dispose()
     DATABASE.unlink()
 
 
@@ -204,6 +215,82 @@ def test__fetch_records_from_database():
         database.session.commit()
 
 
+def test__fetch_records_from_database_statements():
+    with DatabaseConnection(get_minimal_config()) as database:
+        for index in range(20):
+            database.session.add(
+                Result(
+                    athlete_id=1,
+                    club_id=1,
+                    event_id=1,
+                    discipline_id=1,
+                    performance=800 + index,
+                    wind=None,
+                    rank="1f1",
+                    location="Thun",
+                    date=date.fromisoformat("2023-10-10"),
+                    points=0,
+                )
+            )
+        database.session.commit()
+
+    synchronizer = get_sample_synchronizer()
+    statements: list[str] = []
+
+    def track_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    sqlalchemy.event.listen(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+    try:
+        records = synchronizer._fetch_records_from_database(synchronizer.scrape_config.discipline, None)
+    finally:
+        sqlalchemy.event.remove(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+
+    # the records are read with a single statement instead of loading the entries of each result
+    assert len(records) == 20
+    assert all(record.athlete == "Max Mustermann" and record.club_code == "Club_1" for record in records)
+    assert len([statement for statement in statements if statement.startswith("SELECT")]) == 1
+
+
+def test__fetch_records_from_database_category():
+    with DatabaseConnection(get_minimal_config()) as database:
+        # born right outside and inside the bounds of the U20 category in 2023 (aged 18 and 19)
+        for index, birthdate in enumerate(["2003-12-31", "2004-01-01", "2005-12-31", "2006-01-01"]):
+            athlete = Athlete(
+                athlete_code=f"Athlete_{index + 2}",
+                name=f"Tester_{index + 2}",
+                birthdate=date.fromisoformat(birthdate),
+                nationality="SUI",
+                latest_date=date.fromisoformat("2023-12-31"),
+            )
+            for result_date in ["2022-12-31", "2023-01-01", "2023-12-31", "2024-01-01"]:
+                database.session.add(
+                    Result(
+                        athlete=athlete,
+                        club_id=1,
+                        event_id=1,
+                        discipline_id=1,
+                        performance=800,
+                        wind=None,
+                        rank="1f1",
+                        location="Thun",
+                        date=date.fromisoformat(result_date),
+                        points=0,
+                    )
+                )
+        database.session.commit()
+
+    synchronizer = get_sample_synchronizer()
+    synchronizer.scrape_config.category = BestlistCategory.U_20_M
+    records = synchronizer._fetch_records_from_database(synchronizer.scrape_config.discipline, None)
+    assert sorted((record.athlete_code, record.event_date.isoformat()) for record in records) == [
+        ("Athlete_3", "2023-01-01"),
+        ("Athlete_3", "2023-12-31"),
+        ("Athlete_4", "2023-01-01"),
+        ("Athlete_4", "2023-12-31"),
+    ]
+
+
 def test__update_entries():
     athlete = Athlete(
         athlete_code="Athlete_1",
@@ -334,6 +421,37 @@ def test__compare_records():
     bl_records[2].club = "LV Muster"
 
 
+def test__match_fingerprints():
+    bl_records = RecordCollection(records=[get_sample_record(833), get_sample_record(833), get_sample_record(820)])
+    bl_records[2].location = "Zürich"
+
+    # the duplicate is dropped, the changed and the not yet fingerprinted results remain
+    stored_fingerprints = {
+        1: get_sample_record(833).get_fingerprint(),
+        2: get_sample_record(820).get_fingerprint(),
+        3: None,
+    }
+    unmatched_records, unmatched_ids = BestlistSynchronizer._match_fingerprints(bl_records, stored_fingerprints)
+    assert unmatched_records.records == [bl_records[2]]
+    assert unmatched_ids == [2, 3]
+
+
+def test_fingerprints():
+    record = get_sample_record(833)
+    other = get_sample_record(833)
+    assert record.get_fingerprint() == other.get_fingerprint()
+
+    other.wind = -2.04  # equal according to equal_wind
+    assert record.get_fingerprint() == other.get_fingerprint()
+
+    other.athlete = "Max"
+    assert record.get_fingerprint() != other.get_fingerprint()
+    assert record.get_similarity_fingerprint() == other.get_similarity_fingerprint()
+
+    other.location = "Zürich"
+    assert record.get_similarity_fingerprint() != other.get_similarity_fingerprint()
+
+
 def get_sample_record(performance: int) -> Record:
     return Record(
         performance=performance,
@@ -406,6 +524,269 @@ def test__insert_records():
         database.session.commit()
 
 
+def test__insert_records_batched():
+    synchronizer = get_sample_synchronizer()
+
+    records: list[Record] = []
+    for index in range(50):
+        record = get_sample_record(800 - index)
+        record.athlete = f"Athlete {index % 20}"
+        record.athlete_code = f"Athlete_{index % 20 + 2}"
+        record.event_code = f"Event_{index % 10 + 2}"
+        record.event = f"Test Event {index % 10 + 2}"
+        # clubs without code are identified by their name
+        record.club_code = "" if index % 2 == 0 else "Club_1"
+        record.club = "LV Ohnecode" if index % 2 == 0 else "LV Muster"
+        records.append(record)
+
+    statements: list[str] = []
+    with DatabaseConnection(get_minimal_config()) as database:
+        discipline = database.session.get(Discipline, 1)
+        sqlalchemy.event.listen(
+            database.session.get_bind(),
+            "before_cursor_execute",
+            lambda _conn, _cursor, statement, *_args: statements.append(statement),
+        )
+        sync_statistics = synchronizer._insert_records(
+            database.session,
+            records,
+            discipline,
+            BestlistCategory.get_age_bounds(synchronizer.scrape_config.category),
+        )
+        database.session.commit()
+        num_statements = len(statements)
+
+        assert sync_statistics.added_records == 50
+        assert sync_statistics.added_athletes == 20
+        assert sync_statistics.added_clubs == 1  # LV Ohnecode
+        assert sync_statistics.added_events == 10
+        assert sync_statistics.updates == 0
+
+        assert database.session.query(Athlete).count() == 21
+        assert database.session.query(Club).filter(Club.name == "LV Ohnecode").one().club_code is None
+        assert database.session.query(Result).count() == 50
+
+    # the entries are looked up and inserted with a constant number of statements
+    lookups = [statement for statement in statements[:num_statements] if statement.lstrip().startswith("SELECT")]
+    assert len(lookups) <= 8  # before and after the insertion, clubs are looked up by code and by name
+    for table in ("athletes", "clubs", "events", "results"):
+        assert sum(f"INSERT INTO {table}" in statement for statement in statements[:num_statements]) == 1
+
+
+def test__insert_records_shared_club_name():
+    synchronizer = get_sample_synchronizer()
+
+    # the same club appears with and without its code on a single page (in both orders)
+    records: list[Record] = []
+    for index, (club, club_code) in enumerate(
+        [("LV Ohnecode", ""), ("LV Ohnecode", "Club_2"), ("LV Neu", "Club_1"), ("LV Neu", "")]
+    ):
+        record = get_sample_record(800 - index)
+        record.club = club
+        record.club_code = club_code
+        record.event_date = date.fromisoformat("2023-02-11")
+        records.append(record)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        sync_statistics = synchronizer._insert_records(
+            database.session,
+            records,
+            database.session.get(Discipline, 1),
+            BestlistCategory.get_age_bounds(synchronizer.scrape_config.category),
+        )
+        database.session.commit()
+        assert sync_statistics.added_records == 4
+        assert sync_statistics.added_clubs == 1  # LV Ohnecode (Club_2)
+        assert sync_statistics.updates == 1  # LV Muster -> LV Neu
+
+        clubs: list[Club] = database.session.query(Club).order_by(Club.id).all()
+        assert [(club.name, club.club_code) for club in clubs] == [("LV Neu", "Club_1"), ("LV Ohnecode", "Club_2")]
+
+        results: list[Result] = database.session.query(Result).order_by(Result.performance.desc()).all()
+        assert [result.club.club_code for result in results] == ["Club_2", "Club_2", "Club_1", "Club_1"]
+
+
+def test__insert_records_manual():
+    synchronizer = get_sample_synchronizer()
+
+    # the athlete is too old for the category, hence the result is tagged as manual (once)
+    records = [get_sample_record(833), get_sample_record(833)]
+    # results that differ in their location or homologation only are distinct
+    records.append(replace(records[0], location="Bern"))
+    records.append(replace(records[0], not_homologated=True))
+    with DatabaseConnection(get_minimal_config()) as database:
+        sync_statistics = synchronizer._insert_records(
+            database.session, records, database.session.get(Discipline, 1), (0, 10)
+        )
+        database.session.commit()
+        assert sync_statistics.added_records == 3
+
+        sync_statistics = synchronizer._insert_records(
+            database.session, records, database.session.get(Discipline, 1), (0, 10)
+        )
+        database.session.commit()
+        assert sync_statistics.added_records == 0
+
+        results: list[Result] = database.session.query(Result).all()
+        assert len(results) == 3 and all(result.manual for result in results)
+        assert sorted((result.location, result.homologated) for result in results) == [
+            ("Bern", True),
+            ("Thun", False),
+            ("Thun", True),
+        ]
+
+
+def test__insert_records_cached():
+    config = get_minimal_config()
+    config["synchronization"] = {"entity_cache_size": 100}
+    cache = EntityCache.from_config(config)
+    assert cache is not None
+    cache.clear()
+    sample_bestlist = pd.read_csv(DF_PATH, keep_default_na=False, dtype=str)
+    synchronizer = BestlistSynchronizer(config, get_scrape_config(), sample_bestlist)
+
+    def insert_records(records: list[Record]) -> tuple[SynchronizationStatistics, list[str]]:
+        statements: list[str] = []
+        with DatabaseConnection(config) as database:
+            sqlalchemy.event.listen(
+                database.session.get_bind(),
+                "before_cursor_execute",
+                lambda _conn, _cursor, statement, *_args: statements.append(statement),
+            )
+            sync_statistics = synchronizer._insert_records(
+                database.session, records, database.session.get(Discipline, 1), (0, 100)
+            )
+            database.session.commit()
+        entity_lookups = [
+            statement
+            for statement in statements
+            if any(f"FROM {table}" in statement for table in ("athletes", "clubs", "events"))
+        ]
+        return sync_statistics, entity_lookups
+
+    sync_statistics, entity_lookups = insert_records([get_sample_record(833)])
+    assert sync_statistics.added_records == 1 and len(entity_lookups) == 3
+    assert len(cache) == 3
+
+    # the entries are known and not updated by the record, hence they are not looked up again
+    sync_statistics, entity_lookups = insert_records([get_sample_record(820)])
+    assert sync_statistics.added_records == 1 and len(entity_lookups) == 0
+
+    # a later record updates the athlete, hence the athlete is loaded
+    record = get_sample_record(810)
+    record.athlete = "Max Neu"
+    record.event_date = date(2023, 2, 11)
+    sync_statistics, entity_lookups = insert_records([record])
+    assert sync_statistics.updates == 1 and len(entity_lookups) == 3
+
+    # a record of the same date only updates the athlete, whose values differ from the cached ones
+    record = get_sample_record(800)
+    record.event_date = date(2023, 2, 11)
+    sync_statistics, entity_lookups = insert_records([record])
+    assert sync_statistics.updates == 1 and len(entity_lookups) == 1
+
+    with DatabaseConnection(config) as database:
+        athlete = database.session.query(Athlete).one()
+        assert (athlete.name, athlete.latest_date) == ("Max Mustermann", date(2023, 2, 11))
+        assert cache.get(Athlete.__tablename__, "Athlete_1") == CachedEntity(
+            athlete.id, athlete.latest_date, (athlete.name, athlete.birthdate, athlete.nationality)
+        )
+    cache.clear()
+
+
+def test_synchronize_clears_digests():
+    digest_store = DigestStore(get_minimal_config())
+    scrape_config = get_scrape_config()
+    scrape_config.year = None
+    bestlist = pd.read_csv(DF_PATH, keep_default_na=False, dtype=str)
+    with tempfile.NamedTemporaryFile() as error_file:
+        path = pathlib.Path(error_file.name)
+        BestlistSynchronizer(get_minimal_config(), scrape_config, bestlist).synchronize(path, set())
+        digest_store.store(scrape_config, "a" * 64)
+
+        # an unchanged bestlist keeps the digests
+        BestlistSynchronizer(get_minimal_config(), scrape_config, bestlist).synchronize(path, set())
+        assert digest_store.is_unchanged(scrape_config, "a" * 64)
+
+        # a result is deleted, hence the digests of the discipline are cleared
+        BestlistSynchronizer(get_minimal_config(), scrape_config, bestlist.drop(index=3)).synchronize(path, set())
+        assert not digest_store.is_unchanged(scrape_config, "a" * 64)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        assert database.session.query(Result).count() == 6
+
+
+def test_synchronize_similar():
+    with tempfile.NamedTemporaryFile() as error_file:
+        path = pathlib.Path(error_file.name)
+        get_sample_synchronizer().synchronize(path, set())
+
+        # the athletes are renamed, hence all records are similar to the database records
+        renamed_bestlist = pd.read_csv(DF_PATH, keep_default_na=False, dtype=str)
+        renamed_bestlist["Name"] = renamed_bestlist["Name"] + " Neu"
+        synchronizer = BestlistSynchronizer(get_minimal_config(), get_scrape_config(), renamed_bestlist)
+
+        statements: list[str] = []
+
+        def track_statement(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        sqlalchemy.event.listen(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+        try:
+            sync_statistics = synchronizer.synchronize(path, set())
+        finally:
+            sqlalchemy.event.remove(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+
+    assert len(sync_statistics.deletions) == 0
+    assert sync_statistics.updates == 2  # Max and Tester_10 (the latest result of the shared athlete)
+
+    # the results are loaded at once instead of one by one
+    assert not any(statement.startswith("SELECT") and "WHERE results.id = ?" in statement for statement in statements)
+    with DatabaseConnection(get_minimal_config()) as database:
+        athletes: list[Athlete] = database.session.query(Athlete).order_by(Athlete.athlete_code.asc()).all()
+        assert [athlete.name for athlete in athletes] == ["Max Neu", "Tester_10 Neu"]
+
+
+def test_synchronize_fingerprints():
+    def get_synchronizer() -> BestlistSynchronizer:
+        # the sample results are of 2022, hence all years are synchronized (and all results are within the bestlist)
+        synchronizer = get_sample_synchronizer()
+        synchronizer.scrape_config.year = None
+        synchronizer.bl_limit_reached = False
+        return synchronizer
+
+    with tempfile.NamedTemporaryFile() as error_file:
+        path = pathlib.Path(error_file.name)
+        sync_statistics = get_synchronizer().synchronize(path, set())
+        assert sync_statistics.added_records > 0
+
+        with DatabaseConnection(get_minimal_config()) as database:
+            assert database.session.query(Result).filter(Result.fingerprint.is_(None)).count() == 0
+            # a result without fingerprint (e.g., inserted before the column existed) receives it upon the next match
+            database.session.query(Result).update({Result.fingerprint: None})
+            database.session.commit()
+
+        get_synchronizer().synchronize(path, set())
+        with DatabaseConnection(get_minimal_config()) as database:
+            assert database.session.query(Result).filter(Result.fingerprint.is_(None)).count() == 0
+
+        statements: list[str] = []
+
+        def track_statement(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        sqlalchemy.event.listen(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+        try:
+            sync_statistics = get_synchronizer().synchronize(path, set())
+        finally:
+            sqlalchemy.event.remove(sqlalchemy.engine.Engine, "before_cursor_execute", track_statement)
+
+    # unchanged results are matched by their fingerprint, hence they are neither read completely nor written
+    assert sync_statistics.added_records == 0 and sync_statistics.updates == 0
+    assert not any("results.location" in statement for statement in statements)
+    assert not any(statement.startswith(("INSERT", "UPDATE", "DELETE")) for statement in statements)
+
+
 def test_synchronize():
     synchronizer = get_sample_synchronizer()
     with DatabaseConnection(get_minimal_config()) as database:
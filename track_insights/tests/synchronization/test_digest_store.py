@@ -0,0 +1,119 @@
+import os
+import pathlib
+from dataclasses import replace
+from unittest.mock import patch
+
+import pandas as pd
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Discipline, DisciplineConfiguration
+from track_insights.scraping import BestlistCategory, ScrapeConfig
+from track_insights.synchronization import DigestStore
+from track_insights.synchronization.digest_store import DIGEST_VERSION
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_digest_store.database"
+DF_PATH = pathlib.Path(os.path.abspath(__file__)).parent.parent / "resources" / "sample_dataframe.csv"
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        },
+        "synchronization": {"skip_unchanged": True},
+    }
+
+
+def get_scrape_config() -> ScrapeConfig:
+    return ScrapeConfig(
+        year=None,
+        category=BestlistCategory.MEN,
+        discipline=Discipline(id=1, discipline_code="Discipline_1", indoor=False, male=True),
+        allow_wind=False,
+        amount=30,
+        only_homologated=False,
+    )
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+        discipline_config = DisciplineConfiguration(name="Weit", ascending=False)
+        discipline = Discipline(discipline_code="Discipline_1", config=discipline_config, indoor=False, male=True)
+        database.session.add(discipline)
+        database.session.commit()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def test_from_config():
+    assert isinstance(DigestStore.from_config(get_minimal_config()), DigestStore)
+    assert DigestStore.from_config({}) is None
+    assert DigestStore.from_config({"synchronization": {"skip_unchanged": False}}) is None
+
+
+def test_compute_digest():
+    scrape_config = get_scrape_config()
+    bestlist = pd.read_csv(DF_PATH)
+
+    digest = DigestStore.compute_digest(scrape_config, bestlist, {"entry1", "entry2"})
+    assert len(digest) == 64
+    assert digest == DigestStore.compute_digest(scrape_config, bestlist.copy(), {"entry2", "entry1"})
+
+    changed_bestlist = bestlist.copy()
+    changed_bestlist.iloc[0, 0] += 1
+    assert digest != DigestStore.compute_digest(scrape_config, changed_bestlist, {"entry1", "entry2"})
+    assert digest != DigestStore.compute_digest(replace(scrape_config, allow_wind=True), bestlist, {"entry1", "entry2"})
+
+    # the ignored entries and the version decide on the synchronization as well
+    assert digest != DigestStore.compute_digest(scrape_config, bestlist, {"entry1"})
+    with patch("track_insights.synchronization.digest_store.DIGEST_VERSION", DIGEST_VERSION + 1):
+        assert digest != DigestStore.compute_digest(scrape_config, bestlist, {"entry1", "entry2"})
+
+
+def test_store():
+    store = DigestStore(get_minimal_config())
+    scrape_config = get_scrape_config()
+
+    assert not store.is_unchanged(scrape_config, "a" * 64)
+
+    store.store(scrape_config, "a" * 64)
+    assert store.is_unchanged(scrape_config, "a" * 64)
+    assert not store.is_unchanged(scrape_config, "b" * 64)
+
+    # digests are kept per year, category and homologation
+    assert not store.is_unchanged(replace(scrape_config, year=2023), "a" * 64)
+    assert not store.is_unchanged(replace(scrape_config, only_homologated=True), "a" * 64)
+    assert not store.is_unchanged(replace(scrape_config, category=BestlistCategory.WOMEN), "a" * 64)
+
+    store.store(scrape_config, "b" * 64)
+    assert store.is_unchanged(scrape_config, "b" * 64)
+    assert not store.is_unchanged(scrape_config, "a" * 64)
+
+
+def test_clear():
+    store = DigestStore(get_minimal_config())
+    scrape_config = get_scrape_config()
+    store.store(scrape_config, "a" * 64)
+    store.store(replace(scrape_config, year=2023), "a" * 64)
+    other_discipline = Discipline(id=2, discipline_code="Discipline_2", indoor=True, male=True)
+    other_config = replace(scrape_config, discipline=other_discipline)
+    store.store(other_config, "a" * 64)
+
+    # only the digests of the discipline are cleared
+    with DatabaseConnection(get_minimal_config()) as database:
+        DigestStore.clear(database.session, scrape_config.discipline)
+        database.session.commit()
+    assert not store.is_unchanged(scrape_config, "a" * 64)
+    assert not store.is_unchanged(replace(scrape_config, year=2023), "a" * 64)
+    assert store.is_unchanged(other_config, "a" * 64)
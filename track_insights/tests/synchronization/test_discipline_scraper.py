@@ -1,8 +1,31 @@
+import dataclasses
+import time
 from unittest.mock import MagicMock, patch
 
+import pandas as pd
+import pytest
+import requests
 from track_insights.database.models import Discipline, DisciplineConfiguration
-from track_insights.scraping import BestlistCategory, ScrapeConfig, Scraper
-from track_insights.synchronization import BestlistSynchronizer, DisciplineSynchronizer
+from track_insights.scraping import (
+    BestlistCategory,
+    BestlistFetcher,
+    DriverPools,
+    JsfSession,
+    ScrapeConfig,
+    Scraper,
+    WebDriverPool,
+)
+from track_insights.synchronization import (
+    BestlistSynchronizer,
+    DigestStore,
+    DisciplineSynchronizer,
+    PlannedRequest,
+    RequestPlanner,
+    SynchronizationError,
+)
+from track_insights.synchronization.discipline_synchronizer import MAX_RETRIES
+from track_insights.synchronization.request_planner import MAX_AMOUNT
+from track_insights.synchronization.synchronization_error import SynchronizationErrorType
 from track_insights.synchronization.synchronization_statistics import SynchronizationStatistics
 
 
@@ -85,7 +108,7 @@ def test__get_scrape_years(extract_available_years_mock: MagicMock):
 def test__scrape_bestlist(synchronize_mock: MagicMock, init_mock: MagicMock):
     discipline = get_sample_discipline()
     discipline_scraper = DisciplineSynchronizer({}, set(), discipline)
-    sample_config = get_sample_config()
+    sample_config = dataclasses.replace(get_sample_config(), amount=MAX_AMOUNT)
 
     with patch.object(Scraper, "extract_data", return_value=None) as extract_data_mock:
         full_bl, _ = discipline_scraper._scrape_bestlist(sample_config)
@@ -95,7 +118,7 @@ def test__scrape_bestlist(synchronize_mock: MagicMock, init_mock: MagicMock):
         extract_data_mock.assert_called_once()
 
     bestlist_mock = MagicMock()
-    bestlist_mock.index = list(range(30))
+    bestlist_mock.index = list(range(MAX_AMOUNT))
     with patch.object(Scraper, "extract_data", return_value=bestlist_mock) as extract_data_mock:
         full_bl, _ = discipline_scraper._scrape_bestlist(sample_config)
         assert full_bl
@@ -111,6 +134,94 @@ def test__scrape_bestlist(synchronize_mock: MagicMock, init_mock: MagicMock):
         extract_data_mock.assert_called_once()
 
 
+@patch.object(DisciplineSynchronizer, "_synchronize_bestlist", return_value=(False, SynchronizationStatistics()))
+def test__scrape_bestlist_escalate(synchronize_bestlist_mock: MagicMock):
+    with patch.object(Scraper, "extract_available_years", return_value=[2023]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), get_sample_discipline())
+    sample_config = get_sample_config()
+
+    truncated_bestlist = pd.DataFrame({"Resultat": [str(value) for value in range(30)]})
+    complete_bestlist = pd.DataFrame({"Resultat": [str(value) for value in range(42)]})
+    with patch.object(
+        Scraper, "extract_data", side_effect=[truncated_bestlist, complete_bestlist]
+    ) as extract_data_mock:
+        discipline_scraper._scrape_bestlist(sample_config)
+
+        # the truncated bestlist is requested again with the maximum amount and only the complete one is synchronized
+        assert extract_data_mock.call_count == 2
+        assert sample_config.amount == MAX_AMOUNT
+        synchronize_bestlist_mock.assert_called_once_with(sample_config, complete_bestlist)
+
+    synchronize_bestlist_mock.reset_mock()
+    sample_config.amount = 100
+    with patch.object(Scraper, "extract_data", return_value=complete_bestlist) as extract_data_mock:
+        discipline_scraper._scrape_bestlist(sample_config)
+
+        extract_data_mock.assert_called_once()
+        assert sample_config.amount == 100
+        synchronize_bestlist_mock.assert_called_once_with(sample_config, complete_bestlist)
+
+
+@patch.object(time, "sleep")
+def test_scrape_discipline_retry(sleep_mock: MagicMock):
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), get_sample_discipline())
+
+    statistics = SynchronizationStatistics(added_records=3)
+
+    def scrape_all_years(scrape_config: ScrapeConfig, start_year: int, _) -> SynchronizationStatistics:
+        if start_year is None:
+            scrape_config.year = 2022
+            raise requests.exceptions.ConnectionError()
+        return statistics
+
+    with patch.object(
+        DisciplineSynchronizer, "_scrape_all_years", side_effect=scrape_all_years
+    ) as scrape_all_years_mock:
+        assert discipline_scraper.scrape_discipline() is statistics
+
+        # the retry resumes from the year that was scraped
+        assert scrape_all_years_mock.call_count == 2
+        assert scrape_all_years_mock.call_args.args[1] == 2022
+        sleep_mock.assert_called_once()
+
+    with patch.object(
+        DisciplineSynchronizer, "_scrape_all_years", side_effect=requests.exceptions.ConnectionError()
+    ) as scrape_all_years_mock:
+        with pytest.raises(SynchronizationError) as err:
+            discipline_scraper.scrape_discipline()
+        assert err.value.error_type == SynchronizationErrorType.CONNECTION_LOST
+        assert scrape_all_years_mock.call_count == MAX_RETRIES + 1
+
+
+@patch.object(BestlistSynchronizer, "__init__", return_value=None)
+@patch.object(BestlistSynchronizer, "synchronize", return_value=SynchronizationStatistics())
+def test__synchronize_bestlist_unchanged(synchronize_mock: MagicMock, init_mock: MagicMock):
+    with patch.object(Scraper, "extract_available_years", return_value=[2023]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), get_sample_discipline())
+    sample_config = get_sample_config()
+    bestlist = pd.DataFrame({"Resultat": [str(value) for value in range(30)]})
+
+    digest_store = MagicMock()
+    discipline_scraper.digest_store = digest_store
+
+    digest_store.is_unchanged.return_value = True
+    full_bl, statistics = discipline_scraper._synchronize_bestlist(sample_config, bestlist)
+    assert full_bl
+    assert statistics == SynchronizationStatistics()
+    init_mock.assert_not_called()
+    synchronize_mock.assert_not_called()
+    digest_store.store.assert_not_called()
+
+    digest_store.is_unchanged.return_value = False
+    full_bl, _ = discipline_scraper._synchronize_bestlist(sample_config, bestlist)
+    assert full_bl
+    synchronize_mock.assert_called_once()
+    digest_store.store.assert_called_once_with(
+        sample_config, DigestStore.compute_digest(sample_config, bestlist, discipline_scraper.ignored_entries)
+    )
+
+
 @patch.object(DisciplineSynchronizer, "_scrape_bestlist", return_value=(True, None))
 def test__scrape_homologated(scrape_bestlist_mock: MagicMock):
     discipline = get_sample_discipline()
@@ -126,28 +237,65 @@ def test__scrape_homologated(scrape_bestlist_mock: MagicMock):
     scrape_bestlist_mock.assert_called_once_with(sample_config)
 
 
-@patch.object(DisciplineSynchronizer, "_setup_exclusive_driver")
-@patch.object(DisciplineSynchronizer, "_get_webdriver", return_value=None)
+def get_scrape_bestlists_result(full_bl: bool):
+    def scrape_bestlists(scrape_configs: list[ScrapeConfig]):
+        for scrape_config in scrape_configs:
+            yield scrape_config, (full_bl, SynchronizationStatistics())
+
+    return scrape_bestlists
+
+
 @patch.object(DisciplineSynchronizer, "_scrape_bestlist", return_value=(True, SynchronizationStatistics()))
+@patch.object(DisciplineSynchronizer, "_scrape_bestlists", side_effect=get_scrape_bestlists_result(True))
 @patch.object(DisciplineSynchronizer, "_scrape_homologated")
 def test__scrape_all_categories(
     scrape_homologated_mock: MagicMock,
+    scrape_bestlists_mock: MagicMock,
     scrape_bestlist_mock: MagicMock,
-    webdriver_mock: MagicMock,
-    exclusive_driver_mock: MagicMock,
 ):
     discipline = get_sample_discipline()
     driver_mock = MagicMock()
-    discipline_scraper = DisciplineSynchronizer({}, set(), discipline)
+    exclusive_driver_mock = MagicMock()
+    driver_pools = DriverPools(
+        default=WebDriverPool(lambda: driver_mock), exclusive=WebDriverPool(lambda: exclusive_driver_mock)
+    )
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022, 2021]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), discipline, driver_pools=driver_pools)
     discipline_scraper.driver = driver_mock
 
-    discipline_scraper._scrape_all_categories(get_sample_config())
+    def check_exclusive_driver(scrape_configs: list[ScrapeConfig]):
+        assert discipline_scraper.driver == exclusive_driver_mock
+        yield from get_scrape_bestlists_result(True)(scrape_configs)
 
-    assert scrape_bestlist_mock.call_count == len(BestlistCategory.get_junior_categories(True)) + 1
-    assert scrape_homologated_mock.call_count == len(BestlistCategory.get_junior_categories(True)) + 1
+    scrape_bestlists_mock.side_effect = check_exclusive_driver
+    discipline_scraper._scrape_all_categories(get_sample_config(), RequestPlanner(discipline).plan_categories(2023))
 
-    exclusive_driver_mock.assert_called_once()
+    junior_categories = BestlistCategory.get_junior_categories(True)
+    scrape_bestlist_mock.assert_called_once()
+    scrape_bestlists_mock.assert_called_once()
+    assert [config.category for config in scrape_bestlists_mock.call_args.args[0]] == junior_categories
+    assert scrape_homologated_mock.call_count == len(junior_categories) + 1
+
+    # the exclusive driver is returned to its pool and the default driver is restored
+    assert discipline_scraper.driver == driver_mock
+    assert driver_pools.exclusive.created == 1
+    assert driver_pools.exclusive.acquire() == exclusive_driver_mock
+    exclusive_driver_mock.quit.assert_not_called()
+
+
+@patch.object(DisciplineSynchronizer, "_get_webdriver")
+@patch.object(DisciplineSynchronizer, "_setup_exclusive_driver")
+def test_create_driver_pools(exclusive_driver_mock: MagicMock, webdriver_mock: MagicMock):
+    driver_pools = DisciplineSynchronizer.create_driver_pools({"scraping": {"driver_max_uses": 3}})
+
+    driver = driver_pools.exclusive.acquire()
     webdriver_mock.assert_called_once()
+    exclusive_driver_mock.assert_called_once_with(driver)
+    assert driver_pools.exclusive.max_uses == 3
+
+    driver_pools.default.acquire()
+    assert webdriver_mock.call_count == 2
+    exclusive_driver_mock.assert_called_once()
 
 
 @patch.object(DisciplineSynchronizer, "_scrape_all_categories", return_value=SynchronizationStatistics())
@@ -155,24 +303,122 @@ def test__scrape_all_categories(
 def test__scrape_all_years(scrape_years_mock: MagicMock, scrape_all_categories_mock: MagicMock):
     discipline = get_sample_discipline()
     driver_mock = MagicMock()
-    discipline_scraper = DisciplineSynchronizer({}, set(), discipline)
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022, 2021]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), discipline)
     discipline_scraper.driver = driver_mock
 
     sample_config = get_sample_config()
 
-    with patch.object(
-        DisciplineSynchronizer, "_scrape_bestlist", return_value=(False, SynchronizationStatistics())
-    ) as scrape_bestlist_mock:
+    with (
+        patch.object(
+            DisciplineSynchronizer, "_scrape_bestlist", return_value=(False, SynchronizationStatistics())
+        ) as scrape_bestlist_mock,
+        patch.object(DisciplineSynchronizer, "_scrape_bestlists") as scrape_bestlists_mock,
+    ):
         discipline_scraper._scrape_all_years(sample_config, start_year=None, end_year=None)
 
         scrape_bestlist_mock.assert_called_once_with(sample_config)
-        scrape_years_mock.assert_not_called()
-
-    with patch.object(
-        DisciplineSynchronizer, "_scrape_bestlist", return_value=(True, SynchronizationStatistics())
-    ) as scrape_bestlist_mock:
+        assert sample_config.year is None
+        assert sample_config.category == BestlistCategory.ALL_MEN
+        assert sample_config.amount == MAX_AMOUNT
+        scrape_bestlists_mock.assert_not_called()
+
+    with (
+        patch.object(
+            DisciplineSynchronizer, "_scrape_bestlist", return_value=(True, SynchronizationStatistics())
+        ) as scrape_bestlist_mock,
+        patch.object(
+            DisciplineSynchronizer, "_scrape_bestlists", side_effect=get_scrape_bestlists_result(True)
+        ) as scrape_bestlists_mock,
+    ):
         discipline_scraper._scrape_all_years(sample_config, start_year=None, end_year=None)
 
-        scrape_years_mock.assert_called_once_with(None, None)
-        assert scrape_bestlist_mock.call_count == 4
+        scrape_years_mock.assert_called_with(None, None)
+        scrape_bestlist_mock.assert_called_once()
+        assert [config.year for config in scrape_bestlists_mock.call_args.args[0]] == [2023, 2022, 2021]
         assert scrape_all_categories_mock.call_count == 3
+
+
+@patch.object(DisciplineSynchronizer, "_scrape_all_categories", return_value=SynchronizationStatistics())
+@patch.object(DisciplineSynchronizer, "_get_scrape_years", return_value=[2023, 2022, 2021])
+def test__scrape_all_years_planned(scrape_years_mock: MagicMock, scrape_all_categories_mock: MagicMock):
+    discipline = get_sample_discipline()
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022, 2021]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), discipline)
+    discipline_scraper.driver = MagicMock()
+
+    # the bestlist of all years and of 2023 are known to be full, the bestlist of 2021 is empty
+    planner = RequestPlanner(discipline, {(2023, 25): 6000, (2022, 25): 20, (2022, 15): 50})
+    with (
+        patch.object(RequestPlanner, "from_config", return_value=planner),
+        patch.object(DisciplineSynchronizer, "_scrape_bestlist") as scrape_bestlist_mock,
+        patch.object(
+            DisciplineSynchronizer, "_scrape_bestlists", side_effect=get_scrape_bestlists_result(False)
+        ) as scrape_bestlists_mock,
+    ):
+        discipline_scraper._scrape_all_years(get_sample_config(), start_year=None, end_year=None)
+
+        scrape_years_mock.assert_called_once_with(None, None)
+        scrape_bestlist_mock.assert_not_called()
+        assert [(config.year, config.amount) for config in scrape_bestlists_mock.call_args.args[0]] == [
+            (2022, 100),
+            (2021, 10),
+        ]
+        scrape_all_categories_mock.assert_called_once()
+        assert scrape_all_categories_mock.call_args.args[0].year == 2023
+        assert scrape_all_categories_mock.call_args.args[1] == planner.plan_categories(2023)
+        assert scrape_all_categories_mock.call_args.args[1][0] == PlannedRequest(2023, BestlistCategory.MEN, MAX_AMOUNT)
+
+
+@patch.object(DisciplineSynchronizer, "_get_scrape_years", return_value=[2023, 2022, 2021])
+def test__scrape_all_years_resume(scrape_years_mock: MagicMock):
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022, 2021]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), get_sample_discipline())
+    discipline_scraper.driver = MagicMock()
+
+    def interrupt_bestlists(*full_bls: bool):
+        def scrape_bestlists(scrape_configs: list[ScrapeConfig]):
+            for scrape_config, full_bl in zip(scrape_configs, full_bls):
+                yield scrape_config, (full_bl, SynchronizationStatistics())
+            raise requests.exceptions.ConnectionError()
+
+        return scrape_bestlists
+
+    # the bestlists arrive from the most recent year, a retry resumes from the most recent year with pending work
+    for full_bls, resume_year in [((False,), 2022), ((False, True), 2022), ((True, False), 2023), ((), 2023)]:
+        sample_config = get_sample_config()
+        with patch.object(DisciplineSynchronizer, "_scrape_bestlists", side_effect=interrupt_bestlists(*full_bls)):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                discipline_scraper._scrape_all_years(sample_config, start_year=2023, end_year=None)
+        scrape_years_mock.assert_called_with(2023, None)
+        assert sample_config.year == resume_year
+
+
+def test__scrape_bestlists_journal():
+    with patch.object(Scraper, "extract_available_years", return_value=[2023, 2022]):
+        discipline_scraper = DisciplineSynchronizer({}, set(), get_sample_discipline())
+    discipline_scraper.driver = MagicMock(spec=JsfSession)
+    completed_config = get_sample_config()
+    pending_config = dataclasses.replace(completed_config, year=2022)
+
+    journal = MagicMock()
+    journal.get_completed.side_effect = lambda scrape_config: True if scrape_config.year == 2023 else None
+    discipline_scraper.journal = journal
+
+    bestlist = pd.DataFrame({"Resultat": ["10.00"]})
+    with (
+        patch.object(BestlistFetcher, "iter_completed", return_value=iter([(pending_config, bestlist)])) as fetch_mock,
+        patch.object(
+            DisciplineSynchronizer, "_apply_bestlist", return_value=(False, SynchronizationStatistics(added_records=1))
+        ),
+    ):
+        results = list(discipline_scraper._scrape_bestlists([completed_config, pending_config]))
+
+        # only the pending unit is fetched and recorded
+        fetch_mock.assert_called_once_with([pending_config])
+        journal.record.assert_called_once_with(pending_config, False, SynchronizationStatistics(added_records=1))
+
+    assert results == [
+        (completed_config, (True, SynchronizationStatistics())),
+        (pending_config, (False, SynchronizationStatistics(added_records=1))),
+    ]
@@ -0,0 +1,108 @@
+import os
+import pathlib
+from datetime import date
+
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Athlete
+from track_insights.synchronization import CachedEntity, EntityCache
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_entity_cache.database"
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        },
+        "synchronization": {"entity_cache_size": 2},
+    }
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def get_sample_entity(entity_id: int) -> CachedEntity:
+    return CachedEntity(entity_id, date(2023, 1, 11), ("Max Mustermann",))
+
+
+def test_from_config():
+    assert EntityCache.from_config({"database": get_minimal_config()["database"]}) is None
+
+    cache = EntityCache.from_config(get_minimal_config())
+    assert cache is not None and cache.max_entries == 2
+    assert EntityCache.from_config(get_minimal_config()) is cache
+
+    other_config = get_minimal_config()
+    other_config["database"]["database"] = "other.database"
+    assert EntityCache.from_config(other_config) is not cache
+
+
+def test_commit():
+    cache = EntityCache(max_entries=10)
+    with DatabaseConnection(get_minimal_config()) as database:
+        cache.stage(database.session, "athletes", "Athlete_1", get_sample_entity(1))
+        assert cache.get("athletes", "Athlete_1") is None
+
+        database.session.commit()
+        assert cache.get("athletes", "Athlete_1") == get_sample_entity(1)
+        assert cache.get("clubs", "Athlete_1") is None
+
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert str(cache) == "1 hits, 2 misses (33.3% hit rate), 1 entries"
+
+
+def test_rollback():
+    cache = EntityCache(max_entries=10)
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.session.add(
+            Athlete(
+                athlete_code="Athlete_1",
+                name="Max Mustermann",
+                birthdate=date(2000, 2, 15),
+                nationality="SUI",
+                latest_date=date(2023, 1, 11),
+            )
+        )
+        database.session.flush()
+        cache.stage(database.session, "athletes", "Athlete_1", get_sample_entity(1))
+        database.session.rollback()
+
+        # the staged entity is discarded, a later commit does not publish it
+        database.session.commit()
+        assert len(cache) == 0
+
+        cache.stage(database.session, "athletes", "Athlete_2", get_sample_entity(2))
+        database.session.commit()
+        assert len(cache) == 1
+
+
+def test_eviction():
+    cache = EntityCache(max_entries=2)
+    with DatabaseConnection(get_minimal_config()) as database:
+        cache.stage(database.session, "athletes", "Athlete_1", get_sample_entity(1))
+        cache.stage(database.session, "athletes", "Athlete_2", get_sample_entity(2))
+        database.session.commit()
+
+        # the lookup marks the first athlete as recently used, hence the second one is evicted
+        assert cache.get("athletes", "Athlete_1") is not None
+        cache.stage(database.session, "athletes", "Athlete_3", get_sample_entity(3))
+        database.session.commit()
+
+    assert len(cache) == 2
+    assert cache.get("athletes", "Athlete_2") is None
+    assert cache.get("athletes", "Athlete_1") is not None
+    assert cache.get("athletes", "Athlete_3") is not None
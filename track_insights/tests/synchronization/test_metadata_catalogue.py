@@ -0,0 +1,115 @@
+import os
+import pathlib
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Discipline, DisciplineConfiguration, MetadataEntry
+from track_insights.scraping import Scraper
+from track_insights.synchronization import MetadataCatalogue, MetadataSynchronizer
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_metadata_catalogue.database"
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        },
+        "synchronization": {"metadata_ttl": 12},
+    }
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def test_from_config():
+    catalogue = MetadataCatalogue.from_config(get_minimal_config())
+    assert catalogue.ttl == timedelta(hours=12)
+    assert not catalogue.refresh
+
+    catalogue = MetadataCatalogue.from_config({}, refresh=True)
+    assert catalogue.ttl == timedelta(hours=24)
+    assert catalogue.refresh
+
+
+@patch.object(Scraper, "extract_available_years", return_value=[2023, 2022])
+def test_get_available_years(extract_years_mock: MagicMock):
+    catalogue = MetadataCatalogue(get_minimal_config())
+    assert catalogue.get_available_years() == [2023, 2022]
+    assert catalogue.get_available_years() == [2023, 2022]
+    extract_years_mock.assert_called_once()
+
+    # a new run uses the persisted entry
+    assert MetadataCatalogue(get_minimal_config()).get_available_years() == [2023, 2022]
+    extract_years_mock.assert_called_once()
+
+    # unless it is refreshed
+    assert MetadataCatalogue(get_minimal_config(), refresh=True).get_available_years() == [2023, 2022]
+    assert extract_years_mock.call_count == 2
+
+
+@patch.object(Scraper, "extract_available_years")
+def test_expired_entry(extract_years_mock: MagicMock):
+    extract_years_mock.return_value = [2023]
+    MetadataCatalogue(get_minimal_config()).get_available_years()
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        entry: MetadataEntry = database.session.query(MetadataEntry).first()
+        entry.fetch_date = datetime.now() - timedelta(hours=25)
+        database.session.commit()
+
+    extract_years_mock.return_value = [2024, 2023]
+    assert MetadataCatalogue(get_minimal_config()).get_available_years() == [2024, 2023]
+    assert MetadataCatalogue(get_minimal_config(), timedelta(hours=1)).get_available_years() == [2024, 2023]
+    assert extract_years_mock.call_count == 2
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        assert database.session.query(MetadataEntry).count() == 1
+
+
+@patch.object(Scraper, "extract_disciplines")
+def test_get_disciplines(extract_disciplines_mock: MagicMock):
+    extract_disciplines_mock.side_effect = lambda male, indoor, year: [(f"{male}-{indoor}-{year}", "code")]
+
+    catalogue = MetadataCatalogue(get_minimal_config())
+    assert catalogue.get_disciplines(True, False) == [("True-False-None", "code")]
+    assert catalogue.get_disciplines(True, False, 2023) == [("True-False-2023", "code")]
+    assert catalogue.get_disciplines(False, True, 2023) == [("False-True-2023", "code")]
+    assert catalogue.get_disciplines(True, False) == [("True-False-None", "code")]
+    assert extract_disciplines_mock.call_count == 3
+
+    assert MetadataCatalogue(get_minimal_config()).get_disciplines(False, True, 2023) == [("False-True-2023", "code")]
+    assert extract_disciplines_mock.call_count == 3
+
+
+@patch.object(Scraper, "extract_available_years", return_value=[2023])
+@patch.object(Scraper, "extract_disciplines", return_value=[("Weit", "Discipline_1")])
+def test_metadata_synchronizer(extract_disciplines_mock: MagicMock, extract_years_mock: MagicMock):
+    metadata_synchronizer = MetadataSynchronizer(get_minimal_config(), MetadataCatalogue(get_minimal_config()))
+    metadata_synchronizer.check_disciplines(2023)
+
+    assert len(metadata_synchronizer.get_all_disciplines(year=2023)) == 4
+    assert len(metadata_synchronizer.get_all_disciplines(year=2023, indoor=True, male=False)) == 1
+
+    # every (male, indoor) combination is requested once
+    assert extract_disciplines_mock.call_count == 4
+    extract_years_mock.assert_called_once()
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        assert database.session.query(DisciplineConfiguration).count() == 1
+        assert database.session.query(Discipline).count() == 4
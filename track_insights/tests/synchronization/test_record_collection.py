@@ -0,0 +1,191 @@
+import pathlib
+import tempfile
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from track_insights.scraping import BestlistColumn
+from track_insights.synchronization import Record, RecordCollection
+
+
+def get_sample_records() -> list[Record]:
+    record = Record(
+        performance=833,
+        wind=-2.0,
+        rank="1f1",
+        not_homologated=False,
+        athlete="Max Mustermann",
+        club="LV Muster",
+        nationality="SUI",
+        birthdate=date.fromisoformat("2000-02-15"),
+        event="Test Event",
+        location="Thun",
+        event_date=date.fromisoformat("2023-01-11"),
+        athlete_code="Athlete_1",
+        club_code="Club_1",
+        event_code="Event_1",
+    )
+    return [
+        record,
+        replace(record, performance=820, wind=None, athlete="Anna Muster", athlete_code="Athlete_2", id=2),
+        replace(record, performance=820, athlete="Anna Muster", event_date=date.fromisoformat("2023-01-01"), id=3),
+        replace(record, performance=833, athlete="Hans Muster", rank="2f1", manual=True, id=4),
+        replace(record, performance=800, club="", club_code="", id=5),
+    ]
+
+
+def get_columns(records: list[Record]) -> dict[str, list]:
+    return {name: [getattr(record, name) for record in records] for name in Record.__dataclass_fields__}
+
+
+def test_from_columns():
+    records = get_sample_records()
+    collection = RecordCollection.from_columns(get_columns(records))
+    assert len(collection) == len(records)
+    assert collection.performances.tolist() == [833, 820, 820, 833, 800]
+    assert collection.get_values("wind") == [-2.0, None, -2.0, -2.0, -2.0]
+    assert collection.get_values("id") == [None, 2, 3, 4, 5]
+    assert collection.records == records
+    assert [record.id for record in collection.records] == [None, 2, 3, 4, 5]
+    assert [record.manual for record in collection.records] == [False, False, False, True, False]
+
+    # the identifiers and the manual flags may be omitted
+    columns = get_columns(records)
+    del columns["id"]
+    del columns["manual"]
+    assert RecordCollection.from_columns(columns).get_values("id") == [None] * len(records)
+
+    empty_collection = RecordCollection.from_columns(get_columns([]))
+    assert len(empty_collection) == 0
+    assert empty_collection.records == []
+
+
+def test_sort_records():
+    for ascending in [True, False]:
+        records = get_sample_records()
+        sign = 1 if ascending else -1
+        expected_records = sorted(
+            records,
+            key=lambda record, sign=sign: (
+                sign * record.performance,
+                record.event_date,
+                record.athlete,
+                record.event,
+                record.rank,
+            ),
+        )
+
+        collection = RecordCollection.from_columns(get_columns(records))
+        collection.sort_records(ascending)
+        assert collection.records == expected_records
+        assert [record.id for record in collection.records] == [record.id for record in expected_records]
+
+        collection = RecordCollection(records)
+        collection.sort_records(ascending)
+        assert [record.id for record in collection.records] == [record.id for record in expected_records]
+        assert collection.sanity_check_results(ascending)
+        assert not collection.sanity_check_results(not ascending)
+
+
+def test_sanity_check_results():
+    collection = RecordCollection.from_columns(get_columns(get_sample_records()))
+    assert not collection.sanity_check_results(True)
+    assert not collection.sanity_check_results(False)
+    assert collection.take([4, 1, 2]).sanity_check_results(True)
+    assert collection.take([0, 3, 2, 4]).sanity_check_results(False)
+    assert RecordCollection(records=[]).sanity_check_results(True)
+
+
+def test_fingerprints():
+    records = get_sample_records()
+    for collection in [RecordCollection.from_columns(get_columns(records)), RecordCollection(records)]:
+        fingerprints = collection.get_fingerprints()
+        assert fingerprints.dtype == np.int64
+        assert fingerprints.tolist() == [record.get_fingerprint() for record in records]
+        assert collection.get_similarity_fingerprints().tolist() == [
+            record.get_similarity_fingerprint() for record in records
+        ]
+
+
+def test_take_and_concatenate():
+    records = get_sample_records()
+    collection = RecordCollection.from_columns(get_columns(records))
+    selection = collection.take([3, 1])
+    assert selection.records == [records[3], records[1]]
+    assert len(collection.take([])) == 0
+
+    concatenation = RecordCollection.concatenate([selection, RecordCollection(records[4:])])
+    assert concatenation.records == [records[3], records[1], records[4]]
+    assert concatenation.get_values("id") == [4, 2, 5]
+
+
+def test_modified_records():
+    collection = RecordCollection.from_columns(get_columns(get_sample_records()))
+
+    # records that are modified in place are taken into account
+    collection[4].performance = 900
+    assert collection.performances.tolist() == [833, 820, 820, 833, 900]
+    assert collection.get_fingerprints()[4] == collection[4].get_fingerprint()
+    collection.sort_records(False)
+    assert collection[0].performance == 900
+
+    del collection[0]
+    assert len(collection) == 4
+    assert collection.sanity_check_results(False)
+
+
+def get_sample_dataframe() -> pd.DataFrame:
+    row = {
+        BestlistColumn.ATHLETE: "Max Mustermann",
+        BestlistColumn.CLUB: "LV Muster",
+        BestlistColumn.EVENT: "Test Event",
+        BestlistColumn.RESULT: "8.33",
+        BestlistColumn.WIND: "-2.0",
+        BestlistColumn.RANK: "1f1",
+        BestlistColumn.NOT_HOMOLOGATED: "",
+        BestlistColumn.NATIONALITY: "SUI",
+        BestlistColumn.BIRTHDATE: "15.02.2000",
+        BestlistColumn.LOCATION: "Thun",
+        BestlistColumn.DATE: "11.01.2023",
+        BestlistColumn.ATHLETE_CODE: "Athlete_1",
+        BestlistColumn.CLUB_CODE: "Club_1",
+        BestlistColumn.EVENT_CODE: "Event_1",
+    }
+    return pd.DataFrame(
+        [
+            row,
+            {**row, BestlistColumn.RESULT: "8.20_SB", BestlistColumn.WIND: "", BestlistColumn.NOT_HOMOLOGATED: "X"},
+            {**row, BestlistColumn.RESULT: "8,20"},
+            {**row, BestlistColumn.WIND: "x"},
+            {**row, BestlistColumn.DATE: "31.02.2023"},
+            {**row, BestlistColumn.NATIONALITY: "SUIX"},
+            {**row, BestlistColumn.ATHLETE: "Anna Muster", BestlistColumn.BIRTHDATE: "1.2.2001"},
+        ]
+    )
+
+
+def test_from_dataframe():
+    df = get_sample_dataframe()
+    columns = set(df.columns.tolist())
+    ignored_entries = {df.iloc[5].to_json()}
+
+    with tempfile.TemporaryDirectory() as directory:
+        anomaly_file = pathlib.Path(directory) / "anomalies.json"
+        collection = RecordCollection.from_dataframe(df, anomaly_file, ignored_entries)
+
+        # the invalid rows that are not ignored are exported as rows of the anomaly file
+        with open(anomaly_file, "r", encoding="utf-8") as file:
+            assert file.read().splitlines() == [df.iloc[index].to_json() for index in [2, 3, 4]]
+
+    expected_records = [Record.from_dataframe_row(df.iloc[index], columns) for index in [0, 1, 6]]
+    assert collection.records == expected_records
+    assert [record.wind for record in collection.records] == [-2.0, None, -2.0]
+    assert [record.not_homologated for record in collection.records] == [False, True, False]
+
+    # the wind and the homologation may be missing
+    df = df.drop(columns=[BestlistColumn.WIND, BestlistColumn.NOT_HOMOLOGATED])
+    with tempfile.TemporaryDirectory() as directory:
+        collection = RecordCollection.from_dataframe(df, pathlib.Path(directory) / "anomalies.json", set())
+    assert [record.wind for record in collection.records] == [None] * 4
+    assert not any(record.not_homologated for record in collection.records)
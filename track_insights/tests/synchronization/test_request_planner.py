@@ -0,0 +1,148 @@
+import os
+import pathlib
+from datetime import date
+
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Athlete, Club, Discipline, DisciplineConfiguration, Event, Result
+from track_insights.scraping import BestlistCategory
+from track_insights.synchronization import PlannedRequest, RequestPlan, RequestPlanner
+from track_insights.synchronization.request_planner import MAX_AMOUNT
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_request_planner.database"
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        },
+        "scraping": {"plan_requests": True},
+    }
+
+
+def get_sample_discipline() -> Discipline:
+    return Discipline(id=1, discipline_code="Discipline_1", indoor=False, male=False)
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+        discipline_config = DisciplineConfiguration(name="100 m", ascending=True)
+        discipline = Discipline(discipline_code="Discipline_1", config=discipline_config, indoor=False, male=False)
+        club = Club(name="Club", club_code="CLUB", latest_date=date(2023, 1, 1))
+        event = Event(name="Event", event_code="EVENT", latest_date=date(2023, 1, 1))
+        adult = Athlete(
+            name="Adult",
+            birthdate=date(1990, 1, 1),
+            nationality="SUI",
+            athlete_code="ADULT",
+            latest_date=date(2023, 1, 1),
+        )
+        junior = Athlete(
+            name="Junior",
+            birthdate=date(2008, 1, 1),
+            nationality="SUI",
+            athlete_code="JUNIOR",
+            latest_date=date(2023, 1, 1),
+        )
+        for athlete, result_date in [(adult, date(2023, 5, 1)), (adult, date(2022, 5, 1)), (junior, date(2023, 6, 1))]:
+            database.session.add(
+                Result(
+                    athlete=athlete,
+                    club=club,
+                    event=event,
+                    discipline=discipline,
+                    performance=1200,
+                    rank="1",
+                    location="Bern",
+                    date=result_date,
+                )
+            )
+        database.session.commit()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def test_get_amount():
+    assert RequestPlanner.get_amount(0) == 10
+    assert RequestPlanner.get_amount(7) == 10
+    assert RequestPlanner.get_amount(8) == 30
+    assert RequestPlanner.get_amount(80) == 500
+    assert RequestPlanner.get_amount(390) == 500
+    assert RequestPlanner.get_amount(400) == MAX_AMOUNT
+    assert RequestPlanner.get_amount(4500) == MAX_AMOUNT
+
+
+def test_from_config():
+    planner = RequestPlanner.from_config(get_minimal_config(), get_sample_discipline())
+    assert planner.row_counts == {(2023, 33): 1, (2022, 32): 1, (2023, 15): 1}
+
+    assert RequestPlanner.from_config({}, get_sample_discipline()).row_counts == {}
+
+
+def test_get_expected_rows():
+    planner = RequestPlanner(get_sample_discipline(), {(2023, 33): 40, (2022, 32): 10, (2023, 15): 5})
+    assert planner.get_expected_rows(None, BestlistCategory.ALL_WOMEN) == 55
+    assert planner.get_expected_rows(2023, BestlistCategory.ALL_WOMEN) == 45
+    assert planner.get_expected_rows(2023, BestlistCategory.WOMEN) == 40
+    assert planner.get_expected_rows(2023, BestlistCategory.U_16_W) == 5
+    assert planner.get_expected_rows(2021, BestlistCategory.U_18_W) == 0
+
+    assert RequestPlanner(get_sample_discipline()).get_expected_rows(2023, BestlistCategory.WOMEN) is None
+
+
+def test_plan_without_history():
+    plan = RequestPlanner(get_sample_discipline()).plan([2023, 2022], include_all_years=True)
+
+    assert plan == RequestPlan(
+        all_years=PlannedRequest(None, BestlistCategory.ALL_WOMEN, MAX_AMOUNT),
+        years=[
+            PlannedRequest(2023, BestlistCategory.ALL_WOMEN, MAX_AMOUNT),
+            PlannedRequest(2022, BestlistCategory.ALL_WOMEN, MAX_AMOUNT),
+        ],
+    )
+    assert len(plan) == 3
+
+    plan = RequestPlanner(get_sample_discipline()).plan([2023], include_all_years=False)
+    assert plan.all_years is None
+    assert len(plan) == 1
+
+
+def test_plan():
+    planner = RequestPlanner(get_sample_discipline(), {(2023, 30): 4000, (2023, 17): 1500, (2022, 30): 300})
+    plan = planner.plan([2023, 2022, 2021], include_all_years=True)
+
+    # the bestlists of all years and of 2023 are known to be full and are not requested
+    assert plan.all_years is None
+    assert plan.years == [
+        PlannedRequest(2022, BestlistCategory.ALL_WOMEN, 500),
+        PlannedRequest(2021, BestlistCategory.ALL_WOMEN, 10),
+    ]
+    assert list(plan.categories) == [2023]
+    assert plan.categories[2023] == [
+        PlannedRequest(2023, BestlistCategory.WOMEN, MAX_AMOUNT),
+        PlannedRequest(2023, BestlistCategory.U_10_W, 10),
+        PlannedRequest(2023, BestlistCategory.U_12_W, 10),
+        PlannedRequest(2023, BestlistCategory.U_14_W, 10),
+        PlannedRequest(2023, BestlistCategory.U_16_W, 10),
+        PlannedRequest(2023, BestlistCategory.U_18_W, MAX_AMOUNT),
+        PlannedRequest(2023, BestlistCategory.U_20_W, 10),
+    ]
+    assert len(plan) == 9
+
+    planner = RequestPlanner(get_sample_discipline(), {(2023, 30): 700, (2022, 30): 300})
+    plan = planner.plan([2023, 2022], include_all_years=True)
+    assert plan.all_years == PlannedRequest(None, BestlistCategory.ALL_WOMEN, MAX_AMOUNT)
+    assert [request.amount for request in plan.years] == [MAX_AMOUNT, 500]
+    assert len(plan.categories) == 0
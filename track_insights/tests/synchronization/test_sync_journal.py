@@ -0,0 +1,95 @@
+import os
+import pathlib
+from dataclasses import replace
+
+from track_insights.database import DatabaseConnection, EngineRegistry
+from track_insights.database.models import Discipline, DisciplineConfiguration, SyncRun
+from track_insights.scraping import BestlistCategory, ScrapeConfig
+from track_insights.synchronization import SynchronizationStatistics, SyncJournal
+
+DATABASE = pathlib.Path(os.path.abspath(__file__)).parent / "test_sync_journal.database"
+
+
+def get_minimal_config() -> dict:
+    return {
+        "database": {
+            "drivername": "sqlite",
+            "username": "",
+            "password": "",
+            "host": "",
+            "port": 0,
+            "database": f"{DATABASE}",
+        }
+    }
+
+
+def get_scrape_config() -> ScrapeConfig:
+    return ScrapeConfig(
+        year=None,
+        category=BestlistCategory.ALL_MEN,
+        discipline=Discipline(id=1, discipline_code="Discipline_1", indoor=False, male=True),
+    )
+
+
+def setup_function():
+    DATABASE.unlink(True)
+
+    with DatabaseConnection(get_minimal_config()) as database:
+        database.create_tables()
+
+        discipline_config = DisciplineConfiguration(name="Weit", ascending=False)
+        discipline = Discipline(discipline_code="Discipline_1", config=discipline_config, indoor=False, male=True)
+        database.session.add(discipline)
+        database.session.commit()
+
+
+def teardown_function():
+    EngineRegistry.dispose()
+    DATABASE.unlink()
+
+
+def test_record():
+    journal = SyncJournal.start(get_minimal_config(), {"year": None})
+    scrape_config = get_scrape_config()
+
+    assert journal.get_completed(scrape_config) is None
+    journal.record(scrape_config, True, SynchronizationStatistics(added_records=5))
+    journal.record(replace(scrape_config, year=2023), False, SynchronizationStatistics())
+
+    assert journal.get_completed(scrape_config)
+    assert journal.get_completed(replace(scrape_config, year=2023)) is False
+    assert journal.get_completed(replace(scrape_config, only_homologated=True)) is None
+
+    # recording a unit twice has no effect
+    journal.record(scrape_config, True, SynchronizationStatistics(added_records=5))
+    with DatabaseConnection(get_minimal_config()) as database:
+        run = database.session.get(SyncRun, journal.run_id)
+        assert len(run.units) == 2
+        assert run.end_date is None
+
+
+def test_resume():
+    config = get_minimal_config()
+    scrape_config = get_scrape_config()
+
+    journal = SyncJournal.start(config, {"year": None})
+    journal.record(scrape_config, True, SynchronizationStatistics(added_records=5))
+
+    # a new run does not know the units of previous runs
+    assert SyncJournal.start(config, {"year": None}).get_completed(scrape_config) is None
+
+    # the latest incomplete run with the same arguments is resumed
+    resumed_journal = SyncJournal.start(config, {"year": None}, resume=True)
+    assert resumed_journal.run_id != journal.run_id
+    assert resumed_journal.get_completed(scrape_config) is None
+
+    resumed_journal.finish()
+    resumed_journal = SyncJournal.start(config, {"year": None}, resume=True)
+    assert resumed_journal.run_id == journal.run_id
+    assert resumed_journal.get_completed(scrape_config)
+
+    # runs with different arguments are not resumed
+    assert SyncJournal.start(config, {"year": 2023}, resume=True).get_completed(scrape_config) is None
+
+    resumed_journal.finish()
+    assert SyncJournal.start(config, {"year": None}, resume=True).run_id != journal.run_id
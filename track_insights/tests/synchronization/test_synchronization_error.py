@@ -0,0 +1,15 @@
+import pickle
+
+from track_insights.synchronization import SynchronizationError
+from track_insights.synchronization.synchronization_error import SynchronizationErrorType
+
+
+def test_pickle():
+    error = SynchronizationError("Connection lost.", SynchronizationErrorType.CONNECTION_LOST)
+
+    # errors of worker processes are pickled
+    unpickled_error = pickle.loads(pickle.dumps(error))
+    assert isinstance(unpickled_error, SynchronizationError)
+    assert unpickled_error.message == "Connection lost."
+    assert unpickled_error.error_type == SynchronizationErrorType.CONNECTION_LOST
+    assert str(unpickled_error) == str(error)